@@ -4,7 +4,9 @@ Main Streamlit application for PowerPoint Content Summarization.
 This is the entry point for the application.
 """
 
+import re
 import sys
+from functools import partial
 from pathlib import Path
 
 import streamlit as st
@@ -17,9 +19,20 @@ from modules.logger import LoggerManager, get_logger
 from modules.config_manager import get_config
 from modules.file_parser import FileParser
 from modules.content_extractor import ContentExtractor
+from modules.extraction_cache import ExtractionCache
 from modules.llm_service import LLMService
+from modules.health_monitor import LLMHealthMonitor
+from modules.rule_summarizer import RuleSummarizer
+from modules.summary_jobs import JOB_DONE, SummaryJobQueue
+from modules.table_serializers import MARKDOWN
 from modules.ui_renderer import UIRenderer
 
+# Per-table session state keys: summary_<slide>_<table>, generate_<slide>_<table>,
+# prompt_note_<slide>_<table> (how the table was trimmed for the prompt) and
+# job_<slide>_<table> (id of the background job generating the summary)
+_TABLE_STATE_KEY = re.compile(r"^(summary|generate|prompt_note|job)_(\d+)_(\d+)$")
+_JOB_KEY = re.compile(r"^job_(\d+)_(\d+)$")
+
 
 # Initialize components
 @st.cache_resource
@@ -49,14 +62,26 @@ def initialize_app():
         # Initialize services
         parser = FileParser()
         extractor = ContentExtractor()
-        llm_service = LLMService()
+        extraction_cache = ExtractionCache()
         ui_renderer = UIRenderer()
+        rule_summarizer = RuleSummarizer()
+
+        # Summary requests run on a bounded worker pool shared by all sessions
+        summary_jobs = SummaryJobQueue()
+
+        # The LLM is optional at startup: decks can still be extracted and
+        # browsed while the API is misconfigured or down
+        llm_error = None
+        try:
+            llm_service = LLMService()
+        except Exception as e:
+            logger.error(f"LLM service unavailable: {str(e)}")
+            llm_service = None
+            llm_error = str(e)
 
-        # Test LLM connection
-        if not llm_service.test_connection():
-            logger.error("Failed to connect to Groq API")
-            st.error("⚠️ Failed to connect to Groq API. Please check your API key.")
-            return None
+        # Check the API in the background instead of blocking the first render
+        health_monitor = LLMHealthMonitor(llm_service, init_error=llm_error)
+        health_monitor.start()
 
         logger.info("All components initialized successfully")
 
@@ -64,7 +89,11 @@ def initialize_app():
             'config': config,
             'parser': parser,
             'extractor': extractor,
+            'extraction_cache': extraction_cache,
             'llm': llm_service,
+            'health': health_monitor,
+            'jobs': summary_jobs,
+            'rules': rule_summarizer,
             'ui': ui_renderer,
             'logger': logger
         }
@@ -101,79 +130,484 @@ def initialize_session_state():
     if 'active_summary_table' not in st.session_state:
         st.session_state.active_summary_table = None
 
+    if 'changed_slides' not in st.session_state:
+        st.session_state.changed_slides = None
+
+
+def get_upload_key(uploaded_file, components) -> str:
+    """
+    Get the extraction cache key of an upload, hashing it once per upload.
+
+    Args:
+        uploaded_file: Streamlit uploaded file object
+        components: Dictionary of initialized components
 
-def process_uploaded_file(uploaded_file, components):
+    Returns:
+        Content hash of the file bytes and extractor settings
+    """
+    file_id = getattr(uploaded_file, 'file_id', None) or uploaded_file.name
+    cached = st.session_state.get('upload_key')
+
+    if cached and cached[0] == file_id:
+        return cached[1]
+
+    upload_key = ExtractionCache.make_key(uploaded_file, components['extractor'].cache_settings())
+    st.session_state.upload_key = (file_id, upload_key)
+    return upload_key
+
+
+def carry_over_summaries(previous_slides, slides_data):
+    """
+    Keep the summaries of slides that did not change between two versions of a deck.
+
+    Slides are matched by fingerprint, so summaries follow slides that moved.
+    Summaries of edited or removed slides, pending generate flags and
+    summary jobs are dropped.
+
+    Args:
+        previous_slides: SlideContent objects of the previously loaded deck, or None
+        slides_data: SlideContent objects of the new upload
+
+    Returns:
+        Set of slide numbers that changed since the previous version, or
+        None if the upload shares no slides with the previous deck
+    """
+    previous_numbers = {}
+    for slide in previous_slides or []:
+        if slide.fingerprint:
+            previous_numbers.setdefault(slide.fingerprint, slide.slide_number)
+
+    summaries = {}
+    for key in [key for key in st.session_state.keys() if _TABLE_STATE_KEY.match(str(key))]:
+        value = st.session_state.pop(key)
+        if not key.startswith(('generate_', 'job_')):
+            summaries[key] = value
+
+    changed = set()
+    for slide in slides_data:
+        old_number = previous_numbers.get(slide.fingerprint) if slide.fingerprint else None
+        if old_number is None:
+            changed.add(slide.slide_number)
+            continue
+        for table_idx in range(1, len(slide.tables) + 1):
+            for prefix in ('summary', 'prompt_note'):
+                value = summaries.get(f'{prefix}_{old_number}_{table_idx}')
+                if value is not None:
+                    st.session_state[f'{prefix}_{slide.slide_number}_{table_idx}'] = value
+
+    if len(changed) == len(slides_data):
+        return None
+    return changed
+
+
+def load_slides(slides_data, previous_slides, components):
+    """
+    Make extracted slides the current deck in session state.
+
+    Args:
+        slides_data: SlideContent objects of the new upload
+        previous_slides: SlideContent objects of the previously loaded deck, or None
+        components: Dictionary of initialized components
+    """
+    changed = carry_over_summaries(previous_slides, slides_data)
+    if changed is not None:
+        components['logger'].info(
+            f"New deck version: {len(changed)} of {len(slides_data)} slides changed"
+        )
+
+    st.session_state.slides_data = slides_data
+    st.session_state.changed_slides = changed
+    st.session_state.presentation_loaded = True
+    st.session_state.current_slide = 0
+
+
+def process_uploaded_file(uploaded_file, upload_key, components):
     """
     Process uploaded PowerPoint file.
 
+    Decks already extracted by any session are served from the extraction
+    cache. Otherwise slides are extracted one at a time; the first slide and
+    the statistics panel are shown while the remaining slides keep streaming in.
+
+    When the upload is a new version of the deck already loaded, slides whose
+    fingerprint is unchanged are reused instead of re-extracted, and their
+    summaries are kept.
+
     Args:
         uploaded_file: Streamlit uploaded file object
+        upload_key: Extraction cache key of the upload
         components: Dictionary of initialized components
     """
     parser = components['parser']
     extractor = components['extractor']
+    extraction_cache = components['extraction_cache']
+    ui_renderer = components['ui']
+    config = components['config']
     logger = components['logger']
 
+    refresh_every = max(1, config.get('ui.stream_refresh_slides', 5))
+    slides_data = []
+    previous_slides = st.session_state.slides_data if st.session_state.presentation_loaded else None
+
     try:
         logger.info(f"Processing uploaded file: {uploaded_file.name}")
 
+        cached_slides = extraction_cache.get(upload_key)
+        if cached_slides is not None:
+            load_slides(cached_slides, previous_slides, components)
+
+            logger.info(f"Loaded {len(cached_slides)} slides from extraction cache")
+            st.success(f"✅ Loaded presentation with {len(cached_slides)} slides from cache!")
+            return
+
         with st.spinner("🔍 Parsing presentation..."):
             # Parse presentation
             presentation = parser.parse_uploaded_presentation(uploaded_file)
+            total_slides = parser.get_slide_count(presentation)
+            fingerprints = parser.slide_fingerprints(presentation, uploaded_file)
+
+        progress_bar = st.progress(0.0, text="📄 Extracting slides...")
+        stats_placeholder = st.empty()
+        preview_placeholder = st.empty()
+
+        # Extract content slide by slide, rendering progressively
+        for slide_content in extractor.extract_iter(presentation, fingerprints, previous_slides):
+            slides_data.append(slide_content)
+            extracted = len(slides_data)
+
+            progress_bar.progress(
+                min(extracted / max(total_slides, 1), 1.0),
+                text=f"📄 Extracted slide {extracted} of {total_slides}"
+            )
 
-            # Extract content from all slides
-            slides_data = extractor.extract_all_slides(presentation)
+            if extracted == 1:
+                with preview_placeholder.container():
+                    ui_renderer.render_slide_content(slide_content, interactive=False)
 
-            # Store in session state
-            st.session_state.slides_data = slides_data
-            st.session_state.presentation_loaded = True
-            st.session_state.current_slide = 0
+            if extracted == 1 or extracted % refresh_every == 0:
+                with stats_placeholder.container():
+                    ui_renderer.render_statistics(slides_data)
 
-            logger.info(f"Successfully processed {len(slides_data)} slides")
+        progress_bar.empty()
+        stats_placeholder.empty()
+        preview_placeholder.empty()
+
+        extraction_cache.put(upload_key, slides_data)
+
+        # Store in session state
+        load_slides(slides_data, previous_slides, components)
+
+        logger.info(f"Successfully processed {len(slides_data)} slides")
 
         st.success(f"✅ Successfully loaded presentation with {len(slides_data)} slides!")
 
     except Exception as e:
         logger.error(f"Error processing file: {str(e)}", exc_info=True)
         st.error(f"❌ Error processing file: {str(e)}")
-        st.session_state.presentation_loaded = False
+
+        # Keep whatever was extracted before the failure
+        load_slides(slides_data, previous_slides, components)
+        st.session_state.presentation_loaded = bool(slides_data)
+
+
+def apply_rule_summary(slide_number, table_index, df, components):
+    """
+    Store a rule-based summary for a table in place of an AI summary.
+
+    Args:
+        slide_number: Slide number
+        table_index: Table index on the slide
+        df: Typed table DataFrame
+        components: Dictionary of initialized components
+
+    Returns:
+        True if a rule-based summary was stored
+    """
+    summary = components['rules'].summarize(df)
+    if not summary:
+        return False
+
+    st.session_state[f'summary_{slide_number}_{table_index}'] = summary
+    st.session_state[f'generate_{slide_number}_{table_index}'] = False
+    components['logger'].info(f"Rule-based summary stored for slide {slide_number}, table {table_index}")
+    return True
+
+
+def render_rule_preview(table_index, df, components):
+    """
+    Show the rule-based summary while the AI summary is generated ("preview" policy).
+
+    Args:
+        table_index: Table index on the slide
+        df: Typed table DataFrame
+        components: Dictionary of initialized components
+    """
+    if not components['rules'].previews:
+        return
+
+    preview = components['rules'].summarize(df)
+    if preview:
+        components['ui'].render_rule_preview(table_index, preview)
+
+
+def store_prompt_note(slide_number, table_index, note):
+    """
+    Remember how a table was trimmed for its prompt, so the UI can report it.
+
+    Args:
+        slide_number: Slide number
+        table_index: Table index on the slide
+        note: TableFit.note of the prompt the summary was generated from
+    """
+    note_key = f'prompt_note_{slide_number}_{table_index}'
+    if note:
+        st.session_state[note_key] = note
+    else:
+        st.session_state.pop(note_key, None)
 
 
-def generate_table_summary(slide_number, table_index, table_text, components):
+def stream_chunked_summary(llm_service, chunks):
     """
-    Generate AI summary for a table.
+    Summarize the row groups of a large table, then stream the combined summary.
+
+    Args:
+        llm_service: LLMService instance
+        chunks: Row-group chunks of the table (TableFit.chunks)
+
+    Yields:
+        Text deltas of the combined summary
+    """
+    table_data = llm_service.map_chunks(chunks)
+    yield from llm_service.generate_summary_stream(table_data)
+
+
+def submit_table_summary(slide_number, table_index, table_fit, components):
+    """
+    Queue an AI summary for a table as a background job.
+
+    The job id is kept in session state; poll_summary_jobs reports progress
+    and collect_summary_jobs stores the result, so the page stays responsive
+    while the summary is generated.
 
     Args:
         slide_number: Slide number
         table_index: Table index on the slide
-        table_text: Formatted table text
+        table_fit: Table text fitted to the prompt budget (TableFit)
         components: Dictionary of initialized components
     """
     llm_service = components['llm']
+    summary_jobs = components['jobs']
     logger = components['logger']
 
-    summary_key = f'summary_{slide_number}_{table_index}'
+    job_key = f'job_{slide_number}_{table_index}'
+    st.session_state[f'generate_{slide_number}_{table_index}'] = False
 
-    try:
-        logger.info(f"Generating summary for slide {slide_number}, table {table_index}")
-
-        with st.spinner("🤖 Generating AI summary..."):
-            summary = llm_service.generate_summary(table_text)
-
-            if summary:
-                st.session_state[summary_key] = summary
-                # Clear the generate flag after successful generation
-                st.session_state[f'generate_{slide_number}_{table_index}'] = False
-                logger.info("Summary generated successfully")
-                # Force rerun to display the summary
-                st.rerun()
+    job_id = st.session_state.get(job_key)
+    running = summary_jobs.status(job_id) if job_id else None
+    if running is not None and not running.finished:
+        return
+
+    # Streamed summaries expose their text so far while the job runs
+    if table_fit.chunks:
+        if llm_service.stream:
+            summarize, table_data = partial(stream_chunked_summary, llm_service), table_fit.chunks
+        else:
+            summarize, table_data = llm_service.generate_summary_hierarchical, table_fit.chunks
+    elif llm_service.stream:
+        summarize, table_data = llm_service.generate_summary_stream, table_fit.text
+    else:
+        summarize, table_data = llm_service.generate_summary, table_fit.text
+
+    job_id = summary_jobs.submit(
+        summarize, table_data,
+        label=f"slide {slide_number}, table {table_index}",
+        meta={'note': table_fit.note}
+    )
+    if job_id is None:
+        st.warning("⚠️ Too many summaries are in progress right now. Please try again in a moment.")
+        return
+
+    st.session_state[job_key] = job_id
+    logger.info(f"Queued summary for slide {slide_number}, table {table_index}")
+
+
+def session_summary_jobs():
+    """
+    Get the summary jobs of this session.
+
+    Returns:
+        Dictionary of (slide number, table index) -> job id
+    """
+    jobs = {}
+    for key in list(st.session_state.keys()):
+        match = _JOB_KEY.match(str(key))
+        if match:
+            jobs[(int(match.group(1)), int(match.group(2)))] = st.session_state[key]
+    return jobs
+
+
+def collect_summary_jobs(slides_data, components):
+    """
+    Store the results of finished summary jobs in session state.
+
+    Failed jobs fall back to a rule-based summary when the policy allows it,
+    and are reported otherwise.
+
+    Args:
+        slides_data: List of SlideContent objects
+        components: Dictionary of initialized components
+    """
+    summary_jobs = components['jobs']
+    logger = components['logger']
+    slides = {slide.slide_number: slide for slide in slides_data}
+
+    for (slide_number, table_index), job_id in session_summary_jobs().items():
+        job = summary_jobs.status(job_id)
+        if job is not None and not job.finished:
+            continue
+
+        del st.session_state[f'job_{slide_number}_{table_index}']
+        summary_jobs.pop(job_id)
+        if job is None:
+            # Expired before this session came back to it
+            logger.warning(f"Summary job for slide {slide_number}, table {table_index} expired")
+            continue
+
+        if job.state == JOB_DONE and job.result:
+            st.session_state[f'summary_{slide_number}_{table_index}'] = job.result
+            store_prompt_note(slide_number, table_index, job.meta.get('note'))
+            logger.info(f"Summary stored for slide {slide_number}, table {table_index}")
+            continue
+
+        slide = slides.get(slide_number)
+        df = slide.typed_tables[table_index - 1] if slide and table_index <= len(slide.tables) else None
+        if df is not None and components['rules'].falls_back and \
+                apply_rule_summary(slide_number, table_index, df, components):
+            st.warning(f"⚡ Slide {slide_number}, Table {table_index}: AI summary failed, used rule-based summary")
+        else:
+            st.error(
+                f"❌ Error generating summary for slide {slide_number}, table {table_index}: "
+                f"{job.error or 'empty summary'}"
+            )
+
+
+@st.fragment(run_every=get_config().get('ui.job_poll_seconds', 1.0))
+def poll_summary_jobs(current_slide, components):
+    """
+    Show the progress of this session's summary jobs, rerunning the page once one finishes.
+
+    Runs as a fragment, so polling only refreshes this part of the page.
+
+    Args:
+        current_slide: SlideContent of the slide being shown
+        components: Dictionary of initialized components
+    """
+    ui_renderer = components['ui']
+    elsewhere = 0
+
+    for (slide_number, table_index), job_id in sorted(session_summary_jobs().items()):
+        job = components['jobs'].status(job_id)
+        if job is None or job.finished:
+            # Collected by the full rerun
+            st.rerun()
+
+        if slide_number == current_slide.slide_number:
+            ui_renderer.render_summary_job(table_index, job)
+        else:
+            elsewhere += 1
+
+    ui_renderer.render_background_jobs(elsewhere)
+
+
+def summarize_all_tables(slides_data, components, llm_ready):
+    """
+    Summarize every table in the deck concurrently.
+
+    Results are written to session state and shown as each table finishes;
+    a failing table is reported without stopping the rest.
+
+    Args:
+        slides_data: List of SlideContent objects
+        components: Dictionary of initialized components
+        llm_ready: Whether the LLM service exists and its last health check passed
+    """
+    llm_service = components['llm']
+    rules = components['rules']
+    logger = components['logger']
+    encoding = llm_service.table_encoding if llm_service is not None else MARKDOWN
+    budget = llm_service.table_budget if llm_service is not None else None
+    max_chunks = llm_service.max_chunks if llm_service is not None else 0
+
+    # Only tables still missing a summary are materialized
+    tables = {
+        (slide.slide_number, table_idx): (
+            slide.typed_tables[table_idx - 1], slide.prompt_tables(encoding, budget, max_chunks)[table_idx - 1]
+        )
+        for slide in slides_data
+        for table_idx in range(1, len(slide.tables) + 1)
+        if f'summary_{slide.slide_number}_{table_idx}' not in st.session_state
+    }
+
+    if not tables:
+        st.info("All tables already have summaries.")
+        return
+
+    # Small regular tables are summarized locally under the "replace" policy,
+    # and every table is while the LLM is unavailable
+    local = [
+        key for key, (df, _) in tables.items()
+        if rules.replaces_llm(df) or (not llm_ready and rules.summarize(df))
+    ]
+    for slide_number, table_idx in local:
+        apply_rule_summary(slide_number, table_idx, tables[(slide_number, table_idx)][0], components)
+    if local:
+        logger.info(f"Summarized {len(local)} tables with rules")
+
+    # Tables over the prompt budget are sent as chunks for map-reduce summaries
+    pending = [
+        (key, table_fit.chunks or table_fit.text) for key, (_, table_fit) in tables.items() if key not in local
+    ]
+    if not pending:
+        st.success(f"✅ Summarized {len(local)} tables locally.")
+        return
+    if not llm_ready:
+        st.warning(f"⚠️ AI summaries are unavailable; {len(pending)} tables could not be summarized.")
+        return
+
+    logger.info(f"Summarizing {len(pending)} tables in batch")
+
+    progress_bar = st.progress(0.0, text=f"🤖 Summarizing {len(pending)} tables...")
+    results_container = st.container()
+    failures = 0
+
+    for done, ((slide_number, table_idx), summary, error) in enumerate(
+            llm_service.iter_table_summaries(pending), 1
+    ):
+        progress_bar.progress(done / len(pending), text=f"🤖 Summarized {done} of {len(pending)} tables")
+
+        with results_container:
+            if error is None and summary:
+                table_fit = tables[(slide_number, table_idx)][1]
+                st.session_state[f'summary_{slide_number}_{table_idx}'] = summary
+                store_prompt_note(slide_number, table_idx, table_fit.note)
+                with st.expander(f"✅ Slide {slide_number}, Table {table_idx}"):
+                    if table_fit.note:
+                        st.caption(f"✂️ {table_fit.note}")
+                    st.markdown(summary)
+            elif rules.falls_back and apply_rule_summary(
+                    slide_number, table_idx, tables[(slide_number, table_idx)][0], components
+            ):
+                st.warning(f"⚡ Slide {slide_number}, Table {table_idx}: AI summary failed, used rule-based summary")
             else:
-                st.error("Failed to generate summary")
-                logger.error("LLM returned empty summary")
+                failures += 1
+                st.error(f"❌ Slide {slide_number}, Table {table_idx}: {error or 'empty summary'}")
 
-    except Exception as e:
-        logger.error(f"Error generating summary: {str(e)}", exc_info=True)
-        st.error(f"❌ Error generating summary: {str(e)}")
+    progress_bar.empty()
+
+    if failures:
+        st.warning(f"⚠️ Summarized {len(pending) - failures} of {len(pending)} tables; {failures} failed.")
+    else:
+        st.success(f"✅ Summarized {len(pending)} tables.")
 
 
 def main():
@@ -202,26 +636,49 @@ def main():
     uploaded_file = ui_renderer.render_file_uploader()
 
     if uploaded_file is not None:
-        # Check if we need to process the file
+        # Re-process when the file content (or extractor settings) changed
+        upload_key = get_upload_key(uploaded_file, components)
+
         if not st.session_state.presentation_loaded or \
-           st.session_state.get('last_uploaded_file') != uploaded_file.name:
+           st.session_state.get('last_upload_key') != upload_key:
 
+            st.session_state.last_upload_key = upload_key
             st.session_state.last_uploaded_file = uploaded_file.name
-            process_uploaded_file(uploaded_file, components)
+            process_uploaded_file(uploaded_file, upload_key, components)
+
+    ui_renderer.render_cache_stats(components['extraction_cache'].get_stats())
+
+    llm_status = components['health'].get_status()
+    if ui_renderer.render_llm_status(llm_status):
+        components['health'].request_check()
+    # A service that failed its last health check is treated like a missing one
+    llm_ready = components['llm'] is not None and llm_status.available
 
     # Display presentation content if loaded
     if st.session_state.presentation_loaded and st.session_state.slides_data:
         slides_data = st.session_state.slides_data
 
+        # Pick up summaries finished in the background since the last run
+        collect_summary_jobs(slides_data, components)
+
         st.markdown("---")
 
         # Show statistics
         ui_renderer.render_statistics(slides_data)
 
+        changed_slides = st.session_state.get('changed_slides')
+        if changed_slides is not None:
+            ui_renderer.render_version_changes(changed_slides, len(slides_data))
+
+        # Deck-wide batch summaries
+        if (llm_ready or components['rules'].falls_back) and \
+                ui_renderer.render_batch_summary_button(slides_data):
+            summarize_all_tables(slides_data, components, llm_ready)
+
         st.markdown("---")
 
         # Slide navigation
-        current_slide_idx = ui_renderer.render_slide_navigation(len(slides_data))
+        current_slide_idx = ui_renderer.render_slide_navigation(len(slides_data), changed_slides)
 
         st.markdown("---")
 
@@ -231,24 +688,52 @@ def main():
         if not current_slide.has_content:
             st.warning("⚠️ This slide appears to be empty or contains no extractable content.")
         else:
-            # Check if we need to generate summaries BEFORE rendering
-            for table_idx in range(1, len(current_slide.tables) + 1):
-                generate_key = f'generate_{current_slide.slide_number}_{table_idx}'
-
-                if st.session_state.get(generate_key, False):
-                    # Generate summary
-                    table_text = current_slide.table_texts[table_idx - 1]
-                    generate_table_summary(
-                        current_slide.slide_number,
-                        table_idx,
-                        table_text,
-                        components
-                    )
-                    # The generate_table_summary function now handles rerun
-                    return  # Exit early to trigger rerun
+            # Check if a summary was requested for a table on this slide
+            pending_table = next(
+                (
+                    table_idx
+                    for table_idx in range(1, len(current_slide.tables) + 1)
+                    if st.session_state.get(f'generate_{current_slide.slide_number}_{table_idx}', False)
+                ),
+                None
+            )
+
+            pending_df = current_slide.typed_tables[pending_table - 1] if pending_table else None
+
+            if pending_table and (not llm_ready or components['rules'].replaces_llm(pending_df)):
+                # Answer locally when the rules replace the LLM or the LLM is down
+                if (llm_ready or components['rules'].falls_back) and apply_rule_summary(
+                        current_slide.slide_number, pending_table, pending_df, components
+                ):
+                    st.rerun()
+                st.session_state[f'generate_{current_slide.slide_number}_{pending_table}'] = False
+                st.warning("⚠️ AI summaries are unavailable right now. Check the LLM status in the sidebar.")
+                pending_table = None
+
+            if pending_table:
+                # Generate in the background so slides can be browsed meanwhile
+                submit_table_summary(
+                    current_slide.slide_number,
+                    pending_table,
+                    current_slide.prompt_tables(
+                        components['llm'].table_encoding, components['llm'].table_budget, components['llm'].max_chunks
+                    )[pending_table - 1],
+                    components
+                )
 
             # Render slide content (this will now show summaries if they exist)
-            ui_renderer.render_slide_content(current_slide)
+            ui_renderer.render_slide_content(
+                current_slide,
+                changed=changed_slides is not None and current_slide.slide_number in changed_slides
+            )
+
+            # Rule-based previews of the summaries still being generated for this slide
+            for slide_number, table_idx in sorted(session_summary_jobs()):
+                if slide_number == current_slide.slide_number:
+                    render_rule_preview(table_idx, current_slide.typed_tables[table_idx - 1], components)
+
+        if session_summary_jobs():
+            poll_summary_jobs(current_slide, components)
 
     else:
         # Show instructions when no file is uploaded
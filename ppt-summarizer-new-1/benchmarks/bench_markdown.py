@@ -0,0 +1,54 @@
+"""
+Microbenchmark: DataFrame.to_markdown (tabulate) vs the native pipe-table writer.
+
+Builds forecast tables of increasing width, checks that both produce the
+same bytes and times them. Requires tabulate, which the app itself no
+longer needs.
+
+Usage:
+    python benchmarks/bench_markdown.py [--rows 30] [--widths 5 20 60]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from modules.markdown_table import markdown_table  # noqa: E402
+
+
+def build_table(rows: int, cols: int):
+    """Header row plus body rows of percentages, as extracted from a deck."""
+    headers = ["Segment"] + [f"Q{c % 4 + 1} FY{2020 + c // 4}" for c in range(1, cols)]
+    body = [
+        [f"Segment {r}"] + [f"{(r * cols + c) % 97 / 10 - 2:.1f}" for c in range(1, cols)]
+        for r in range(1, rows)
+    ]
+    return headers, body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=30)
+    parser.add_argument("--widths", type=int, nargs="+", default=[5, 20, 60])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.rows}-row tables, best of {args.repeat}")
+    print(f"  {'columns':>7} {'to_markdown':>12} {'native':>10} {'speedup':>8}")
+    for cols in args.widths:
+        headers, body = build_table(args.rows, cols)
+        df = pd.DataFrame(body, columns=headers)
+        assert markdown_table(headers, body) == df.to_markdown(index=False)
+
+        tabulate_s = min(timeit.repeat(lambda: df.to_markdown(index=False), number=10, repeat=args.repeat)) / 10
+        native_s = min(timeit.repeat(lambda: markdown_table(headers, body), number=10, repeat=args.repeat)) / 10
+        print(f"  {cols:>7} {tabulate_s * 1000:>10.2f}ms {native_s * 1000:>8.2f}ms {tabulate_s / native_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: in-process vs process-pool slide extraction by deck size.
+
+Builds decks of increasing size (each slide with a title, a text box and a
+forecast table), then times sequential extraction against the worker pool
+(already warm, as in the running app) to find the crossover point for
+``extraction.parallel.min_slides``.
+
+Usage:
+    python benchmarks/bench_parallel_extraction.py [--sizes 10 50 100 200 500] [--workers 4]
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+from pptx import Presentation
+from pptx.util import Inches
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from modules.content_extractor import ContentExtractor  # noqa: E402
+from modules.ooxml_reader import OOXMLPresentation  # noqa: E402
+
+
+def build_deck(slides: int, rows: int, cols: int) -> bytes:
+    """Create a deck with one titled table slide per slide."""
+    prs = Presentation()
+    for s in range(slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = f"Forecast appendix {s + 1}"
+        slide.shapes.add_textbox(Inches(0.5), Inches(6.8), Inches(8), Inches(0.5)).text_frame.text = "Source: Risk"
+        table = slide.shapes.add_table(rows, cols, Inches(0.2), Inches(1.2), Inches(9), Inches(5)).table
+        table.cell(0, 0).text = "Segment"
+        for c in range(1, cols):
+            table.cell(0, c).text = f"Q{c % 4 + 1} FY{2020 + c // 4}"
+        for r in range(1, rows):
+            table.cell(r, 0).text = f"Segment {r}"
+            for c in range(1, cols):
+                table.cell(r, c).text = f"{(r * cols + c + s) % 97 / 10:.1f}%"
+
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+def time_extraction(extractor: ContentExtractor, deck: bytes, reader: str) -> float:
+    """Open and extract a deck, returning wall-clock seconds."""
+    started = time.perf_counter()
+    source = io.BytesIO(deck)
+    presentation = OOXMLPresentation(source) if reader == "lightweight" else Presentation(source)
+    slides = extractor.extract_all_slides(presentation)
+    elapsed = time.perf_counter() - started
+    assert len(slides) == len(presentation.slides)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 25, 50, 100, 200, 500])
+    parser.add_argument("--workers", type=int, default=0, help="0 = one per CPU core")
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--reader", choices=["full", "lightweight"], default="lightweight")
+    args = parser.parse_args()
+
+    sequential = ContentExtractor()
+    sequential.parallel_enabled = False
+
+    parallel = ContentExtractor()
+    parallel.parallel_enabled = True
+    parallel.parallel_min_slides = 1
+    if args.workers:
+        parallel.parallel_workers = args.workers
+
+    # Warm the pool once, like the long-lived extractor in the app
+    time_extraction(parallel, build_deck(parallel.parallel_workers, 2, 2), args.reader)
+
+    print(f"{args.reader} reader, {args.rows}x{args.cols} table per slide, {parallel.parallel_workers} workers")
+    print(f"  {'slides':>6} {'sequential':>12} {'parallel':>12} {'speedup':>8}")
+    crossover = None
+    try:
+        for size in args.sizes:
+            deck = build_deck(size, args.rows, args.cols)
+            seq = time_extraction(sequential, deck, args.reader)
+            par = time_extraction(parallel, deck, args.reader)
+            if crossover is None and par < seq:
+                crossover = size
+            print(f"  {size:>6} {seq * 1000:>10.0f}ms {par * 1000:>10.0f}ms {seq / par:>7.2f}x")
+    finally:
+        parallel.shutdown()
+
+    if crossover is None:
+        print("  parallel extraction did not win at these sizes")
+    else:
+        print(f"  crossover at about {crossover} slides (set extraction.parallel.min_slides)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: memory held per session by extracted slides.
+
+Extracts a deck of table slides and measures, with tracemalloc, the memory
+retained by the compact SlideContent list (what st.session_state.slides_data
+holds until tables are opened) against the same slides with every DataFrame,
+typed copy and LLM text materialized, which is what the eager SlideContent
+dataclass used to hold.
+
+Usage:
+    python benchmarks/bench_slide_memory.py [--slides 200] [--rows 20] [--cols 10]
+"""
+
+import argparse
+import gc
+import io
+import pickle
+import sys
+import tracemalloc
+from pathlib import Path
+
+from pptx import Presentation
+from pptx.util import Inches
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from modules.content_extractor import ContentExtractor  # noqa: E402
+from modules.ooxml_reader import OOXMLPresentation  # noqa: E402
+
+
+def build_deck(slides: int, rows: int, cols: int) -> bytes:
+    """Create a deck with one titled forecast table per slide."""
+    prs = Presentation()
+    for s in range(slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = f"Forecast appendix {s + 1}"
+        table = slide.shapes.add_table(rows, cols, Inches(0.2), Inches(1.2), Inches(9), Inches(5)).table
+        table.cell(0, 0).text = "Segment"
+        for c in range(1, cols):
+            table.cell(0, c).text = f"Q{c % 4 + 1} FY{2020 + c // 4}"
+        for r in range(1, rows):
+            table.cell(r, 0).text = f"Segment {r}"
+            for c in range(1, cols):
+                table.cell(r, c).text = f"{(r * cols + c + s) % 97 / 10:.1f}%"
+
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+def traced_bytes() -> int:
+    """Currently allocated bytes after a full collection."""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def materialize(slides) -> None:
+    """Build every DataFrame, typed copy and LLM text, as the eager layout did."""
+    for slide in slides:
+        slide.tables[:]
+        slide.typed_tables[:]
+        slide.table_texts[:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--slides", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--cols", type=int, default=10)
+    args = parser.parse_args()
+
+    deck = build_deck(args.slides, args.rows, args.cols)
+    extractor = ContentExtractor()
+    presentation = OOXMLPresentation(io.BytesIO(deck))
+
+    # Warm imports and lru caches so they are not counted
+    materialize(extractor.extract_all_slides(presentation))
+
+    tracemalloc.start()
+    baseline = traced_bytes()
+    slides = extractor.extract_all_slides(presentation)
+    compact = traced_bytes() - baseline
+    compact_pickle = len(pickle.dumps(slides, protocol=pickle.HIGHEST_PROTOCOL))
+
+    materialize(slides)
+    eager = traced_bytes() - baseline
+    tracemalloc.stop()
+    eager_pickle = len(pickle.dumps(
+        [(s.tables[:], s.typed_tables[:], s.table_texts[:]) for s in slides], protocol=pickle.HIGHEST_PROTOCOL
+    ))
+
+    print(f"{args.slides} slides, one {args.rows}x{args.cols} table each")
+    print(f"  {'':<24} {'in memory':>12} {'pickled':>12}")
+    print(f"  {'compact (lazy)':<24} {compact / 1024:>10.0f}KB {compact_pickle / 1024:>10.0f}KB")
+    print(f"  {'materialized (eager)':<24} {eager / 1024:>10.0f}KB {eager_pickle / 1024:>10.0f}KB")
+    print(f"  reduction: {eager / compact:.1f}x in memory, {eager_pickle / compact_pickle:.1f}x pickled")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Token report: prompt cost of each table encoding.
+
+Extracts the tables of a deck (or builds forecast tables of the given
+sizes) and prints the estimated prompt tokens of every registered encoding,
+next to the cost of the prompt template itself, to help choose
+llm.table_encoding for a model.
+
+Usage:
+    python benchmarks/bench_table_encodings.py [deck.pptx] [--sizes 5x4 20x10 40x16]
+"""
+
+import argparse
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from modules.table_serializers import available_encodings, estimate_tokens, token_report  # noqa: E402
+
+
+def forecast_table(rows: int, cols: int):
+    """Header row plus body rows of a quarterly forecast table."""
+    headers = ["Segment"] + [f"Q{c % 4 + 1} FY{2020 + c // 4} (%)" for c in range(1, cols)]
+    body = [
+        [f"Segment {r}"] + [f"{(r * cols + c) % 97 / 10 - 2:.1f}" for c in range(1, cols)]
+        for r in range(1, rows)
+    ]
+    return f"{rows}x{cols} forecast", headers, body
+
+
+def deck_tables(path: str):
+    """Tables of a deck as (label, headers, rows, emphasis)."""
+    from pptx import Presentation
+    from modules.content_extractor import ContentExtractor
+
+    for slide in ContentExtractor().extract_all_slides(Presentation(path)):
+        for idx, table in enumerate(slide.compact_tables, 1):
+            headers, rows = table._headers_and_rows()
+            emphasis = table.formatting.emphasis if table.formatting is not None else None
+            yield f"slide {slide.slide_number} table {idx}", headers, rows, emphasis
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("deck", nargs="?", help="PowerPoint file (default: synthetic tables)")
+    parser.add_argument("--sizes", nargs="+", default=["5x4", "20x10", "40x16"], help="Synthetic ROWSxCOLS tables")
+    parser.add_argument("--template", default="prompt_template.txt")
+    args = parser.parse_args()
+
+    if args.deck:
+        tables = list(deck_tables(args.deck))
+    else:
+        tables = [(*forecast_table(*map(int, size.split("x"))), None) for size in args.sizes]
+
+    template = Path(args.template)
+    if template.exists():
+        print(f"Prompt template: ~{estimate_tokens(template.read_text(encoding='utf-8'))} tokens per call\n")
+
+    encodings = available_encodings()
+    totals = defaultdict(int)
+    print(f"  {'table':<24}" + "".join(f"{name:>10}" for name in encodings) + "  cheapest")
+    for label, headers, rows, emphasis in tables:
+        report = token_report(headers, rows, emphasis)
+        tokens = {name: count for name, count, _ in report}
+        for name in encodings:
+            totals[name] += tokens[name]
+        print(f"  {label:<24}" + "".join(f"{tokens[name]:>10}" for name in encodings) + f"  {report[0][0]}")
+
+    baseline = totals["markdown"] or 1
+    print(f"  {'total':<24}" + "".join(f"{totals[name]:>10}" for name in encodings))
+    print(f"  {'vs markdown':<24}" + "".join(f"{totals[name] / baseline:>9.0%} " for name in encodings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+Chart reader module.
+
+Reads native chart data straight from chart part XML: categories, series
+names and values come from the ``c:strCache``/``c:numCache`` copies that
+PowerPoint stores next to each series reference, so the embedded workbook
+is never opened. Values are rendered with their cached number formats.
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from typing import List, Optional, Tuple
+
+import numpy as np
+from lxml import etree
+
+from modules.logger import get_logger
+from modules.ooxml_reader import NAMESPACES, paragraph_text, parse_xml, qn
+
+logger = get_logger(__name__)
+
+_C_PT = qn('c:pt')
+_C_V = qn('c:v')
+_C_LVL = qn('c:lvl')
+_C_SER = qn('c:ser')
+
+# Plot elements of c:plotArea and the names used for them
+_CHART_TYPES = {
+    qn(f'c:{tag}'): name
+    for tag, name in (
+        ('lineChart', 'line'), ('line3DChart', 'line'), ('barChart', 'bar'), ('bar3DChart', 'bar'),
+        ('areaChart', 'area'), ('area3DChart', 'area'), ('pieChart', 'pie'), ('pie3DChart', 'pie'),
+        ('ofPieChart', 'pie'), ('doughnutChart', 'doughnut'), ('radarChart', 'radar'),
+        ('scatterChart', 'scatter'), ('bubbleChart', 'bubble'), ('stockChart', 'stock'),
+        ('surfaceChart', 'surface'), ('surface3DChart', 'surface'),
+    )
+}
+
+# Excel stores dates as days since 1899-12-30
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+
+_FORMAT_LITERAL = re.compile(r'"([^"]*)"|\\(.)|\[\$([^\]-]*)[^\]]*\]|\*(.)|\[[^\]]*\]|_.')
+_DIGIT_PLACEHOLDERS = re.compile(r'(?:[0#?][0#?,]*(?:\.[0#?]*)?|\.[0#?]+),*(?:[Ee][+-][0#]+)?')
+_DATE_TOKENS = re.compile(r'[ymdhs]', re.IGNORECASE)
+
+
+@dataclass
+class ChartSeries:
+    """One series of a chart with its cached points."""
+    name: str
+    categories: List[str] = field(default_factory=list)
+    values: List[str] = field(default_factory=list)
+    format_code: str = "General"
+
+
+@dataclass
+class ChartData:
+    """Cached data of one chart part."""
+    chart_type: str
+    title: Optional[str]
+    category_title: Optional[str]
+    series: List[ChartSeries]
+
+    @property
+    def caption(self) -> str:
+        """Chart type and title, e.g. 'Line chart: Default Rate Trend'."""
+        kind = f"{self.chart_type.capitalize()} chart"
+        return f"{kind}: {self.title}" if self.title else kind
+
+    def cells(self) -> np.ndarray:
+        """
+        Lay the series out as a table, header row included.
+
+        Series sharing their categories become one column each next to a
+        category column; otherwise (e.g. scatter series with their own x
+        values) every point is a row of series, category and value.
+
+        Returns:
+            2-D object array of display strings
+        """
+        category_header = self.category_title or ("X" if self.chart_type in ("scatter", "bubble") else "Category")
+        first = self.series[0].categories
+        shared = all(s.categories == first or not s.categories for s in self.series)
+
+        if shared:
+            n_rows = max(len(s.values) for s in self.series)
+            categories = first + [""] * (n_rows - len(first))
+            rows = [[category_header] + [s.name for s in self.series]]
+            rows += [
+                [categories[i]] + [s.values[i] if i < len(s.values) else "" for s in self.series]
+                for i in range(n_rows)
+            ]
+        else:
+            rows = [["Series", category_header, "Value"]]
+            for s in self.series:
+                for i, value in enumerate(s.values):
+                    rows.append([s.name, s.categories[i] if i < len(s.categories) else "", value])
+
+        return np.array(rows, dtype=object)
+
+
+def read_chart_blob(blob: bytes) -> Optional[ChartData]:
+    """
+    Read the cached data of a chart part.
+
+    Args:
+        blob: Raw chart part XML bytes
+
+    Returns:
+        ChartData, or None if the chart has no series
+    """
+    return read_chart_xml(parse_xml(blob))
+
+
+def read_chart_xml(chart_space: etree._Element) -> Optional[ChartData]:
+    """
+    Read the cached data of a ``c:chartSpace`` element.
+
+    Args:
+        chart_space: Root element of a chart part
+
+    Returns:
+        ChartData, or None if the chart has no series
+    """
+    chart = chart_space.find('c:chart', namespaces=NAMESPACES)
+    plot_area = chart.find('c:plotArea', namespaces=NAMESPACES) if chart is not None else None
+    if plot_area is None:
+        return None
+
+    chart_type = None
+    series: List[ChartSeries] = []
+    for plot in plot_area.iterchildren():
+        name = _CHART_TYPES.get(plot.tag)
+        if name is None:
+            continue
+        chart_type = chart_type or name
+        for ser in plot.iterchildren(_C_SER):
+            series.append(_read_series(ser, len(series)))
+
+    series = [s for s in series if s.values]
+    if not series:
+        return None
+
+    return ChartData(
+        chart_type=chart_type,
+        title=_title_text(chart.find('c:title', namespaces=NAMESPACES)),
+        category_title=_category_axis_title(plot_area),
+        series=series
+    )
+
+
+def _read_series(ser: etree._Element, position: int) -> ChartSeries:
+    """Read the name, categories and values of a ``c:ser`` element."""
+    tx = ser.find('c:tx', namespaces=NAMESPACES)
+    names = _cached_strings(tx) if tx is not None else []
+    name = names[0] if names and names[0] else f"Series {position + 1}"
+
+    categories = ser.find('c:cat', namespaces=NAMESPACES)
+    if categories is None:
+        categories = ser.find('c:xVal', namespaces=NAMESPACES)
+    values = ser.find('c:val', namespaces=NAMESPACES)
+    if values is None:
+        values = ser.find('c:yVal', namespaces=NAMESPACES)
+
+    value_strings, format_code = _cached_numbers(values) if values is not None else ([], "General")
+    return ChartSeries(
+        name=name,
+        categories=_cached_strings(categories) if categories is not None else [],
+        values=value_strings,
+        format_code=format_code
+    )
+
+
+def _cached_strings(data: etree._Element) -> List[str]:
+    """
+    Read the cached points of a series name or category reference.
+
+    Handles string caches, numeric caches (rendered with their format code,
+    e.g. dates) and multi-level category caches (levels joined outermost
+    first), as well as literal values.
+    """
+    multi = data.find('.//c:multiLvlStrCache', namespaces=NAMESPACES)
+    if multi is not None:
+        count = _point_count(multi)
+        # Levels are stored innermost first; a label covers the points up to the next one
+        levels = [_spread(_points(lvl, count)) for lvl in multi.iterchildren(_C_LVL)]
+        return [" ".join(filter(None, parts)) for parts in zip(*reversed(levels))] if levels else []
+
+    cache = data.find('.//c:strCache', namespaces=NAMESPACES)
+    if cache is None:
+        cache = data.find('.//c:strLit', namespaces=NAMESPACES)
+    if cache is not None:
+        return [value or "" for value in _points(cache, _point_count(cache))]
+
+    numbers, _ = _cached_numbers(data)
+    if numbers:
+        return numbers
+
+    # Series names may be a bare c:v
+    value = data.find('c:v', namespaces=NAMESPACES)
+    return [value.text.strip()] if value is not None and value.text else []
+
+
+def _cached_numbers(data: etree._Element) -> Tuple[List[str], str]:
+    """Read a numeric cache as display strings, with its series format code."""
+    cache = data.find('.//c:numCache', namespaces=NAMESPACES)
+    if cache is None:
+        cache = data.find('.//c:numLit', namespaces=NAMESPACES)
+    if cache is None:
+        return [], "General"
+
+    format_elm = cache.find('c:formatCode', namespaces=NAMESPACES)
+    series_format = format_elm.text if format_elm is not None and format_elm.text else "General"
+
+    count = _point_count(cache)
+    values = [""] * count
+    for pt in cache.iterchildren(_C_PT):
+        idx = int(pt.get('idx', '0'))
+        v = pt.find(_C_V)
+        if idx >= count or v is None or v.text is None:
+            continue
+        try:
+            values[idx] = format_number(float(v.text), pt.get('formatCode') or series_format)
+        except ValueError:
+            values[idx] = v.text.strip()
+    return values, series_format
+
+
+def _point_count(cache: etree._Element) -> int:
+    """Declared point count of a cache (or the highest point index + 1)."""
+    pt_count = cache.find('c:ptCount', namespaces=NAMESPACES)
+    if pt_count is not None:
+        return int(pt_count.get('val', '0'))
+    return max((int(pt.get('idx', '0')) + 1 for pt in cache.iterchildren(_C_PT)), default=0)
+
+
+def _points(cache: etree._Element, count: int) -> List[Optional[str]]:
+    """Text of each point by index (None where a point is missing)."""
+    values: List[Optional[str]] = [None] * count
+    for pt in cache.iterchildren(_C_PT):
+        idx = int(pt.get('idx', '0'))
+        v = pt.find(_C_V)
+        if idx < count and v is not None and v.text is not None:
+            values[idx] = v.text.strip()
+    return values
+
+
+def _spread(labels: List[Optional[str]]) -> List[str]:
+    """Carry each label of an outer category level forward over the points it spans."""
+    spread, current = [], ""
+    for label in labels:
+        current = label if label is not None else current
+        spread.append(current)
+    return spread
+
+
+def _title_text(title: Optional[etree._Element]) -> Optional[str]:
+    """Text of a ``c:title`` (rich text or a cached cell reference)."""
+    if title is None:
+        return None
+
+    rich = title.find('c:tx/c:rich', namespaces=NAMESPACES)
+    if rich is not None:
+        text = " ".join(paragraph_text(p).strip() for p in rich.iterchildren(qn('a:p')))
+        return " ".join(text.split()) or None
+
+    tx = title.find('c:tx', namespaces=NAMESPACES)
+    strings = _cached_strings(tx) if tx is not None else []
+    return strings[0] if strings and strings[0] else None
+
+
+def _category_axis_title(plot_area: etree._Element) -> Optional[str]:
+    """Title of the category (or, for scatter charts, the first value) axis."""
+    for axis in ('c:catAx', 'c:dateAx', 'c:valAx'):
+        elm = plot_area.find(axis, namespaces=NAMESPACES)
+        if elm is not None:
+            return _title_text(elm.find('c:title', namespaces=NAMESPACES))
+    return None
+
+
+def format_number(value: float, format_code: str = "General") -> str:
+    """
+    Render a number with an Excel number format code.
+
+    Covers what charts use in practice: General, fixed decimals, thousands
+    separators, percentages, scientific notation, currency and other literal
+    prefixes and suffixes, separate negative and zero sections (e.g. the
+    accounting format's "-" for zero), and dates. Padding (``_x``) is
+    dropped and fill characters (``*x``) are written once.
+
+    Args:
+        value: Number
+        format_code: Excel format code (e.g. "0.0%", "#,##0", "$#,##0.00;($#,##0.00)")
+
+    Returns:
+        Display string
+    """
+    sections = format_code.split(";") if format_code else ["General"]
+    section = sections[0]
+    sign = "-" if value < 0 else ""
+    if value < 0 and len(sections) > 1 and sections[1]:
+        # The negative section carries its own sign or parentheses
+        section, sign = sections[1], ""
+    elif value == 0 and len(sections) > 2 and sections[2]:
+        section = sections[2]
+
+    if not section or section.lower() == "general" or section == "@":
+        return _general(value)
+
+    # Blank out literals (keeping positions) so only format characters are matched
+    code = _FORMAT_LITERAL.sub(lambda m: "\0" * len(m.group()), section)
+    match = _DIGIT_PLACEHOLDERS.search(code)
+    if match is None:
+        if _DATE_TOKENS.search(code):
+            return _excel_date(value, code)
+        # A section of literals only (e.g. '"-"' for zero) is shown as is
+        literal = _literal_text(section)
+        return literal if literal.strip() else _general(value)
+
+    number = Decimal(repr(abs(value))) * 100 ** code.count("%")
+    placeholder, _, exponent = match.group().upper().partition("E")
+    # Commas after the last digit placeholder scale by thousands
+    core = placeholder.rstrip(",")
+    number /= 1000 ** (len(placeholder) - len(core))
+    whole_digits, _, decimals = core.partition(".")
+    required = decimals.count("0")
+
+    if exponent:
+        text = f"{float(number):.{len(decimals)}E}"
+    else:
+        grouping = "," if "," in whole_digits else ""
+        text = f"{number.quantize(Decimal(1).scaleb(-len(decimals)), ROUND_HALF_UP):{grouping}f}"
+        if len(decimals) > required:
+            # Optional digits (#) are dropped when they are zeros
+            whole, _, fraction = text.partition(".")
+            fraction = fraction[:required] + fraction[required:].rstrip("0")
+            text = f"{whole}.{fraction}" if fraction else whole
+        if "0" not in whole_digits and text.split(".")[0] == "0":
+            # Optional integer digits (# and ?) show nothing for a zero integer part
+            text = text[1:]
+
+    prefix = _literal_text(section[:match.start()])
+    suffix = _literal_text(section[match.end():])
+    return f"{sign}{prefix}{text}{suffix}"
+
+
+def _literal_text(part: str) -> str:
+    """Literal text of a format code fragment (quotes, escapes and currency kept)."""
+    def literal(match):
+        quoted, escaped, currency, fill = match.groups()
+        return quoted or escaped or currency or fill or ""
+    return _FORMAT_LITERAL.sub(literal, part)
+
+
+def _general(value: float) -> str:
+    """Excel's General format: up to 10 significant digits, no trailing zeros."""
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return f"{value:.10g}"
+
+
+def _excel_date(value: float, format_code: str) -> str:
+    """Render an Excel date serial as an ISO date (with time if the format shows one)."""
+    try:
+        moment = _EXCEL_EPOCH + timedelta(days=value)
+    except OverflowError:
+        return _general(value)
+    if re.search(r'[hs]', format_code, re.IGNORECASE):
+        return moment.strftime("%Y-%m-%d %H:%M")
+    return moment.strftime("%Y-%m-%d")
+
+
+# Example usage
+if __name__ == "__main__":
+    for code, number in (("0.0%", 0.0234), ("#,##0", 1234567), ("$#,##0.00;($#,##0.00)", -12.5), ("mmm-yy", 45382)):
+        print(f"{code!r:>26} {number!r:>10} -> {format_number(number, code)}")
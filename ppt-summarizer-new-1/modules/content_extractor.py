@@ -4,10 +4,21 @@ Content extraction module.
 Extracts text, tables, and other content from PowerPoint slides.
 """
 
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-
+import multiprocessing
+import os
+import sys
+import threading
+from collections.abc import Sequence as SequenceABC
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 import pandas as pd
+from lxml import etree
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.presentation import Presentation
 from pptx.shapes.base import BaseShape
 from pptx.table import Table
@@ -15,20 +26,474 @@ from pptx.text.text import TextFrame
 
 from modules.logger import get_logger
 from modules.config_manager import get_config
+from modules.ooxml_reader import (
+    NAMESPACES, RT_CHART, RT_PACKAGE, CellFormatting, DetachedSlide, OOXMLSlide, clr_map_items, qn,
+    read_table_formatted_xml, read_table_xml, text_body_paragraphs, theme_color_map
+)
+from modules.chart_reader import ChartData, read_chart_blob, read_chart_xml
+from modules.embedded_workbook import EmbeddedWorkbookReader
+from modules.table_serializers import MARKDOWN, estimate_tokens, serialize_dataframe, serialize_table
+from modules.prompt_budget import TableFit, chunk_table, fit_table
+from modules.table_typing import normalize_table
 
 logger = get_logger(__name__)
 config = get_config()
 
+# Shape elements the XML visitor counts, matching python-pptx's shape tree
+_P_SP = qn('p:sp')
+_P_GRPSP = qn('p:grpSp')
+_P_GRAPHIC_FRAME = qn('p:graphicFrame')
+_XML_SHAPE_TAGS = {_P_SP, _P_GRPSP, _P_GRAPHIC_FRAME, qn('p:cxnSp'), qn('p:pic'), qn('p:contentPart')}
+
+
+def format_table_for_llm(df: pd.DataFrame, emphasis: Optional[np.ndarray] = None) -> str:
+    """
+    Format DataFrame as readable text for LLM processing.
+
+    Args:
+        df: pandas DataFrame
+        emphasis: Boolean mask of cells highlighted in the deck (bold or
+            red), rendered as **value** for the prompt
+
+    Returns:
+        Formatted table string
+    """
+    try:
+        return serialize_dataframe(df, MARKDOWN, emphasis)
+
+    except Exception as e:
+        logger.error(f"Error formatting table: {str(e)}")
+        return str(df)
+
+
+class CompactTable:
+    """
+    One extracted table stored as flat interned cell strings.
+
+    The DataFrame, its typed copy and the LLM text are built on first access
+    and memoized; only the cells, the header flag and the formatting masks
+    are pickled into the extraction cache or sent between processes.
+
+    Charts (categories by series, read from the chart caches) and the
+    sheets of embedded Excel workbooks are stored the same way, with a
+    caption naming their source.
+    """
+
+    __slots__ = (
+        'cells', 'n_rows', 'n_cols', 'header', 'formatting', 'caption', '_frame', '_typed', '_text', '_encoded'
+    )
+
+    def __init__(
+            self,
+            cells: Optional[Tuple[str, ...]],
+            n_rows: int,
+            n_cols: int,
+            header: bool,
+            formatting: Optional[CellFormatting] = None,
+            caption: Optional[str] = None
+    ):
+        """
+        Initialize compact table.
+
+        Args:
+            cells: Row-major cell strings, header row included
+            n_rows: Number of rows in cells
+            n_cols: Number of columns in cells
+            header: Whether the first row holds the column names
+            formatting: Run formatting of the body rows, None if no cell is
+                bold, italic or colored
+            caption: Source of tables read from charts or embedded workbooks
+        """
+        self.cells = cells
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.header = header
+        self.formatting = formatting
+        self.caption = caption
+        self._frame: Optional[pd.DataFrame] = None
+        self._typed: Optional[pd.DataFrame] = None
+        self._text: Optional[str] = None
+        self._encoded: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def from_cells(
+            cls,
+            data: np.ndarray,
+            header: bool,
+            formatting: Optional[CellFormatting] = None,
+            caption: Optional[str] = None
+    ) -> 'CompactTable':
+        """
+        Build a compact table from a 2-D array of cell strings.
+
+        Args:
+            data: 2-D array of cell strings, header row included
+            header: Whether the first row holds the column names
+            formatting: Run formatting aligned with the body rows
+            caption: Source of tables read from charts or embedded workbooks
+
+        Returns:
+            CompactTable
+        """
+        n_rows, n_cols = data.shape
+        if formatting is not None and not (formatting.bold.any() or formatting.italic.any() or formatting.color.any()):
+            formatting = None
+        return cls(tuple(sys.intern(str(cell)) for cell in data.ravel()), n_rows, n_cols, header, formatting, caption)
+
+    @classmethod
+    def from_frame(
+            cls,
+            df: pd.DataFrame,
+            text: Optional[str] = None,
+            typed: Optional[pd.DataFrame] = None,
+            formatting: Optional[CellFormatting] = None
+    ) -> 'CompactTable':
+        """
+        Wrap an already built DataFrame (SlideContent built by hand or in tests).
+
+        The DataFrame and any given text or typed copy are kept as they are
+        instead of being rebuilt from cells.
+
+        Args:
+            df: Table DataFrame
+            text: LLM text, built on access if None
+            typed: Typed copy, built on access if None
+            formatting: Run formatting aligned with df
+
+        Returns:
+            CompactTable
+        """
+        table = cls(None, len(df) + 1, len(df.columns), True, formatting)
+        table._frame = df
+        table._text = text
+        table._typed = typed
+        return table
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Shape of the DataFrame (body rows x columns)."""
+        return self.n_rows - int(self.header), self.n_cols
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Table DataFrame with display strings."""
+        if self._frame is None:
+            data = np.array(self.cells, dtype=object).reshape(self.n_rows, self.n_cols)
+            if self.header:
+                self._frame = pd.DataFrame(data[1:], columns=list(data[0]))
+            else:
+                self._frame = pd.DataFrame(data)
+        return self._frame
+
+    @property
+    def typed(self) -> pd.DataFrame:
+        """Float/categorical copy of the table (see table_typing.normalize_table)."""
+        if self._typed is None:
+            self._typed = normalize_table(self.frame)
+        return self._typed
+
+    @property
+    def text(self) -> str:
+        """Markdown table for the LLM, with emphasized cells marked."""
+        if self._text is None:
+            emphasis = self.formatting.emphasis if self.formatting is not None else None
+            if self.cells is None:
+                self._text = self._captioned(format_table_for_llm(self.frame, emphasis))
+            else:
+                self._text = self._captioned(self._cells_to_markdown(emphasis))
+        return self._text
+
+    def encode(self, encoding: str) -> str:
+        """
+        Table text for the LLM in a prompt encoding (see table_serializers).
+
+        Args:
+            encoding: Encoding name, or "auto" for the cheapest one
+
+        Returns:
+            Table text with emphasized cells marked, memoized per encoding
+        """
+        if encoding == MARKDOWN:
+            return self.text
+        if self._encoded is None:
+            self._encoded = {}
+        if encoding not in self._encoded:
+            emphasis = self.formatting.emphasis if self.formatting is not None else None
+            headers, rows = self._headers_and_rows()
+            self._encoded[encoding] = self._captioned(serialize_table(headers, rows, encoding, emphasis))
+        return self._encoded[encoding]
+
+    def fit(self, encoding: str, budget: Optional[int], max_chunks: int = 0) -> TableFit:
+        """
+        Table text for the LLM, fitted to a token budget (see prompt_budget).
+
+        Tables within the budget use the memoized encode() text unchanged.
+        Larger tables are split into row-group chunks for map-reduce
+        summarization when they need at most max_chunks of them; the text
+        is always the trimmed table.
+
+        Args:
+            encoding: Encoding name, or "auto" for the cheapest one
+            budget: Maximum estimated tokens, None for no limit
+            max_chunks: Most chunks to split into (0 never splits)
+
+        Returns:
+            TableFit with the prompt text and the chunks or what was omitted
+        """
+        text = self.encode(encoding)
+        tokens = estimate_tokens(text)
+        rows, cols = self.shape
+        if budget is None or tokens <= budget:
+            return TableFit(text, tokens, rows, cols, budget=budget)
+
+        emphasis = self.formatting.emphasis if self.formatting is not None else None
+        headers, body = self._headers_and_rows()
+        fit = fit_table(headers, body, self.typed, budget, encoding, emphasis, self.caption)
+        if max_chunks:
+            chunks = chunk_table(headers, body, self.typed, budget, encoding, emphasis, self.caption)
+            if len(chunks) <= max_chunks:
+                fit.chunks = chunks
+            else:
+                logger.warning(f"Table needs {len(chunks)} chunks (max {max_chunks}); trimming it instead")
+        return fit
+
+    def _captioned(self, text: str) -> str:
+        """Put the caption above the table text, so the LLM knows where the table comes from."""
+        return f"{self.caption}\n\n{text}" if self.caption else text
+
+    def _headers_and_rows(self) -> Tuple[Sequence[Any], List[List[str]]]:
+        """Column names and body rows, read from the cell tuple when there is one."""
+        if self.cells is None:
+            return list(self.frame.columns), self.frame.to_numpy(dtype=object).tolist()
+
+        n_cols = self.n_cols
+        start = n_cols if self.header else 0
+        headers = self.cells[:n_cols] if self.header else range(n_cols)
+        rows = [list(self.cells[i:i + n_cols]) for i in range(start, len(self.cells), n_cols)]
+        return headers, rows
+
+    def _cells_to_markdown(self, emphasis: Optional[np.ndarray]) -> str:
+        """Serialize straight from the cell tuple, without building the DataFrame."""
+        headers, rows = self._headers_and_rows()
+
+        try:
+            return serialize_table(headers, rows, MARKDOWN, emphasis)
+        except Exception as e:
+            logger.error(f"Error formatting table: {str(e)}")
+            return format_table_for_llm(self.frame, emphasis)
+
+    @property
+    def cell_formatting(self) -> CellFormatting:
+        """Run formatting of the body rows (all-empty masks if none was captured)."""
+        return self.formatting if self.formatting is not None else CellFormatting.empty(self.shape)
+
+    def __getstate__(self):
+        # Memoized objects are rebuilt on access; only keep them when there
+        # are no cells to rebuild them from
+        keep_memos = self.cells is None
+        return {
+            slot: getattr(self, slot)
+            for slot in self.__slots__
+            if keep_memos or not slot.startswith('_')
+        }
+
+    def __setstate__(self, state):
+        for slot in self.__slots__:
+            setattr(self, slot, state.get(slot))
+
+    def __repr__(self) -> str:
+        caption = f", caption={self.caption!r}" if self.caption else ""
+        return f"CompactTable(shape={self.shape}, header={self.header}{caption})"
+
+
+class _TableView(SequenceABC):
+    """Read-only per-table sequence that materializes one table at a time."""
+
+    __slots__ = ('_tables', '_attr', '_args')
+
+    def __init__(self, tables: List[CompactTable], attr: str, *args):
+        self._tables = tables
+        self._attr = attr
+        # Positional arguments turn the attribute into a method call
+        self._args = args
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(table) for table in self._tables[index]]
+        return self._get(self._tables[index])
+
+    def _get(self, table: CompactTable):
+        value = getattr(table, self._attr)
+        return value(*self._args) if self._args else value
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (SequenceABC, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<{len(self)} lazy {self._attr} values>"
+
 
-@dataclass
 class SlideContent:
-    """Data class to store extracted slide content."""
-    slide_number: int
-    title: Optional[str]
-    text_content: List[str]
-    tables: List[pd.DataFrame]
-    table_texts: List[str]  # Raw table text for LLM
-    has_content: bool
+    """
+    Extracted content of one slide.
+
+    Tables are held as CompactTable objects; ``tables``, ``table_texts``,
+    ``typed_tables`` and ``table_formats`` are lazy sequences, so a table's
+    DataFrame and LLM text exist only once something reads them.
+    """
+
+    __slots__ = (
+        'slide_number', 'title', 'text_content', 'compact_tables', 'has_content',
+        'shapes_visited', 'cells_read', 'fingerprint'
+    )
+
+    def __init__(
+            self,
+            slide_number: int,
+            title: Optional[str],
+            text_content: List[str],
+            tables: Sequence[Union[CompactTable, pd.DataFrame]],
+            table_texts: Optional[Sequence[str]] = None,
+            has_content: bool = False,
+            shapes_visited: int = 0,
+            cells_read: int = 0,
+            typed_tables: Optional[Sequence[pd.DataFrame]] = None,
+            table_formats: Optional[Sequence[CellFormatting]] = None,
+            fingerprint: Optional[str] = None
+    ):
+        """
+        Initialize slide content.
+
+        Args:
+            slide_number: Slide number (1-indexed)
+            title: Slide title
+            text_content: Text blocks in shape order
+            tables: CompactTable objects, or DataFrames together with the
+                matching table_texts / typed_tables / table_formats
+            table_texts: LLM text per DataFrame (ignored for CompactTables)
+            has_content: Whether the slide has a title, text or tables
+            shapes_visited: Shapes seen by the visitor, including group members
+            cells_read: Table cells read, including undersized tables
+            typed_tables: Typed copy per DataFrame (ignored for CompactTables)
+            table_formats: Body formatting per DataFrame (ignored for CompactTables)
+            fingerprint: FileParser.slide_fingerprints digest of the source slide
+        """
+        self.slide_number = slide_number
+        self.title = title
+        self.text_content = text_content
+        self.has_content = has_content
+        self.shapes_visited = shapes_visited
+        self.cells_read = cells_read
+        self.fingerprint = fingerprint
+
+        self.compact_tables = [
+            table if isinstance(table, CompactTable) else CompactTable.from_frame(
+                table,
+                table_texts[idx] if table_texts and idx < len(table_texts) else None,
+                typed_tables[idx] if typed_tables and idx < len(typed_tables) else None,
+                table_formats[idx] if table_formats and idx < len(table_formats) else None
+            )
+            for idx, table in enumerate(tables)
+        ]
+
+    @property
+    def tables(self) -> Sequence[pd.DataFrame]:
+        """Table DataFrames with display strings."""
+        return _TableView(self.compact_tables, 'frame')
+
+    @property
+    def table_texts(self) -> Sequence[str]:
+        """Raw table text for LLM."""
+        return _TableView(self.compact_tables, 'text')
+
+    def encoded_tables(self, encoding: str) -> Sequence[str]:
+        """
+        Table text for LLM in a prompt encoding.
+
+        Args:
+            encoding: Encoding name (LLMService.table_encoding)
+
+        Returns:
+            Lazy sequence of table texts
+        """
+        return _TableView(self.compact_tables, 'encode', encoding)
+
+    def prompt_tables(self, encoding: str, budget: Optional[int], max_chunks: int = 0) -> Sequence[TableFit]:
+        """
+        Table text for LLM in a prompt encoding, fitted to a token budget.
+
+        Args:
+            encoding: Encoding name (LLMService.table_encoding)
+            budget: Token budget per table (LLMService.table_budget), None for no limit
+            max_chunks: Split oversized tables into at most this many chunks
+                for map-reduce summarization (LLMService.max_chunks); 0 trims them
+
+        Returns:
+            Lazy sequence of TableFit objects
+        """
+        return _TableView(self.compact_tables, 'fit', encoding, budget, max_chunks)
+
+    @property
+    def typed_tables(self) -> Sequence[pd.DataFrame]:
+        """Float/categorical copies of tables."""
+        return _TableView(self.compact_tables, 'typed')
+
+    @property
+    def table_formats(self) -> Sequence[CellFormatting]:
+        """Bold/italic/color masks per table body."""
+        return _TableView(self.compact_tables, 'cell_formatting')
+
+    @property
+    def table_captions(self) -> Sequence[Optional[str]]:
+        """Caption per table for charts and embedded sheets (None for slide tables)."""
+        return _TableView(self.compact_tables, 'caption')
+
+    def renumbered(self, slide_number: int) -> 'SlideContent':
+        """
+        Copy the slide under a new slide number, sharing its tables.
+
+        Args:
+            slide_number: New slide number (1-indexed)
+
+        Returns:
+            SlideContent
+        """
+        copy = SlideContent.__new__(SlideContent)
+        for slot in self.__slots__:
+            setattr(copy, slot, getattr(self, slot))
+        copy.slide_number = slide_number
+        return copy
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot in self.__slots__:
+            setattr(self, slot, state[slot])
+
+    def __repr__(self) -> str:
+        return (
+            f"SlideContent(slide_number={self.slide_number}, title={self.title!r}, "
+            f"text_blocks={len(self.text_content)}, tables={len(self.compact_tables)})"
+        )
+
+
+@dataclass
+class _ShapeVisit:
+    """Accumulates slide content collected during a single shape traversal."""
+    title: Optional[str] = None
+    title_seen: bool = False
+    text_blocks: List[str] = field(default_factory=list)
+    tables: List[CompactTable] = field(default_factory=list)
+    theme_colors: Dict[str, int] = field(default_factory=dict)
+    slide: Any = None
+    shapes_visited: int = 0
+    cells_read: int = 0
 
 
 class ContentExtractor:
@@ -39,32 +504,279 @@ class ContentExtractor:
         self.min_table_rows = config.get("extraction.min_table_rows", 2)
         self.min_table_cols = config.get("extraction.min_table_cols", 2)
         self.preserve_formatting = config.get("extraction.preserve_formatting", True)
+        self.extract_charts = config.get("extraction.extract_charts", True)
+        self.workbook_reader = EmbeddedWorkbookReader()
+
+        # Opt-in process pool for very large decks
+        self.parallel_enabled = config.get("extraction.parallel.enabled", False)
+        self.parallel_workers = config.get("extraction.parallel.workers", 0) or os.cpu_count() or 1
+        self.parallel_min_slides = config.get("extraction.parallel.min_slides", 100)
+        self.parallel_chunksize = config.get("extraction.parallel.chunksize", 8)
+        self.parallel_start_method = config.get("extraction.parallel.start_method", "spawn")
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
         logger.info("ContentExtractor initialized")
 
-    def extract_all_slides(self, presentation: Presentation) -> List[SlideContent]:
+    def cache_settings(self) -> Dict[str, any]:
+        """
+        Get the settings that change extracted content.
+
+        These are part of the extraction cache key, so changing any of them
+        invalidates previously cached decks.
+
+        Returns:
+            Dictionary of extraction settings
+        """
+        return {
+            "min_table_rows": self.min_table_rows,
+            "min_table_cols": self.min_table_cols,
+            "preserve_formatting": self.preserve_formatting,
+            "extract_charts": self.extract_charts,
+            "embedded_excel": self.workbook_reader.settings(),
+        }
+
+    def extract_all_slides(
+            self,
+            presentation: Presentation,
+            fingerprints: Optional[Sequence[Optional[str]]] = None,
+            previous: Optional[Sequence[SlideContent]] = None
+    ) -> List[SlideContent]:
         """
         Extract content from all slides in presentation.
 
         Args:
             presentation: PowerPoint presentation object
+            fingerprints: Per-slide fingerprints from FileParser.slide_fingerprints
+            previous: Slides of an earlier version of the deck to reuse
 
         Returns:
-            List of SlideContent objects
+            List of SlideContent objects (slides extracted before an
+            unrecoverable error are kept)
         """
         all_slides = []
 
         try:
-            for idx, slide in enumerate(presentation.slides, start=1):
-                logger.debug(f"Extracting content from slide {idx}")
-                slide_content = self.extract_slide_content(slide, idx)
+            for slide_content in self.extract_iter(presentation, fingerprints, previous):
                 all_slides.append(slide_content)
 
-            logger.info(f"Extracted content from {len(all_slides)} slides")
-            return all_slides
+        except Exception as e:
+            logger.error(
+                f"Error extracting slides, keeping {len(all_slides)} extracted so far: {str(e)}",
+                exc_info=True
+            )
+
+        logger.info(
+            f"Extracted content from {len(all_slides)} slides "
+            f"(shapes visited: {sum(s.shapes_visited for s in all_slides)}, "
+            f"cells read: {sum(s.cells_read for s in all_slides)})"
+        )
+        return all_slides
+
+    def extract_iter(
+            self,
+            presentation: Presentation,
+            fingerprints: Optional[Sequence[Optional[str]]] = None,
+            previous: Optional[Sequence[SlideContent]] = None
+    ) -> Iterator[SlideContent]:
+        """
+        Extract slides one at a time, yielding each as soon as it is parsed.
+
+        A failure on one slide yields an empty SlideContent for that slide
+        and extraction continues with the next one.
+
+        When fingerprints are given, each SlideContent records its slide's
+        fingerprint, and slides whose fingerprint matches one of the
+        ``previous`` slides are not extracted again: the earlier content is
+        reused under the new slide number.
+
+        Decks with at least ``extraction.parallel.min_slides`` slides are
+        split across a process pool when ``extraction.parallel.enabled`` is
+        set; results are still yielded in slide order.
+
+        Args:
+            presentation: PowerPoint presentation object
+            fingerprints: Per-slide fingerprints from FileParser.slide_fingerprints
+            previous: Slides of an earlier version of the deck to reuse
+
+        Yields:
+            SlideContent objects in slide order
+        """
+        fingerprints = list(fingerprints or [])
+        reusable = {s.fingerprint: s for s in previous or [] if s.fingerprint}
+
+        remaining = presentation.slides
+        start = 1
+
+        if self._should_parallelize(remaining):
+            slides = list(remaining)
+            for slide_content in self._extract_parallel(slides, fingerprints, reusable):
+                yield slide_content
+                start += 1
+            if start > len(slides):
+                return
+            logger.warning(f"Continuing sequential extraction from slide {start}")
+            remaining = slides[start - 1:]
+
+        for idx, slide in enumerate(remaining, start=start):
+            fingerprint = self._fingerprint(fingerprints, idx)
+            if fingerprint in reusable:
+                logger.debug(f"Slide {idx} unchanged, reusing extracted content")
+                yield reusable[fingerprint].renumbered(idx)
+                continue
+
+            logger.debug(f"Extracting content from slide {idx}")
+            try:
+                slide_content = self.extract_slide_content(slide, idx)
+                slide_content.fingerprint = fingerprint
+            except Exception as e:
+                logger.error(f"Error extracting content from slide {idx}: {str(e)}")
+                slide_content = self._empty_slide(idx)
+
+            yield slide_content
+
+    @staticmethod
+    def _fingerprint(fingerprints: List[Optional[str]], slide_number: int) -> Optional[str]:
+        """Fingerprint of a slide, or None when it was not fingerprinted."""
+        return fingerprints[slide_number - 1] if slide_number <= len(fingerprints) else None
+
+    def _should_parallelize(self, slides) -> bool:
+        """
+        Check whether a deck is large enough for the worker pool.
+
+        Args:
+            slides: Slide collection of the presentation
+
+        Returns:
+            True if parallel extraction is enabled and the deck has at least
+            ``extraction.parallel.min_slides`` slides
+        """
+        if not self.parallel_enabled or self.parallel_workers < 2:
+            return False
+        try:
+            return len(slides) >= self.parallel_min_slides
+        except TypeError:
+            return False
+
+    def _extract_parallel(
+            self,
+            slides: List[Any],
+            fingerprints: List[Optional[str]],
+            reusable: Dict[str, SlideContent]
+    ) -> Iterator[SlideContent]:
+        """
+        Extract slides in worker processes from their raw XML bytes.
+
+        Workers never receive python-pptx objects: each job is the slide
+        number, the slide part's XML, the scheme colors resolved here and
+        the slide's chart parts and embedded packages.
+        Unchanged slides are reused without a job. Stops early (for a
+        sequential fallback) if the pool breaks.
+
+        Args:
+            slides: Slide objects (python-pptx or OOXMLSlide)
+            fingerprints: Per-slide fingerprints (may be empty)
+            reusable: Previously extracted slides by fingerprint
+
+        Yields:
+            SlideContent objects in slide order
+        """
+        changed = [
+            (idx, slide) for idx, slide in enumerate(slides, start=1)
+            if self._fingerprint(fingerprints, idx) not in reusable
+        ]
+        logger.info(
+            f"Extracting {len(changed)} of {len(slides)} slides with {self.parallel_workers} worker processes"
+        )
+
+        jobs = (
+            (idx, self._slide_blob(slide), self._slide_theme_colors(slide), self._slide_related_parts(slide))
+            for idx, slide in changed
+        )
+
+        try:
+            pool = self._get_pool()
+            results = pool.map(_extract_detached_slide, jobs, chunksize=self.parallel_chunksize)
+            for idx in range(1, len(slides) + 1):
+                fingerprint = self._fingerprint(fingerprints, idx)
+                if fingerprint in reusable:
+                    yield reusable[fingerprint].renumbered(idx)
+                    continue
+                slide_content = next(results)
+                slide_content.fingerprint = fingerprint
+                yield slide_content
+
+        except (BrokenProcessPool, OSError) as e:
+            logger.error(f"Parallel extraction failed: {str(e)}")
+            self.shutdown()
+
+    @staticmethod
+    def _slide_blob(slide) -> bytes:
+        """Raw XML bytes of a slide part."""
+        if isinstance(slide, OOXMLSlide):
+            return slide.blob
+        return slide.part.blob
+
+    def _slide_related_parts(self, slide) -> Dict[str, bytes]:
+        """
+        Raw bytes of the chart parts and embedded packages a slide refers to.
+
+        Embedded packages over the workbook byte budget are left out, so
+        they are never copied to a worker.
+
+        Args:
+            slide: Slide object (python-pptx or OOXMLSlide)
+
+        Returns:
+            Dictionary of rId -> part bytes (empty when neither is extracted)
+        """
+        rel_types = {}
+        if self.extract_charts:
+            rel_types[RT_CHART] = None
+        if self.workbook_reader.enabled:
+            rel_types[RT_PACKAGE] = self.workbook_reader.max_bytes
 
+        parts = {}
+        try:
+            for rel_type, max_bytes in rel_types.items():
+                if isinstance(slide, OOXMLSlide):
+                    parts.update(slide.related_blobs(rel_type, max_bytes))
+                    continue
+                for r_id, rel in slide.part.rels.items():
+                    if rel.reltype == rel_type and not rel.is_external:
+                        blob = rel.target_part.blob
+                        if max_bytes is None or len(blob) <= max_bytes:
+                            parts[r_id] = blob
         except Exception as e:
-            logger.error(f"Error extracting slides: {str(e)}", exc_info=True)
-            return []
+            logger.debug(f"Could not read related parts: {str(e)}")
+        return parts
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """
+        Get the worker pool, starting it on first use.
+
+        The pool is kept for later decks so worker start-up (interpreter,
+        pandas and lxml imports) is paid once.
+
+        Returns:
+            ProcessPoolExecutor
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.parallel_workers,
+                    mp_context=multiprocessing.get_context(self.parallel_start_method),
+                    initializer=_init_worker,
+                    initargs=(self.cache_settings(),)
+                )
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Stop the worker pool, if one was started."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
 
     def extract_slide_content(self, slide, slide_number: int) -> SlideContent:
         """
@@ -78,44 +790,53 @@ class ContentExtractor:
             SlideContent object with extracted data
         """
         try:
-            # Extract title
-            title = self._extract_title(slide)
-
-            # Extract text content
-            text_content = self._extract_text(slide)
-
-            # Extract tables
-            tables, table_texts = self._extract_tables(slide)
+            # Classify every shape in a single traversal
+            visit = self._visit_slide(slide)
 
             # Check if slide has any content
-            has_content = bool(title or text_content or tables)
+            has_content = bool(visit.title or visit.text_blocks or visit.tables)
 
             slide_content = SlideContent(
                 slide_number=slide_number,
-                title=title,
-                text_content=text_content,
-                tables=tables,
-                table_texts=table_texts,
-                has_content=has_content
+                title=visit.title,
+                text_content=visit.text_blocks,
+                tables=visit.tables,
+                has_content=has_content,
+                shapes_visited=visit.shapes_visited,
+                cells_read=visit.cells_read
             )
 
             logger.debug(
-                f"Slide {slide_number}: title={bool(title)}, "
-                f"text_blocks={len(text_content)}, tables={len(tables)}"
+                f"Slide {slide_number}: title={bool(visit.title)}, "
+                f"text_blocks={len(visit.text_blocks)}, tables={len(visit.tables)}, "
+                f"shapes_visited={visit.shapes_visited}, cells_read={visit.cells_read}"
             )
 
             return slide_content
 
         except Exception as e:
             logger.error(f"Error extracting content from slide {slide_number}: {str(e)}")
-            return SlideContent(
-                slide_number=slide_number,
-                title=None,
-                text_content=[],
-                tables=[],
-                table_texts=[],
-                has_content=False
-            )
+            return self._empty_slide(slide_number)
+
+    @staticmethod
+    def _empty_slide(slide_number: int) -> SlideContent:
+        """
+        Build the placeholder SlideContent used when a slide cannot be read.
+
+        Args:
+            slide_number: Slide number (1-indexed)
+
+        Returns:
+            SlideContent with no content
+        """
+        return SlideContent(
+            slide_number=slide_number,
+            title=None,
+            text_content=[],
+            tables=[],
+            table_texts=[],
+            has_content=False
+        )
 
     def _extract_title(self, slide) -> Optional[str]:
         """
@@ -138,44 +859,302 @@ class ContentExtractor:
 
         return None
 
-    def _extract_text(self, slide) -> List[str]:
+    def _visit_slide(self, slide) -> _ShapeVisit:
         """
-        Extract text content from slide (excluding tables and title).
+        Visit every shape on a slide once, collecting title, text and tables.
 
         Args:
             slide: PowerPoint slide object
 
         Returns:
-            List of text strings
+            _ShapeVisit with the collected content and traversal counters
         """
-        text_blocks = []
+        visit = _ShapeVisit(theme_colors=self._slide_theme_colors(slide), slide=slide)
 
         try:
-            for shape in slide.shapes:
-                # Skip title shape
-                if hasattr(slide.shapes, 'title') and shape == slide.shapes.title:
+            if isinstance(slide, OOXMLSlide):
+                self._visit_xml_shapes(slide.element.find('p:cSld/p:spTree', namespaces=NAMESPACES), visit)
+            else:
+                self._visit_shapes(slide.shapes, visit)
+        except Exception as e:
+            logger.error(f"Error visiting slide shapes: {str(e)}")
+
+        return visit
+
+    def _visit_shapes(self, shapes, visit: _ShapeVisit) -> None:
+        """
+        Classify each shape in a shape collection, recursing into groups.
+
+        Args:
+            shapes: Iterable of PowerPoint shapes
+            visit: Accumulator for the slide being visited
+        """
+        for shape in shapes:
+            visit.shapes_visited += 1
+
+            try:
+                # Recurse into grouped shapes
+                if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+                    self._visit_shapes(shape.shapes, visit)
                     continue
 
-                # Skip table shapes
+                # Tables
                 if shape.has_table:
+                    self._visit_table(*self._read_table_formatted(shape.table, visit.theme_colors), visit)
+                    continue
+
+                # Charts, from the chart part's cached values
+                if shape.has_chart:
+                    if self.extract_charts:
+                        self._visit_chart(read_chart_xml(shape.chart_part._element), visit)
+                    continue
+
+                # Embedded Excel workbooks
+                if shape.shape_type == MSO_SHAPE_TYPE.EMBEDDED_OLE_OBJECT:
+                    ole_format = shape.ole_format
+                    if self.workbook_reader.accepts(ole_format.prog_id):
+                        blob = ole_format.blob
+                        if blob is not None and self.workbook_reader.fits(len(blob)):
+                            self._visit_workbook(blob, visit)
+                    continue
+
+                # The first title placeholder becomes the slide title
+                if not visit.title_seen and self._is_title_shape(shape):
+                    visit.title_seen = True
+                    visit.title = shape.text.strip() or None
                     continue
 
                 # Extract text from text frames
                 if hasattr(shape, 'text_frame'):
                     text = self._extract_text_from_frame(shape.text_frame)
                     if text:
-                        text_blocks.append(text)
+                        visit.text_blocks.append(text)
 
                 # Extract text from text property
                 elif hasattr(shape, 'text'):
                     text = shape.text.strip()
                     if text:
-                        text_blocks.append(text)
+                        visit.text_blocks.append(text)
+
+            except Exception as e:
+                logger.debug(f"Skipping shape during extraction: {str(e)}")
+
+    def _visit_xml_shapes(self, sp_tree, visit: _ShapeVisit) -> None:
+        """
+        Classify each shape element of a slide shape tree, recursing into groups.
+
+        Used by the lightweight reader, which hands over raw slide XML instead
+        of python-pptx shape objects.
+
+        Args:
+            sp_tree: ``p:spTree`` or ``p:grpSp`` element
+            visit: Accumulator for the slide being visited
+        """
+        for elm in sp_tree.iterchildren():
+            if elm.tag not in _XML_SHAPE_TAGS:
+                continue
+            visit.shapes_visited += 1
+
+            try:
+                # Recurse into grouped shapes
+                if elm.tag == _P_GRPSP:
+                    self._visit_xml_shapes(elm, visit)
+                    continue
+
+                # Tables, charts and embedded workbooks
+                if elm.tag == _P_GRAPHIC_FRAME:
+                    graphic_data = elm.find('a:graphic/a:graphicData', namespaces=NAMESPACES)
+                    if graphic_data is not None:
+                        self._visit_graphic_data(graphic_data, visit)
+                    continue
+
+                if elm.tag != _P_SP:
+                    continue
+
+                paragraphs = text_body_paragraphs(elm.find('p:txBody', namespaces=NAMESPACES))
+
+                # The first title placeholder becomes the slide title
+                if not visit.title_seen and self._is_title_element(elm):
+                    visit.title_seen = True
+                    visit.title = "\n".join(paragraphs).strip() or None
+                    continue
+
+                text = "\n".join(p.strip() for p in paragraphs if p.strip())
+                if text:
+                    visit.text_blocks.append(text)
+
+            except Exception as e:
+                logger.debug(f"Skipping shape element during extraction: {str(e)}")
+
+    def _visit_graphic_data(self, graphic_data, visit: _ShapeVisit) -> None:
+        """
+        Read the table, chart or embedded workbook inside a graphic frame.
+
+        Args:
+            graphic_data: ``a:graphicData`` element
+            visit: Accumulator for the slide being visited
+        """
+        tbl = graphic_data.find('a:tbl', namespaces=NAMESPACES)
+        if tbl is not None:
+            self._visit_table(*self._read_tbl(tbl, visit.theme_colors), visit)
+            return
+
+        chart = graphic_data.find('c:chart', namespaces=NAMESPACES)
+        if chart is not None:
+            if self.extract_charts:
+                blob = visit.slide.related_blob(chart.get(qn('r:id')))
+                if blob is not None:
+                    self._visit_chart(read_chart_blob(blob), visit)
+            return
+
+        # PowerPoint wraps OLE objects in mc:AlternateContent
+        ole_obj = graphic_data.find('.//p:oleObj', namespaces=NAMESPACES)
+        if ole_obj is not None and self.workbook_reader.accepts(ole_obj.get('progId')):
+            r_id = ole_obj.get(qn('r:id'))
+            size = visit.slide.related_size(r_id)
+            if size is not None and self.workbook_reader.fits(size):
+                self._visit_workbook(visit.slide.related_blob(r_id), visit)
+
+    def _visit_table(
+            self,
+            data: Union[np.ndarray, List[List[str]]],
+            formatting: Optional[CellFormatting],
+            visit: _ShapeVisit
+    ) -> None:
+        """
+        Build a table from its cells and keep it if it meets the minimum size.
+
+        Args:
+            data: 2-D array or row-major list of cell strings
+            formatting: Run formatting aligned with data, if it was read
+            visit: Accumulator for the slide being visited
+        """
+        visit.cells_read += sum(len(row) for row in data)
+
+        if len(data) == 0:
+            return
+
+        cells = data if isinstance(data, np.ndarray) else np.array(data, dtype=object)
+        if cells.ndim != 2:
+            # Ragged proxy rows: let pandas pad them as before
+            df, table_text = self._build_table(data, formatting)
+            if df is None:
+                return
+            table = CompactTable.from_frame(df, table_text)
+        else:
+            header = self._has_header(cells)
+            # Align the masks with the DataFrame body (header row dropped)
+            body_formatting = formatting.rows(int(header)) if formatting is not None else None
+            table = CompactTable.from_cells(cells, header, body_formatting)
+
+        # Only include tables that meet minimum size requirements
+        rows, cols = table.shape
+        if rows and cols and rows >= self.min_table_rows and cols >= self.min_table_cols:
+            visit.tables.append(table)
+            logger.debug(f"Extracted table with shape: {table.shape}")
+
+    @staticmethod
+    def _visit_chart(chart: Optional[ChartData], visit: _ShapeVisit) -> None:
+        """
+        Keep a chart's cached series as a table.
+
+        Charts are kept whenever they have data; the minimum table size
+        only applies to slide tables.
+
+        Args:
+            chart: Chart data read from the chart part (None if it has no series)
+            visit: Accumulator for the slide being visited
+        """
+        if chart is None:
+            return
+
+        cells = chart.cells()
+        visit.cells_read += cells.size
+        if cells.shape[0] > 1:
+            visit.tables.append(CompactTable.from_cells(cells, True, caption=chart.caption))
+            logger.debug(f"Extracted chart '{chart.caption}' with {len(chart.series)} series")
+
+    def _visit_workbook(self, blob: bytes, visit: _ShapeVisit) -> None:
+        """
+        Keep the sheets of an embedded workbook as tables.
+
+        Like charts, sheets are kept whenever they have a header and a data
+        row; the reader has already applied its row and column caps.
+
+        Args:
+            blob: Embedded .xlsx package bytes
+            visit: Accumulator for the slide being visited
+        """
+        for caption, cells in self.workbook_reader.read(blob):
+            visit.cells_read += cells.size
+            if cells.shape[0] > 1:
+                visit.tables.append(CompactTable.from_cells(cells, self._has_header(cells), caption=caption))
+                logger.debug(f"Extracted {caption} with shape: {cells.shape}")
+
+    @staticmethod
+    def _slide_theme_colors(slide) -> Dict[str, int]:
+        """
+        Resolve a slide's scheme colors through its slide master and theme.
+
+        Args:
+            slide: PowerPoint slide object or OOXMLSlide
+
+        Returns:
+            Scheme color name -> 0xRRGGBB (empty if it cannot be resolved)
+        """
+        try:
+            if isinstance(slide, OOXMLSlide):
+                return slide.theme_colors
+
+            master = slide.slide_layout.slide_master
+            theme_part = master.part.part_related_by(RT.THEME)
+            return theme_color_map(theme_part.blob, clr_map_items(master._element))
 
         except Exception as e:
-            logger.error(f"Error extracting text: {str(e)}")
+            logger.debug(f"Could not resolve theme colors: {str(e)}")
+            return {}
+
+    @staticmethod
+    def _is_title_shape(shape) -> bool:
+        """
+        Check whether a shape is the slide title placeholder.
+
+        Mirrors python-pptx ``SlideShapes.title``, which picks the placeholder
+        with index 0, without re-scanning the slide for every shape.
+
+        Args:
+            shape: PowerPoint shape
+
+        Returns:
+            True if the shape is the title placeholder
+        """
+        return shape.is_placeholder is True and shape.placeholder_format.idx == 0
+
+    @staticmethod
+    def _is_title_element(sp) -> bool:
+        """
+        Check whether a ``p:sp`` element is the slide title placeholder.
 
-        return text_blocks
+        Args:
+            sp: ``p:sp`` element
+
+        Returns:
+            True if the element is a placeholder with index 0
+        """
+        ph = sp.find('p:nvSpPr/p:nvPr/p:ph', namespaces=NAMESPACES)
+        return ph is not None and int(ph.get('idx', '0')) == 0
+
+    def _extract_text(self, slide) -> List[str]:
+        """
+        Extract text content from slide (excluding tables and title).
+
+        Args:
+            slide: PowerPoint slide object
+
+        Returns:
+            List of text strings
+        """
+        return self._visit_slide(slide).text_blocks
 
     def _extract_text_from_frame(self, text_frame: TextFrame) -> str:
         """
@@ -209,38 +1188,84 @@ class ContentExtractor:
         Returns:
             Tuple of (list of DataFrames, list of formatted table strings)
         """
-        tables = []
-        table_texts = []
+        visit = self._visit_slide(slide)
+        return [table.frame for table in visit.tables], [table.text for table in visit.tables]
 
-        try:
-            for shape in slide.shapes:
-                if shape.has_table:
-                    df, table_text = self._convert_table_to_dataframe(shape.table)
+    def _convert_table_to_dataframe(self, table: Table) -> Tuple[Optional[pd.DataFrame], str]:
+        """
+        Convert PowerPoint table to pandas DataFrame.
 
-                    # Only include tables that meet minimum size requirements
-                    if df is not None and not df.empty:
-                        if len(df) >= self.min_table_rows and len(df.columns) >= self.min_table_cols:
-                            tables.append(df)
-                            table_texts.append(table_text)
-                            logger.debug(f"Extracted table with shape: {df.shape}")
+        Args:
+            table: PowerPoint table object
 
-        except Exception as e:
-            logger.error(f"Error extracting tables: {str(e)}")
+        Returns:
+            Tuple of (DataFrame, formatted table string for LLM)
+        """
+        return self._build_table(self._read_table_cells(table))
 
-        return tables, table_texts
+    def _read_table_formatted(
+            self,
+            table: Table,
+            theme_colors: Dict[str, int]
+    ) -> Tuple[Union[np.ndarray, List[List[str]]], Optional[CellFormatting]]:
+        """
+        Read cell text and run formatting of a table in one pass.
 
-    def _convert_table_to_dataframe(self, table: Table) -> Tuple[Optional[pd.DataFrame], str]:
+        Args:
+            table: PowerPoint table object
+            theme_colors: Scheme colors of the slide
+
+        Returns:
+            Tuple of (cell strings, CellFormatting or None for proxy-only tables)
         """
-        Convert PowerPoint table to pandas DataFrame.
+        tbl = getattr(table, '_tbl', None)
+        if isinstance(tbl, etree._Element):
+            try:
+                return self._read_tbl(tbl, theme_colors)
+            except Exception as e:
+                logger.error(f"Error reading table XML: {str(e)}")
+                return [], None
+
+        return self._read_table_cells(table), None
+
+    def _read_tbl(
+            self,
+            tbl: etree._Element,
+            theme_colors: Dict[str, int]
+    ) -> Tuple[np.ndarray, Optional[CellFormatting]]:
+        """
+        Read an ``a:tbl`` element, with run formatting if preserve_formatting is on.
+
+        Args:
+            tbl: ``a:tbl`` element
+            theme_colors: Scheme colors of the slide
+
+        Returns:
+            Tuple of (cell strings, CellFormatting or None when formatting is not preserved)
+        """
+        if not self.preserve_formatting:
+            return read_table_xml(tbl), None
+        return read_table_formatted_xml(tbl, theme_colors)
+
+    def _read_table_cells(self, table: Table) -> Union[np.ndarray, List[List[str]]]:
+        """
+        Read the stripped text of every cell in a table.
+
+        Reads the underlying ``a:tbl`` XML directly (resolving merged cells)
+        instead of creating a python-pptx proxy per cell; objects without an
+        lxml table element fall back to the row/cell proxies.
 
         Args:
             table: PowerPoint table object
 
         Returns:
-            Tuple of (DataFrame, formatted table string for LLM)
+            2-D array or row-major list of cell strings
         """
         try:
-            # Extract all cell values
+            tbl = getattr(table, '_tbl', None)
+            if isinstance(tbl, etree._Element):
+                return read_table_xml(tbl)
+
             data = []
             for row in table.rows:
                 row_data = []
@@ -248,24 +1273,41 @@ class ContentExtractor:
                     cell_text = cell.text.strip()
                     row_data.append(cell_text)
                 data.append(row_data)
+            return data
 
-            if not data:
+        except Exception as e:
+            logger.error(f"Error reading table cells: {str(e)}")
+            return []
+
+    def _build_table(
+            self,
+            data: Union[np.ndarray, List[List[str]]],
+            formatting: Optional[CellFormatting] = None
+    ) -> Tuple[Optional[pd.DataFrame], str]:
+        """
+        Build a DataFrame and its LLM text from raw cell strings.
+
+        Args:
+            data: 2-D array or row-major list of cell strings
+            formatting: Run formatting aligned with data; emphasized body
+                cells are marked in the LLM text
+
+        Returns:
+            Tuple of (DataFrame, formatted table string for LLM)
+        """
+        try:
+            if len(data) == 0:
                 return None, ""
 
-            # Create DataFrame
-            # Try to use first row as headers if it looks like headers
-            if len(data) > 1:
-                headers = data[0]
-                # Check if first row looks like headers (non-numeric or descriptive)
-                if any(not self._is_numeric(cell) for cell in headers):
-                    df = pd.DataFrame(data[1:], columns=headers)
-                else:
-                    df = pd.DataFrame(data)
+            # Create DataFrame, using the first row as headers if it looks like headers
+            if self._has_header(data):
+                df = pd.DataFrame(data[1:], columns=list(data[0]))
             else:
                 df = pd.DataFrame(data)
 
             # Create formatted string for LLM
-            table_text = self._format_table_for_llm(df)
+            emphasis = formatting.rows(len(data) - len(df)).emphasis if formatting is not None else None
+            table_text = self._format_table_for_llm(df, emphasis)
 
             return df, table_text
 
@@ -273,29 +1315,32 @@ class ContentExtractor:
             logger.error(f"Error converting table to DataFrame: {str(e)}")
             return None, ""
 
-    def _format_table_for_llm(self, df: pd.DataFrame) -> str:
+    def _has_header(self, data: Union[np.ndarray, List[List[str]]]) -> bool:
+        """
+        Check whether the first row of a table looks like column headers.
+
+        Args:
+            data: 2-D array or row-major list of cell strings
+
+        Returns:
+            True if there is more than one row and a first-row cell is
+            non-numeric (descriptive)
+        """
+        return len(data) > 1 and any(not self._is_numeric(cell) for cell in data[0])
+
+    def _format_table_for_llm(self, df: pd.DataFrame, emphasis: Optional[np.ndarray] = None) -> str:
         """
         Format DataFrame as readable text for LLM processing.
 
         Args:
             df: pandas DataFrame
+            emphasis: Boolean mask of cells highlighted in the deck (bold or
+                red), rendered as **value** for the prompt
 
         Returns:
             Formatted table string
         """
-        try:
-            # Use pandas to_markdown for nice formatting
-            # Fallback to to_string if markdown is not available
-            try:
-                table_str = df.to_markdown(index=False)
-            except AttributeError:
-                table_str = df.to_string(index=False)
-
-            return table_str
-
-        except Exception as e:
-            logger.error(f"Error formatting table: {str(e)}")
-            return str(df)
+        return format_table_for_llm(df, emphasis)
 
     def _is_numeric(self, value: str) -> bool:
         """
@@ -331,10 +1376,51 @@ class ContentExtractor:
             "text_blocks": len(slide_content.text_content),
             "table_count": len(slide_content.tables),
             "has_content": slide_content.has_content,
-            "total_text_length": sum(len(text) for text in slide_content.text_content)
+            "total_text_length": sum(len(text) for text in slide_content.text_content),
+            "shapes_visited": slide_content.shapes_visited,
+            "cells_read": slide_content.cells_read
         }
 
 
+# Extractor owned by each worker process
+_worker_extractor: Optional[ContentExtractor] = None
+
+
+def _init_worker(settings: Dict[str, Any]) -> None:
+    """
+    Create the worker's extractor with the parent's settings.
+
+    Args:
+        settings: Result of ContentExtractor.cache_settings() in the parent
+    """
+    global _worker_extractor
+    _worker_extractor = ContentExtractor()
+    _worker_extractor.min_table_rows = settings["min_table_rows"]
+    _worker_extractor.min_table_cols = settings["min_table_cols"]
+    _worker_extractor.preserve_formatting = settings["preserve_formatting"]
+    _worker_extractor.extract_charts = settings["extract_charts"]
+    _worker_extractor.workbook_reader.apply(settings["embedded_excel"])
+
+
+def _extract_detached_slide(job: Tuple[int, bytes, Dict[str, int], Dict[str, bytes]]) -> SlideContent:
+    """
+    Extract one slide from its XML bytes in a worker process.
+
+    Args:
+        job: (slide number, slide XML bytes, scheme colors, related part bytes by rId)
+
+    Returns:
+        SlideContent (empty if the slide could not be read)
+    """
+    slide_number, blob, theme_colors, related = job
+    try:
+        slide = DetachedSlide(blob, slide_number, theme_colors, related)
+        return _worker_extractor.extract_slide_content(slide, slide_number)
+    except Exception as e:
+        logger.error(f"Error extracting content from slide {slide_number}: {str(e)}")
+        return ContentExtractor._empty_slide(slide_number)
+
+
 # Example usage
 if __name__ == "__main__":
     from modules.file_parser import FileParser
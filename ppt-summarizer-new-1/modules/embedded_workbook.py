@@ -0,0 +1,211 @@
+"""
+Embedded workbook module.
+
+Reads Excel workbooks embedded in slides as OLE objects (often the source
+model behind a table pasted as a picture) with openpyxl's read-only
+streaming mode. Rows and columns are capped and oversized workbooks are
+skipped, so a large embedded model cannot exhaust memory.
+"""
+
+import io
+import zipfile
+from datetime import date, datetime, time
+from typing import List, Optional, Tuple
+
+import numpy as np
+from openpyxl import load_workbook
+
+from modules.logger import get_logger
+from modules.config_manager import get_config
+from modules.chart_reader import format_number
+
+logger = get_logger(__name__)
+config = get_config()
+
+SHEETS_ACTIVE = "active"
+SHEETS_ALL = "all"
+
+# Workbook parts openpyxl parses completely, even in read-only mode
+_LOADED_PARTS = ("xl/sharedStrings.xml", "xl/styles.xml", "xl/workbook.xml")
+
+
+class EmbeddedWorkbookReader:
+    """Streams the visible cells of embedded .xlsx packages into cell grids."""
+
+    def __init__(self):
+        """Initialize reader with configuration."""
+        self.enabled = config.get("extraction.embedded_excel.enabled", True)
+        self.sheets = config.get("extraction.embedded_excel.sheets", SHEETS_ACTIVE)
+        self.max_sheets = config.get("extraction.embedded_excel.max_sheets", 3)
+        self.max_rows = config.get("extraction.embedded_excel.max_rows", 200)
+        self.max_cols = config.get("extraction.embedded_excel.max_cols", 30)
+        self.max_bytes = config.get("extraction.embedded_excel.max_bytes", 20 * 1024 * 1024)
+
+    def settings(self) -> dict:
+        """
+        Get the settings that change extracted content (part of the extraction cache key).
+
+        Returns:
+            Dictionary of reader settings
+        """
+        return {
+            "enabled": self.enabled,
+            "sheets": self.sheets,
+            "max_sheets": self.max_sheets,
+            "max_rows": self.max_rows,
+            "max_cols": self.max_cols,
+            "max_bytes": self.max_bytes,
+        }
+
+    def apply(self, settings: dict) -> None:
+        """
+        Adopt settings from ``settings()`` (used by extraction worker processes).
+
+        Args:
+            settings: Reader settings
+        """
+        for name, value in settings.items():
+            setattr(self, name, value)
+
+    def accepts(self, prog_id: Optional[str]) -> bool:
+        """
+        Check whether an embedded OLE object is a workbook to read.
+
+        Args:
+            prog_id: OLE ``progId`` of the object (e.g. "Excel.Sheet.12")
+
+        Returns:
+            True for Excel objects when embedded workbooks are enabled
+        """
+        return self.enabled and (prog_id or "").startswith("Excel.")
+
+    def fits(self, size: int) -> bool:
+        """
+        Check an embedded package against the byte budget before reading it.
+
+        Args:
+            size: Size of the embedded package in bytes
+
+        Returns:
+            True if the package is at most max_bytes
+        """
+        if size > self.max_bytes:
+            logger.warning(f"Skipping embedded workbook of {size} bytes (budget {self.max_bytes})")
+            return False
+        return True
+
+    def read(self, blob: bytes) -> List[Tuple[str, np.ndarray]]:
+        """
+        Read the relevant sheets of an embedded workbook.
+
+        Args:
+            blob: Bytes of the embedded .xlsx/.xlsm package
+
+        Returns:
+            List of (caption, 2-D object array of display strings), one per
+            sheet with data; empty for legacy .xls objects, oversized or
+            unreadable workbooks
+        """
+        if not blob.startswith(b"PK"):
+            # Legacy binary (.xls) OLE storage, which openpyxl cannot read
+            logger.debug("Skipping embedded workbook that is not an OOXML package")
+            return []
+
+        try:
+            if not self._within_budget(blob):
+                return []
+
+            workbook = load_workbook(io.BytesIO(blob), read_only=True, data_only=True)
+        except Exception as e:
+            logger.warning(f"Could not open embedded workbook: {str(e)}")
+            return []
+
+        try:
+            if self.sheets == SHEETS_ALL:
+                worksheets = [
+                    ws for ws in workbook.worksheets
+                    if getattr(ws, "sheet_state", "visible") == "visible"
+                ]
+            else:
+                worksheets = [workbook.active] if workbook.active is not None else []
+
+            grids = []
+            for ws in worksheets[:self.max_sheets]:
+                grid, truncated = self._read_sheet(ws)
+                if grid.size:
+                    caption = f"Embedded Excel sheet: {ws.title}"
+                    if truncated:
+                        caption += f" (first {self.max_rows} rows)"
+                    grids.append((caption, grid))
+            return grids
+
+        except Exception as e:
+            logger.warning(f"Error reading embedded workbook: {str(e)}")
+            return []
+
+        finally:
+            workbook.close()
+
+    def _within_budget(self, blob: bytes) -> bool:
+        """Check the uncompressed size of the parts openpyxl loads in full."""
+        with zipfile.ZipFile(io.BytesIO(blob)) as package:
+            loaded = sum(
+                info.file_size for info in package.infolist() if info.filename in _LOADED_PARTS
+            )
+        if loaded > self.max_bytes:
+            logger.warning(f"Skipping embedded workbook with {loaded} bytes of shared strings and styles")
+            return False
+        return True
+
+    def _read_sheet(self, ws) -> Tuple[np.ndarray, bool]:
+        """
+        Stream the capped cell range of a worksheet.
+
+        Args:
+            ws: Read-only worksheet
+
+        Returns:
+            Tuple of (cell grid without empty rows and columns, whether rows
+            beyond max_rows were cut off)
+        """
+        rows = []
+        truncated = False
+        for row in ws.iter_rows(max_col=self.max_cols):
+            if len(rows) == self.max_rows:
+                truncated = True
+                break
+            rows.append([_cell_text(cell) for cell in row])
+
+        width = max((len(row) for row in rows), default=0)
+        grid = np.array([row + [""] * (width - len(row)) for row in rows], dtype=object).reshape(len(rows), width)
+        if not grid.size:
+            return grid, truncated
+
+        filled = grid != ""
+        return grid[filled.any(axis=1)][:, filled.any(axis=0)], truncated
+
+
+def _cell_text(cell) -> str:
+    """Display string of a read-only cell, using its number format."""
+    value = getattr(cell, "value", None)
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return format_number(value, getattr(cell, "number_format", None) or "General")
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d") if value.time() == time() else value.strftime("%Y-%m-%d %H:%M")
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return str(value).strip()
+
+
+# Example usage
+if __name__ == "__main__":
+    import sys
+
+    with open(sys.argv[1], "rb") as f:
+        for caption, grid in EmbeddedWorkbookReader().read(f.read()):
+            print(caption)
+            print(grid)
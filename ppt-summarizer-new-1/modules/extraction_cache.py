@@ -0,0 +1,248 @@
+"""
+Extraction cache module.
+
+Caches extracted slide content keyed by a hash of the uploaded file bytes
+and the extractor settings, with an in-process LRU tier and an on-disk tier.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from modules.logger import get_logger
+from modules.config_manager import get_config
+
+logger = get_logger(__name__)
+config = get_config()
+
+# Bump when the pickled SlideContent layout or extracted content changes
+CACHE_FORMAT_VERSION = 11
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class ExtractionCache:
+    """Two-tier (memory LRU + disk) cache of extracted presentations."""
+
+    def __init__(self):
+        """Initialize extraction cache with configuration."""
+        self.enabled = config.get("cache.extraction.enabled", True)
+        self.memory_entries = config.get("cache.extraction.memory_entries", 8)
+        self.disk_dir = Path(config.get("cache.extraction.disk_dir", ".cache/extraction"))
+        self.max_disk_bytes = int(config.get("cache.extraction.max_disk_mb", 512) * 1024 * 1024)
+
+        self._memory: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        if self.enabled:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+        # Running size of the disk tier, so get_stats never scans the directory;
+        # re-synced with the directory whenever put() evicts
+        self._disk_bytes = sum(size for _, size, _ in self._disk_entries()) if self.enabled else 0
+
+        logger.info(
+            f"ExtractionCache initialized (enabled={self.enabled}, "
+            f"memory_entries={self.memory_entries}, disk_dir={self.disk_dir})"
+        )
+
+    @staticmethod
+    def make_key(file_obj, settings: Dict[str, Any]) -> str:
+        """
+        Build the cache key for an upload.
+
+        Args:
+            file_obj: Binary file-like object (read from the start, position restored)
+            settings: Extractor settings that affect the extracted content
+
+        Returns:
+            Hex SHA-256 digest of the file bytes and settings
+        """
+        digest = hashlib.sha256()
+
+        position = file_obj.tell()
+        file_obj.seek(0)
+        try:
+            for chunk in iter(lambda: file_obj.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        finally:
+            file_obj.seek(position)
+
+        digest.update(json.dumps(
+            {"format": CACHE_FORMAT_VERSION, "settings": settings},
+            sort_keys=True
+        ).encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[Any]]:
+        """
+        Look up extracted slides.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            List of SlideContent objects, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                logger.info(f"Extraction cache memory hit: {key[:12]}")
+                return self._memory[key]
+
+        slides = self._read_disk(key)
+
+        with self._lock:
+            if slides is None:
+                self._stats["misses"] += 1
+                logger.info(f"Extraction cache miss: {key[:12]}")
+                return None
+
+            self._stats["disk_hits"] += 1
+            self._remember(key, slides)
+
+        logger.info(f"Extraction cache disk hit: {key[:12]}")
+        return slides
+
+    def put(self, key: str, slides: List[Any]) -> None:
+        """
+        Store extracted slides in both tiers.
+
+        Args:
+            key: Cache key from make_key
+            slides: List of SlideContent objects
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._remember(key, slides)
+
+        try:
+            self._write_disk(key, slides)
+            self._evict_disk()
+        except Exception as e:
+            logger.warning(f"Could not write extraction cache entry: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache hit/miss statistics.
+
+        Returns:
+            Dictionary with hit, miss and size counters
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_bytes"] = self._disk_bytes
+
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        lookups = hits + stats["misses"]
+        stats["hit_rate"] = hits / lookups if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        """Remove all cached entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        for path, _, _ in self._disk_entries():
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._disk_bytes = 0
+        logger.info("Extraction cache cleared")
+
+    def _remember(self, key: str, slides: List[Any]) -> None:
+        """Insert into the memory tier, evicting the least recently used entry (lock held)."""
+        self._memory[key] = slides
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        """Path of the disk entry for a key."""
+        return self.disk_dir / f"{key}.pkl"
+
+    def _read_disk(self, key: str) -> Optional[List[Any]]:
+        """Load an entry from disk, refreshing its recency."""
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                slides = pickle.load(f)
+            os.utime(path)
+            return slides
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable extraction cache entry {path.name}: {str(e)}")
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                return None
+            with self._lock:
+                self._disk_bytes = max(0, self._disk_bytes - size)
+            return None
+
+    def _write_disk(self, key: str, slides: List[Any]) -> None:
+        """Write an entry atomically so concurrent readers never see partial files."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(slides, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._disk_path(key))
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _disk_entries(self) -> List[tuple]:
+        """List disk entries as (path, size, mtime)."""
+        entries = []
+        if not self.disk_dir.exists():
+            return entries
+        for path in self.disk_dir.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used disk entries until under the size limit and record the disk size."""
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+
+        for path, size, _ in entries:
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            with self._lock:
+                self._stats["evictions"] += 1
+            logger.debug(f"Evicted extraction cache entry {path.name}")
+
+        with self._lock:
+            self._disk_bytes = total
+
+
+# Example usage
+if __name__ == "__main__":
+    import io
+
+    cache = ExtractionCache()
+    key = cache.make_key(io.BytesIO(b"deck bytes"), {"min_table_rows": 2})
+    print(f"Key: {key}")
+    print(f"Lookup: {cache.get(key)}")
+    print(f"Stats: {cache.get_stats()}")
@@ -4,27 +4,42 @@ PowerPoint file parsing module.
 Handles opening and reading PowerPoint presentations (.ppt and .pptx files).
 """
 
+import hashlib
+import json
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Union
 
 from pptx import Presentation
 from pptx.presentation import Presentation as PresentationType
 
 from modules.logger import get_logger
 from modules.config_manager import get_config
+from modules.ooxml_reader import RT_CHART, RT_OLE_OBJECT, RT_PACKAGE, OOXMLPresentation, OOXMLSlide
 
 logger = get_logger(__name__)
 config = get_config()
 
+# Parts a slide references whose content ends up in its SlideContent
+_CONTENT_PART_TYPES = (RT_CHART, RT_PACKAGE, RT_OLE_OBJECT)
+
 
 class FileParser:
     """Handles PowerPoint file parsing and validation."""
 
     def __init__(self):
         """Initialize file parser with configuration."""
-        self.max_file_size_mb = config.get("app.max_file_size_mb", 5)
         self.supported_formats = config.get("app.supported_formats", [".ppt", ".pptx"])
-        logger.info(f"FileParser initialized with max size: {self.max_file_size_mb}MB")
+        self.reader_mode = config.get("app.reader_mode", "full")
+
+        # The lightweight reader never loads media, so it can take larger decks
+        if self.reader_mode == "lightweight":
+            self.max_file_size_mb = config.get("app.lightweight_max_file_size_mb", 200)
+        else:
+            self.max_file_size_mb = config.get("app.max_file_size_mb", 5)
+        logger.info(
+            f"FileParser initialized with max size: {self.max_file_size_mb}MB, "
+            f"reader mode: {self.reader_mode}"
+        )
 
     def validate_file(self, file_path: str) -> tuple[bool, Optional[str]]:
         """
@@ -103,7 +118,25 @@ class FileParser:
             logger.error(error_msg, exc_info=True)
             return False, error_msg
 
-    def parse_presentation(self, file_path: str) -> Optional[PresentationType]:
+    def _open_presentation(self, source) -> Union[PresentationType, OOXMLPresentation]:
+        """
+        Open a presentation with the configured reader.
+
+        In "lightweight" mode only slide XML is read from the package, so
+        images, media and fonts are never loaded. Both readers are accepted
+        by ContentExtractor and produce the same SlideContent objects.
+
+        Args:
+            source: File path or binary file-like object
+
+        Returns:
+            python-pptx Presentation ("full") or OOXMLPresentation ("lightweight")
+        """
+        if self.reader_mode == "lightweight":
+            return OOXMLPresentation(source)
+        return Presentation(source)
+
+    def parse_presentation(self, file_path: str) -> Optional[Union[PresentationType, OOXMLPresentation]]:
         """
         Parse PowerPoint presentation file.
 
@@ -124,7 +157,7 @@ class FileParser:
                 raise ValueError(error_msg)
 
             logger.info(f"Parsing presentation: {file_path}")
-            presentation = Presentation(file_path)
+            presentation = self._open_presentation(file_path)
 
             slide_count = len(presentation.slides)
             logger.info(f"Successfully parsed presentation with {slide_count} slides")
@@ -139,7 +172,7 @@ class FileParser:
             logger.error(f"Error parsing presentation: {str(e)}", exc_info=True)
             raise ValueError(f"Failed to parse PowerPoint file: {str(e)}")
 
-    def parse_uploaded_presentation(self, uploaded_file) -> Optional[PresentationType]:
+    def parse_uploaded_presentation(self, uploaded_file) -> Optional[Union[PresentationType, OOXMLPresentation]]:
         """
         Parse PowerPoint presentation from Streamlit uploaded file.
 
@@ -158,7 +191,7 @@ class FileParser:
             logger.info(f"Parsing uploaded presentation: {uploaded_file.name}")
 
             # Read file content and parse
-            presentation = Presentation(uploaded_file)
+            presentation = self._open_presentation(uploaded_file)
 
             slide_count = len(presentation.slides)
             logger.info(f"Successfully parsed uploaded presentation with {slide_count} slides")
@@ -169,7 +202,7 @@ class FileParser:
             logger.error(f"Error parsing uploaded presentation: {str(e)}", exc_info=True)
             raise ValueError(f"Failed to parse PowerPoint file: {str(e)}")
 
-    def get_slide_count(self, presentation: PresentationType) -> int:
+    def get_slide_count(self, presentation: Union[PresentationType, OOXMLPresentation]) -> int:
         """
         Get number of slides in presentation.
 
@@ -187,6 +220,79 @@ class FileParser:
             logger.error(f"Error getting slide count: {str(e)}")
             return 0
 
+    def slide_fingerprints(
+            self,
+            presentation: Union[PresentationType, OOXMLPresentation],
+            source=None
+    ) -> List[Optional[str]]:
+        """
+        Fingerprint each slide by the package parts its content comes from.
+
+        A fingerprint hashes the slide XML, the chart and embedded object
+        parts the slide references, and the scheme colors of its master, so
+        it stays the same across re-uploads unless that slide was edited.
+
+        The raw part bytes are hashed for both readers. python-pptx keeps
+        only re-serialized XML, so for its presentations the slide, chart
+        and embedded parts are read again from the source package (media
+        is never decompressed).
+
+        Args:
+            presentation: Presentation object
+            source: File path or binary file-like object the presentation
+                was opened from (required for python-pptx presentations)
+
+        Returns:
+            Hex SHA-256 digest per slide in slide order (None for slides
+            that could not be read)
+
+        Raises:
+            ValueError: If a python-pptx presentation is given without its source
+        """
+        package = presentation
+        if not isinstance(presentation, OOXMLPresentation):
+            if source is None:
+                raise ValueError("The source package is required to fingerprint a python-pptx presentation")
+            package = OOXMLPresentation(source)
+
+        fingerprints = []
+        try:
+            for idx, slide in enumerate(package.slides, start=1):
+                try:
+                    fingerprints.append(self._slide_fingerprint(slide))
+                except Exception as e:
+                    logger.warning(f"Could not fingerprint slide {idx}: {str(e)}")
+                    fingerprints.append(None)
+        finally:
+            if package is not presentation:
+                package.close()
+
+        return fingerprints
+
+    def _slide_fingerprint(self, slide: OOXMLSlide) -> str:
+        """
+        Hash one slide's XML, referenced content parts and scheme colors.
+
+        Args:
+            slide: Slide of the package
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256()
+        digest.update(slide.blob)
+
+        related = sorted(
+            target for rel_type, target in slide.rels.values()
+            if rel_type in _CONTENT_PART_TYPES and slide.package.has_part(target)
+        )
+        for partname in related:
+            digest.update(partname.encode("utf-8"))
+            digest.update(slide.package.read_part(partname))
+
+        digest.update(json.dumps(sorted(slide.theme_colors.items())).encode("utf-8"))
+        return digest.hexdigest()
+
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,139 @@
+"""
+LLM health monitor module.
+
+Checks the Groq API in a background thread so application startup never
+waits on the network, and keeps the latest status for the UI.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from modules.logger import get_logger
+from modules.config_manager import get_config
+
+logger = get_logger(__name__)
+config = get_config()
+
+# Health states shown by the UI
+HEALTH_CHECKING = "checking"
+HEALTH_OK = "healthy"
+HEALTH_DEGRADED = "degraded"
+HEALTH_UNAVAILABLE = "unavailable"
+
+
+@dataclass
+class HealthStatus:
+    """Latest result of an LLM health check."""
+    state: str = HEALTH_CHECKING
+    latency_ms: Optional[float] = None
+    checked_at: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def available(self) -> bool:
+        """Whether summaries can be requested (slow but reachable counts)."""
+        return self.state in (HEALTH_OK, HEALTH_DEGRADED)
+
+
+class LLMHealthMonitor:
+    """Periodically probes the LLM service in a daemon thread."""
+
+    def __init__(self, llm_service=None, init_error: Optional[str] = None):
+        """
+        Initialize health monitor with configuration.
+
+        Args:
+            llm_service: LLMService instance, or None if it failed to initialize
+            init_error: Initialization error to report when llm_service is None
+        """
+        self.llm_service = llm_service
+        self.interval = config.get("llm.health_check.interval_seconds", 300)
+        self.slow_ms = config.get("llm.health_check.slow_ms", 3000)
+
+        self._status = HealthStatus()
+        if llm_service is None:
+            self._status = HealthStatus(
+                state=HEALTH_UNAVAILABLE,
+                checked_at=time.time(),
+                error=init_error or "LLM service is not configured"
+            )
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        logger.info(f"LLMHealthMonitor initialized (interval={self.interval}s)")
+
+    def start(self) -> None:
+        """Start background checks (no-op without a service or if already running)."""
+        if self.llm_service is None or self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._run, name="llm-health-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background checks."""
+        self._stop.set()
+        self._wake.set()
+
+    def request_check(self) -> None:
+        """Ask the background thread to re-check now instead of at the next interval."""
+        self._wake.set()
+
+    def get_status(self) -> HealthStatus:
+        """
+        Get the cached health status without touching the network.
+
+        Returns:
+            Copy of the latest HealthStatus
+        """
+        with self._lock:
+            return replace(self._status)
+
+    def check(self) -> HealthStatus:
+        """
+        Probe the LLM service once and cache the result.
+
+        The probe also warms the HTTP connection pools, so the first summary
+        request skips the TLS handshake.
+
+        Returns:
+            New HealthStatus
+        """
+        if self.llm_service is None:
+            return self.get_status()
+
+        started = time.perf_counter()
+        try:
+            self.llm_service.warm_up()
+            latency_ms = (time.perf_counter() - started) * 1000
+            state = HEALTH_OK if latency_ms <= self.slow_ms else HEALTH_DEGRADED
+            status = HealthStatus(state=state, latency_ms=latency_ms, checked_at=time.time())
+            logger.info(f"LLM health check: {state} ({latency_ms:.0f}ms)")
+
+        except Exception as e:
+            status = HealthStatus(state=HEALTH_UNAVAILABLE, checked_at=time.time(), error=str(e))
+            logger.warning(f"LLM health check failed: {str(e)}")
+
+        with self._lock:
+            self._status = status
+        return replace(status)
+
+    def _run(self) -> None:
+        """Check, then wait for the interval or an explicit re-check request."""
+        while not self._stop.is_set():
+            self.check()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+
+# Example usage
+if __name__ == "__main__":
+    from modules.llm_service import LLMService
+
+    monitor = LLMHealthMonitor(LLMService())
+    print(f"Status: {monitor.check()}")
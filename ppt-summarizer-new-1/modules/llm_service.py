@@ -4,19 +4,54 @@ LLM service module for table summarization using Groq.
 Handles API calls to Groq LLM with retry logic and error handling.
 """
 
+import asyncio
+import json
+import queue
+import re
+import threading
 import time
+from concurrent.futures import CancelledError as FutureCancelledError
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Tuple, Union
 
-from groq import Groq, AsyncGroq
+from groq import Groq, AsyncGroq, DefaultHttpxClient, DefaultAsyncHttpxClient
 from groq import RateLimitError, APITimeoutError, APIError
 
 from modules.logger import get_logger
 from modules.config_manager import get_config
+from modules.rate_limiter import get_rate_limiter, server_retry_delay
+from modules.summary_cache import SummaryCache
+from modules.table_serializers import estimate_tokens, table_encoding_for
+from modules.prompt_budget import table_budget_for
+from modules.single_flight import SingleFlight
 
 logger = get_logger(__name__)
 config = get_config()
 
+# Map step of map-reduce summaries; the reduce step uses the regular prompt template
+DEFAULT_CHUNK_TEMPLATE = (
+    "The data below is one part of a table from a quarterly loan forecasting report that is too large "
+    "to analyze at once (or partial summaries of such parts). List, as terse bullet points, the facts a "
+    "summary of the whole table needs from this part: Loan Default Rate (%) and Net Rate (%) levels and "
+    "trends per segment, negative values, bold (**) entries, outliers and abrupt changes. Quote figures "
+    "exactly and do not speculate about rows that are not shown.\n\n{table_data}"
+)
+
+_REDUCE_INTRO = (
+    "The table was too large for a single request, so it was analyzed in {parts} parts by row group. "
+    "Summarize the whole table from these partial findings:"
+)
+
+# Packed requests: several small tables share one prompt and are answered as JSON
+_PACK_INSTRUCTION = (
+    "The data above holds {count} separate tables, each introduced by a \"### Table <id>\" line. "
+    "Analyze every table on its own. Respond with only a JSON object that maps each table id "
+    "({ids}) to a list of bullet point strings following the output format above."
+)
+
+# Leading bullet markers stripped from packed-response bullets
+_BULLET_MARKER = re.compile(r"^\s*(?:[-*•]\s+)")
+
 
 class LLMService:
     """Service for generating table summaries using Groq LLM."""
@@ -30,19 +65,73 @@ class LLMService:
         self.timeout = config.get("llm.timeout_seconds", 30)
         self.max_retries = config.get("llm.max_retries", 3)
         self.retry_delay = config.get("llm.retry_delay_seconds", 2)
+        self.batch_concurrency = max(1, config.get("llm.batch_concurrency", 4))
+        self.base_url = config.get("llm.base_url")
+        self.stream = config.get("llm.stream", True)
+        # Prompt encoding of table data for this model (SlideContent.encoded_tables)
+        self.table_encoding = table_encoding_for(self.model_name)
+        # Token budget per table; larger tables are trimmed or summarized
+        # with map-reduce (SlideContent.prompt_tables)
+        self.table_budget = table_budget_for(self.model_name)
+        self.max_chunks = (
+            config.get("llm.map_reduce.max_chunks", 16) if config.get("llm.map_reduce.enabled", True) else 0
+        )
+        self.chunk_max_tokens = config.get("llm.map_reduce.chunk_max_tokens", 400)
+        self.chunk_template = config.get("prompts.chunk_template", DEFAULT_CHUNK_TEMPLATE)
+        # Deck-wide summaries pack small tables into shared requests
+        self.pack_max_tables = (
+            config.get("llm.table_packing.max_tables", 4) if config.get("llm.table_packing.enabled", True) else 1
+        )
+        self.pack_max_tokens = config.get("llm.table_packing.max_tokens", self.table_budget or 3000)
+        self.pack_max_completion = config.get("llm.table_packing.max_completion_tokens", 2048)
+
+        # Background event loop that owns the async client's connections
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
 
         # Load prompt template
         self.prompt_template = self._load_prompt_template()
 
+        # Persistent summary cache shared by all sessions
+        self.summary_cache = SummaryCache()
+
+        # Concurrent identical requests (e.g. two analysts summarizing the
+        # same table) share one API call
+        self.in_flight = SingleFlight()
+
         # Initialize clients
         if not self.api_key:
             logger.error("GROQ_API_KEY not found in configuration")
             raise ValueError("GROQ_API_KEY must be set in environment or config")
 
-        self.client = Groq(api_key=self.api_key, timeout=self.timeout)
-        self.async_client = AsyncGroq(api_key=self.api_key, timeout=self.timeout)
+        # Every request acquires from the shared limiter; responses feed its
+        # rate-limit headers back through httpx event hooks. The SDK's own
+        # retries are off so every retry (and its wait) goes through the limiter
+        self.rate_limiter = get_rate_limiter()
 
-        logger.info(f"LLMService initialized with model: {self.model_name}")
+        self.client = Groq(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            timeout=self.timeout,
+            max_retries=0,
+            http_client=DefaultHttpxClient(
+                event_hooks={"response": [self.rate_limiter.observe_response]}
+            )
+        )
+        self.async_client = AsyncGroq(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            timeout=self.timeout,
+            max_retries=0,
+            http_client=DefaultAsyncHttpxClient(
+                event_hooks={"response": [self.rate_limiter.observe_response_async]}
+            )
+        )
+
+        logger.info(
+            f"LLMService initialized with model: {self.model_name} "
+            f"(table encoding: {self.table_encoding}, table budget: {self.table_budget})"
+        )
 
     def _load_prompt_template(self) -> str:
         """
@@ -72,6 +161,98 @@ class LLMService:
             logger.error(f"Error loading prompt template: {str(e)}")
             raise
 
+    def _cache_identity(
+            self,
+            prompt: str,
+            system_role: str,
+            template: Optional[str] = None,
+            max_tokens: Optional[int] = None
+    ) -> Tuple[str, str]:
+        """
+        Get the summary cache key and prompt version for a request.
+
+        The prompt version hashes the template and system role, so editing
+        either one invalidates earlier entries.
+
+        Args:
+            prompt: Rendered user prompt
+            system_role: System role message
+            template: Template the prompt was rendered from (defaults to the summary template)
+            max_tokens: Completion limit (defaults to llm.max_tokens)
+
+        Returns:
+            Tuple of (cache key, prompt version)
+        """
+        prompt_version = SummaryCache.prompt_version(template or self.prompt_template, system_role)
+        cache_key = SummaryCache.make_key(
+            self.model_name, self.temperature, self.max_tokens if max_tokens is None else max_tokens,
+            prompt, prompt_version
+        )
+        return cache_key, prompt_version
+
+    def _summary_identity(self, table_data: str) -> Tuple[str, str]:
+        """
+        Get the cache key and prompt version of a single-table summary.
+
+        These match generate_summary and generate_summary_async, so summaries
+        from packed requests are shared with per-table requests.
+
+        Args:
+            table_data: Formatted table data as string
+
+        Returns:
+            Tuple of (cache key, prompt version)
+        """
+        prompt = self.prompt_template.format(table_data=table_data)
+        system_role = config.get(
+            "prompts.system_role",
+            "You are a financial analyst expert."
+        )
+        return self._cache_identity(prompt, system_role)
+
+    def _estimate_request_tokens(self, *messages: str, max_tokens: Optional[int] = None) -> int:
+        """
+        Estimate the tokens a request counts against the per-minute quota.
+
+        Args:
+            *messages: Message contents sent with the request
+            max_tokens: Completion limit (defaults to llm.max_tokens)
+
+        Returns:
+            Rough prompt token count (about 4 characters per token) plus the completion limit
+        """
+        prompt_chars = sum(len(message) for message in messages)
+        return prompt_chars // 4 + 1 + (self.max_tokens if max_tokens is None else max_tokens)
+
+    def _rate_limit_wait(self, error: RateLimitError, retry_count: int) -> float:
+        """
+        Extra delay before retrying a 429, on top of the rate limiter.
+
+        When the response carried retry-after or an exhausted quota's reset
+        header, the limiter was already held for that long by its response
+        hook, so the retry goes straight back through acquire(). Without
+        such a header (or with the limiter disabled) this falls back to
+        exponential backoff or the server's delay.
+
+        Args:
+            error: Rate limit error from the Groq client
+            retry_count: Current retry attempt
+
+        Returns:
+            Seconds to sleep before acquiring again
+        """
+        response = getattr(error, "response", None)
+        delay = server_retry_delay(response.headers) if response is not None else None
+        if delay is None:
+            return self.retry_delay * (2 ** retry_count)
+        return 0.0 if self.rate_limiter.enabled else delay
+
+    def _settle_tokens(self, reserved_tokens: int, response) -> None:
+        """Return the unused part of a token reservation using the response usage."""
+        used_tokens = getattr(getattr(response, 'usage', None), 'total_tokens', None)
+        if isinstance(used_tokens, int):
+            self.rate_limiter.settle(reserved_tokens, used_tokens)
+
     def generate_summary(self, table_data: str, retry_count: int = 0) -> Optional[str]:
         """
         Generate summary for table data using Groq LLM.
@@ -86,18 +267,59 @@ class LLMService:
         Raises:
             Exception: If all retries fail
         """
-        try:
-            # Prepare prompt
-            prompt = self.prompt_template.format(table_data=table_data)
-            system_role = config.get(
-                "prompts.system_role",
-                "You are a financial analyst expert."
-            )
+        # Prepare prompt
+        prompt = self.prompt_template.format(table_data=table_data)
+        system_role = config.get(
+            "prompts.system_role",
+            "You are a financial analyst expert."
+        )
 
+        cache_key, prompt_version = self._cache_identity(prompt, system_role)
+        if retry_count > 0:
+            return self._request_summary(prompt, system_role, cache_key, prompt_version, retry_count)
+
+        cached_summary = self.summary_cache.get(cache_key)
+        if cached_summary is not None:
+            logger.info("Returning cached summary")
+            return cached_summary
+
+        # Identical requests already in flight share that call's result
+        return self.in_flight.do(
+            cache_key, lambda: self._request_summary(prompt, system_role, cache_key, prompt_version)
+        )
+
+    def _request_summary(
+            self,
+            prompt: str,
+            system_role: str,
+            cache_key: str,
+            prompt_version: str,
+            retry_count: int = 0
+    ) -> Optional[str]:
+        """
+        Call the Groq API for a summary, retrying with backoff, and cache it.
+
+        Args:
+            prompt: Rendered user prompt
+            system_role: System role message
+            cache_key: Summary cache key of the request
+            prompt_version: Prompt version stored with the cache entry
+            retry_count: Current retry attempt
+
+        Returns:
+            Generated summary
+
+        Raises:
+            Exception: If all retries fail
+        """
+        try:
             logger.info("Generating table summary with Groq LLM")
             logger.debug(f"Using model: {self.model_name}, temperature: {self.temperature}")
 
-            # Call Groq API
+            # Wait for quota, then call Groq API
+            reserved_tokens = self._estimate_request_tokens(system_role, prompt)
+            self.rate_limiter.acquire(reserved_tokens)
+
             response = self.client.chat.completions.create(
                 model=self.model_name,
                 messages=[
@@ -108,6 +330,8 @@ class LLMService:
                 max_tokens=self.max_tokens,
             )
 
+            self._settle_tokens(reserved_tokens, response)
+
             # Extract summary
             summary = response.choices[0].message.content
 
@@ -123,16 +347,19 @@ class LLMService:
             logger.info(summary)
             logger.info("\n")
 
+            self.summary_cache.put(cache_key, summary, self.model_name, prompt_version)
+
             logger.info("Successfully generated summary")
             return summary
 
         except RateLimitError as e:
             logger.warning(f"Rate limit error: {str(e)}")
             if retry_count < self.max_retries:
-                wait_time = self.retry_delay * (2 ** retry_count)  # Exponential backoff
+                wait_time = self._rate_limit_wait(e, retry_count)
                 logger.info(f"Retrying after {wait_time} seconds (attempt {retry_count + 1}/{self.max_retries})")
-                time.sleep(wait_time)
-                return self.generate_summary(table_data, retry_count + 1)
+                if wait_time:
+                    time.sleep(wait_time)
+                return self._request_summary(prompt, system_role, cache_key, prompt_version, retry_count + 1)
             else:
                 logger.error("Max retries exceeded for rate limit")
                 raise
@@ -143,7 +370,7 @@ class LLMService:
                 wait_time = self.retry_delay
                 logger.info(f"Retrying after {wait_time} seconds (attempt {retry_count + 1}/{self.max_retries})")
                 time.sleep(wait_time)
-                return self.generate_summary(table_data, retry_count + 1)
+                return self._request_summary(prompt, system_role, cache_key, prompt_version, retry_count + 1)
             else:
                 logger.error("Max retries exceeded for timeout")
                 raise
@@ -154,7 +381,7 @@ class LLMService:
                 wait_time = self.retry_delay
                 logger.info(f"Retrying after {wait_time} seconds (attempt {retry_count + 1}/{self.max_retries})")
                 time.sleep(wait_time)
-                return self.generate_summary(table_data, retry_count + 1)
+                return self._request_summary(prompt, system_role, cache_key, prompt_version, retry_count + 1)
             else:
                 logger.error("Max retries exceeded for API error")
                 raise
@@ -163,6 +390,153 @@ class LLMService:
             logger.error(f"Unexpected error generating summary: {str(e)}", exc_info=True)
             raise
 
+    def generate_summary_stream(self, table_data: str) -> Iterator[str]:
+        """
+        Generate a summary as a stream of text deltas.
+
+        Opening the stream is retried like generate_summary; errors after the
+        first delta are raised to the caller. The complete text is written to
+        the summary cache when the stream finishes. Cached summaries, and
+        summaries of an identical request already in flight, are yielded as a
+        single delta.
+
+        Args:
+            table_data: Formatted table data as string
+
+        Yields:
+            Text deltas in arrival order
+        """
+        prompt = self.prompt_template.format(table_data=table_data)
+        system_role = config.get(
+            "prompts.system_role",
+            "You are a financial analyst expert."
+        )
+
+        cache_key, prompt_version = self._cache_identity(prompt, system_role)
+        cached_summary = self.summary_cache.get(cache_key)
+        if cached_summary is not None:
+            logger.info("Returning cached summary")
+            yield cached_summary
+            return
+
+        # Join an identical request already in flight, or lead a new one; a
+        # follower yields the leader's complete text as a single delta
+        while True:
+            future, leader = self.in_flight.join(cache_key)
+            if leader:
+                break
+            logger.info("Waiting for an identical in-flight request")
+            try:
+                summary = future.result()
+            except FutureCancelledError:
+                logger.info("In-flight request was cancelled; retrying")
+                continue
+            yield summary
+            return
+
+        try:
+            summary = yield from self._stream_summary(system_role, prompt)
+        except Exception as e:
+            self.in_flight.finish(cache_key, future, error=e)
+            raise
+        except BaseException:
+            # Closed early (e.g. the page reran mid-stream): followers start over
+            self.in_flight.cancel(cache_key, future)
+            raise
+
+        self.summary_cache.put(cache_key, summary, self.model_name, prompt_version)
+        self.in_flight.finish(cache_key, future, summary)
+
+    def _stream_summary(self, system_role: str, prompt: str) -> Iterator[str]:
+        """
+        Stream one completion, yielding its deltas.
+
+        Args:
+            system_role: System role message
+            prompt: Rendered user prompt
+
+        Yields:
+            Text deltas in arrival order
+
+        Returns:
+            The complete text
+        """
+        logger.info("Streaming table summary with Groq LLM")
+
+        reserved_tokens = self._estimate_request_tokens(system_role, prompt)
+        stream = self._open_stream(system_role, prompt, reserved_tokens)
+
+        parts = []
+        used_tokens = None
+        started = time.perf_counter()
+
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    if not parts:
+                        logger.info(f"Time to first token: {time.perf_counter() - started:.2f}s")
+                    parts.append(delta)
+                    yield delta
+
+            usage = getattr(getattr(chunk, 'x_groq', None), 'usage', None)
+            if usage is not None:
+                used_tokens = usage.total_tokens
+
+        if isinstance(used_tokens, int):
+            self.rate_limiter.settle(reserved_tokens, used_tokens)
+
+        summary = "".join(parts)
+        logger.info(f"Streamed summary complete in {time.perf_counter() - started:.2f}s")
+        return summary
+
+    def _open_stream(self, system_role: str, prompt: str, reserved_tokens: int):
+        """
+        Open a streaming chat completion with the usual retry and backoff.
+
+        Args:
+            system_role: System role message
+            prompt: Rendered user prompt
+            reserved_tokens: Tokens to acquire from the rate limiter per attempt
+
+        Returns:
+            Groq stream of ChatCompletionChunk objects
+
+        Raises:
+            Exception: If all retries fail
+        """
+        retry_count = 0
+        while True:
+            try:
+                self.rate_limiter.acquire(reserved_tokens)
+                return self.client.chat.completions.create(
+                    model=self.model_name,
+                    messages=[
+                        {"role": "system", "content": system_role},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    stream=True,
+                )
+
+            except (RateLimitError, APITimeoutError, APIError) as e:
+                logger.warning(f"API error (stream): {str(e)}")
+                if retry_count >= self.max_retries:
+                    logger.error("Max retries exceeded for streaming summary")
+                    raise
+
+                # The limiter paces rate-limit retries, fixed delay otherwise
+                if isinstance(e, RateLimitError):
+                    wait_time = self._rate_limit_wait(e, retry_count)
+                else:
+                    wait_time = self.retry_delay
+
+            logger.info(f"Retrying after {wait_time} seconds (attempt {retry_count + 1}/{self.max_retries})")
+            if wait_time:
+                time.sleep(wait_time)
+            retry_count += 1
+
     async def generate_summary_async(self, table_data: str, retry_count: int = 0) -> Optional[str]:
         """
         Generate summary asynchronously for table data using Groq LLM.
@@ -174,17 +548,86 @@ class LLMService:
         Returns:
             Generated summary or None if failed
         """
-        try:
-            # Prepare prompt
-            prompt = self.prompt_template.format(table_data=table_data)
-            system_role = config.get(
-                "prompts.system_role",
-                "You are a financial analyst expert."
-            )
+        prompt = self.prompt_template.format(table_data=table_data)
+        return await self._complete_async(prompt, self.prompt_template, retry_count=retry_count)
+
+    async def _complete_async(
+            self,
+            prompt: str,
+            template: str,
+            max_tokens: Optional[int] = None,
+            retry_count: int = 0,
+            json_mode: bool = False,
+            accept: Optional[Callable[[str], bool]] = None
+    ) -> Optional[str]:
+        """
+        Run one cached chat completion through the async client.
+
+        Args:
+            prompt: Rendered user prompt
+            template: Template the prompt was rendered from (part of the cache key)
+            max_tokens: Completion limit (defaults to llm.max_tokens)
+            retry_count: Current retry attempt (for internal use)
+            json_mode: Ask the API for a JSON object response
+            accept: Check a response must pass to be cached
+
+        Returns:
+            Completion text
+        """
+        max_tokens = self.max_tokens if max_tokens is None else max_tokens
+        system_role = config.get(
+            "prompts.system_role",
+            "You are a financial analyst expert."
+        )
+
+        cache_key, prompt_version = self._cache_identity(prompt, system_role, template, max_tokens)
+        request = (prompt, system_role, cache_key, prompt_version, max_tokens, json_mode, accept)
+        if retry_count > 0:
+            return await self._request_async(*request, retry_count)
+
+        cached_summary = self.summary_cache.get(cache_key)
+        if cached_summary is not None:
+            logger.info("Returning cached summary")
+            return cached_summary
 
+        # Shares the in-flight table with generate_summary, so sync and async
+        # callers of the same prompt coalesce too
+        return await self.in_flight.do_async(cache_key, lambda: self._request_async(*request))
+
+    async def _request_async(
+            self,
+            prompt: str,
+            system_role: str,
+            cache_key: str,
+            prompt_version: str,
+            max_tokens: int,
+            json_mode: bool = False,
+            accept: Optional[Callable[[str], bool]] = None,
+            retry_count: int = 0
+    ) -> Optional[str]:
+        """
+        Call the Groq API through the async client, retrying with backoff, and cache the result.
+
+        Args:
+            prompt: Rendered user prompt
+            system_role: System role message
+            cache_key: Summary cache key of the request
+            prompt_version: Prompt version stored with the cache entry
+            max_tokens: Completion limit
+            json_mode: Ask the API for a JSON object response
+            accept: Check a response must pass to be cached
+            retry_count: Current retry attempt
+
+        Returns:
+            Completion text
+        """
+        try:
             logger.info("Generating table summary asynchronously with Groq LLM")
 
-            # Call Groq API asynchronously
+            # Wait for quota, then call Groq API asynchronously
+            reserved_tokens = self._estimate_request_tokens(system_role, prompt, max_tokens=max_tokens)
+            await self.rate_limiter.acquire_async(reserved_tokens)
+
             response = await self.async_client.chat.completions.create(
                 model=self.model_name,
                 messages=[
@@ -192,25 +635,38 @@ class LLMService:
                     {"role": "user", "content": prompt}
                 ],
                 temperature=self.temperature,
-                max_tokens=self.max_tokens,
+                max_tokens=max_tokens,
+                **({"response_format": {"type": "json_object"}} if json_mode else {})
             )
 
+            self._settle_tokens(reserved_tokens, response)
+
             # Extract summary
             summary = response.choices[0].message.content
 
             logger.info("\n LLM Response: \n")
             logger.info(summary)
             logger.info("\n")
+
+            if accept is None or accept(summary):
+                self.summary_cache.put(cache_key, summary, self.model_name, prompt_version)
+
             logger.info("Successfully generated async summary")
             return summary
 
         except (RateLimitError, APITimeoutError, APIError) as e:
             logger.warning(f"API error (async): {str(e)}")
             if retry_count < self.max_retries:
-                wait_time = self.retry_delay * (2 ** retry_count)
+                if isinstance(e, RateLimitError):
+                    wait_time = self._rate_limit_wait(e, retry_count)
+                else:
+                    wait_time = self.retry_delay * (2 ** retry_count)
                 logger.info(f"Retrying after {wait_time} seconds (attempt {retry_count + 1}/{self.max_retries})")
-                await self._async_sleep(wait_time)
-                return await self.generate_summary_async(table_data, retry_count + 1)
+                if wait_time:
+                    await self._async_sleep(wait_time)
+                return await self._request_async(
+                    prompt, system_role, cache_key, prompt_version, max_tokens, json_mode, accept, retry_count + 1
+                )
             else:
                 logger.error("Max retries exceeded")
                 raise
@@ -219,11 +675,387 @@ class LLMService:
             logger.error(f"Unexpected error in async summary: {str(e)}", exc_info=True)
             raise
 
+    async def map_chunks_async(self, chunks: List[str], semaphore: Optional[asyncio.Semaphore] = None) -> str:
+        """
+        Map step of a map-reduce summary: summarize table chunks concurrently.
+
+        Each chunk is its own cached request, so re-running a table only
+        sends the chunks whose rows changed. Partial summaries that together
+        exceed the table budget are condensed again in groups.
+
+        Args:
+            chunks: Row-group chunks of one table (TableFit.chunks)
+            semaphore: Limits requests in flight (a new llm.batch_concurrency
+                semaphore if None)
+
+        Returns:
+            Table data for the reduce prompt: the partial summaries in chunk order
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def summarize_chunk(chunk: str) -> str:
+            async with semaphore:
+                prompt = self.chunk_template.format(table_data=chunk)
+                return await self._complete_async(prompt, self.chunk_template, self.chunk_max_tokens) or ""
+
+        logger.info(f"Summarizing {len(chunks)} table chunks")
+        summaries = await asyncio.gather(*(summarize_chunk(chunk) for chunk in chunks))
+        reduce_input = self._reduce_input(summaries)
+
+        if len(summaries) > 2 and self.table_budget and estimate_tokens(reduce_input) > self.table_budget:
+            groups = self._group_summaries(summaries)
+            logger.info(f"Condensing {len(summaries)} partial summaries in {len(groups)} groups")
+            return await self.map_chunks_async(groups, semaphore)
+
+        return reduce_input
+
+    async def generate_summary_hierarchical_async(
+            self,
+            chunks: List[str],
+            semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Optional[str]:
+        """
+        Summarize a table too large for one request with map-reduce.
+
+        Chunks are summarized concurrently (map), then the regular prompt
+        template runs over the partial summaries (reduce). Every request
+        uses the usual cache, rate limiter, retries and backoff.
+
+        Args:
+            chunks: Row-group chunks of one table (TableFit.chunks)
+            semaphore: Limits requests in flight (a new llm.batch_concurrency
+                semaphore if None)
+
+        Returns:
+            Generated summary or None if failed
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.batch_concurrency)
+        reduce_input = await self.map_chunks_async(chunks, semaphore)
+        async with semaphore:
+            return await self.generate_summary_async(reduce_input)
+
+    def generate_summary_hierarchical(self, chunks: List[str]) -> Optional[str]:
+        """
+        Summarize a table too large for one request with map-reduce (blocking).
+
+        Args:
+            chunks: Row-group chunks of one table (TableFit.chunks)
+
+        Returns:
+            Generated summary or None if failed
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.generate_summary_hierarchical_async(chunks), self._event_loop()
+        )
+        return future.result()
+
+    def map_chunks(self, chunks: List[str]) -> str:
+        """
+        Run the map step on the background loop, e.g. before streaming the reduce step.
+
+        Args:
+            chunks: Row-group chunks of one table (TableFit.chunks)
+
+        Returns:
+            Table data for the reduce prompt
+        """
+        return asyncio.run_coroutine_threadsafe(self.map_chunks_async(chunks), self._event_loop()).result()
+
+    @staticmethod
+    def _reduce_input(summaries: List[str]) -> str:
+        """Partial summaries laid out as the table data of the reduce prompt."""
+        parts = "\n\n".join(
+            f"### Part {part} of {len(summaries)}\n{summary.strip()}"
+            for part, summary in enumerate(summaries, 1)
+        )
+        return f"{_REDUCE_INTRO.format(parts=len(summaries))}\n\n{parts}"
+
+    def _group_summaries(self, summaries: List[str]) -> List[str]:
+        """Pack consecutive partial summaries into groups within the table budget (at least two per group)."""
+        groups: List[List[str]] = [[]]
+        for summary in summaries:
+            candidate = groups[-1] + [summary]
+            if len(groups[-1]) >= 2 and estimate_tokens(self._reduce_input(candidate)) > self.table_budget:
+                groups.append([summary])
+            else:
+                groups[-1] = candidate
+        return [self._reduce_input(group) for group in groups]
+
+    async def summarize_pack_async(self, pack: List[Tuple[Hashable, str]]) -> Optional[Dict[Hashable, str]]:
+        """
+        Summarize several small tables in one request that returns JSON.
+
+        The prompt template (and its few-shot examples) is sent once for the
+        whole pack; each table is labeled with an id derived from its key.
+        Each table's summary is cached under its single-table cache key.
+
+        Args:
+            pack: List of (key, formatted table text) pairs
+
+        Returns:
+            Dictionary of key -> bullet-list summary, or None if the response
+            is not a JSON object with a bullet list for every table
+        """
+        ids = [self._pack_id(key, position) for position, (key, _) in enumerate(pack, 1)]
+        table_data = "\n\n".join(
+            f"### Table {table_id}\n{text}" for table_id, (_, text) in zip(ids, pack)
+        )
+        prompt = (
+            self.prompt_template.format(table_data=table_data)
+            + "\n\n" + _PACK_INSTRUCTION.format(count=len(pack), ids=", ".join(ids))
+        )
+
+        logger.info(f"Summarizing {len(pack)} tables in one packed request")
+        response = await self._complete_async(
+            prompt,
+            f"{self.prompt_template}\n\n{_PACK_INSTRUCTION}",
+            max_tokens=min(self.max_tokens * len(pack), self.pack_max_completion),
+            json_mode=True,
+            accept=lambda text: self._parse_pack(text, ids) is not None
+        )
+
+        summaries = self._parse_pack(response or "", ids)
+        if summaries is None:
+            return None
+
+        results = {}
+        for table_id, (key, text) in zip(ids, pack):
+            results[key] = summaries[table_id]
+            cache_key, prompt_version = self._summary_identity(text)
+            self.summary_cache.put(cache_key, results[key], self.model_name, prompt_version)
+        return results
+
+    def _pack_tables(
+            self,
+            tables: List[Tuple[Hashable, Union[str, List[str]]]]
+    ) -> List[List[Tuple[Hashable, str]]]:
+        """
+        Group small tables, in order, into packs of at least two.
+
+        Args:
+            tables: List of (key, formatted table text or chunks) pairs
+
+        Returns:
+            Packs within llm.table_packing.max_tables and max_tokens; tables
+            left out are summarized on their own
+        """
+        if self.pack_max_tables < 2:
+            return []
+
+        packs: List[List[Tuple[Hashable, str]]] = [[]]
+        used = 0
+        for key, table_data in tables:
+            if not isinstance(table_data, str):
+                continue
+            tokens = estimate_tokens(table_data)
+            if tokens > self.pack_max_tokens // 2:
+                continue
+            if len(packs[-1]) == self.pack_max_tables or used + tokens > self.pack_max_tokens:
+                packs.append([])
+                used = 0
+            packs[-1].append((key, table_data))
+            used += tokens
+        return [pack for pack in packs if len(pack) > 1]
+
+    @staticmethod
+    def _pack_id(key: Hashable, position: int) -> str:
+        """Table id used in packed prompts: slide_<n>_table_<m> for (slide, table) keys."""
+        if isinstance(key, tuple) and len(key) == 2 and all(isinstance(part, int) for part in key):
+            return f"slide_{key[0]}_table_{key[1]}"
+        return f"table_{position}"
+
+    @staticmethod
+    def _parse_pack(text: str, ids: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Split a packed response into per-table markdown bullet lists.
+
+        Args:
+            text: Response text (a JSON object, possibly in a code fence)
+            ids: Table ids the response must cover
+
+        Returns:
+            Dictionary of table id -> summary, or None if the response is malformed
+        """
+        text = text.strip()
+        if text.startswith("```"):
+            text = text.strip("`").split("\n", 1)[-1] if "\n" in text else ""
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        summaries = {}
+        for table_id in ids:
+            value = data.get(table_id)
+            if isinstance(value, str):
+                value = [line for line in value.splitlines() if line.strip()]
+            if not isinstance(value, list) or not value or not all(isinstance(item, str) for item in value):
+                return None
+            summaries[table_id] = "\n".join(f"- {_BULLET_MARKER.sub('', item).strip()}" for item in value)
+        return summaries
+
     async def _async_sleep(self, seconds: float):
         """Async sleep helper."""
-        import asyncio
         await asyncio.sleep(seconds)
 
+    async def summarize_tables_async(
+            self,
+            tables: List[Tuple[Hashable, Union[str, List[str]]]],
+            on_result: Optional[Callable[[Hashable, Optional[str], Optional[Exception]], None]] = None
+    ) -> Dict[Hashable, Tuple[Optional[str], Optional[Exception]]]:
+        """
+        Summarize many tables concurrently through the async client.
+
+        At most ``llm.batch_concurrency`` requests are in flight at once,
+        counting the chunk requests of map-reduce summaries. Cached tables
+        are answered without a request; small uncached tables are packed
+        into shared requests (llm.table_packing), and a pack whose response
+        cannot be split per table is retried one table at a time. Tables
+        with an identical request already in flight join it instead.
+        A failing table is reported with its exception and does not affect
+        the others.
+
+        Args:
+            tables: List of (key, formatted table text) pairs; a list of
+                chunks instead of the text is summarized with map-reduce
+            on_result: Optional callback invoked as each table finishes
+
+        Returns:
+            Dictionary of key -> (summary, error)
+        """
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def summarize_one(key: Hashable, table_data: Union[str, List[str]]):
+            try:
+                if isinstance(table_data, list):
+                    return key, await self.generate_summary_hierarchical_async(table_data, semaphore), None
+                async with semaphore:
+                    return key, await self.generate_summary_async(table_data), None
+            except Exception as e:
+                logger.error(f"Batch summary failed for {key}: {str(e)}")
+                return key, None, e
+
+        async def summarize_pack(pack: List[Tuple[Hashable, str]]):
+            async with semaphore:
+                try:
+                    summaries = await self.summarize_pack_async(pack)
+                except Exception as e:
+                    logger.warning(f"Packed request failed: {str(e)}")
+                    summaries = None
+            if summaries is None:
+                logger.warning(f"Summarizing the {len(pack)} tables of a failed pack one by one")
+                return await asyncio.gather(*(summarize_one(key, text) for key, text in pack))
+            return [(key, summaries[key], None) for key, _ in pack]
+
+        results = {}
+        cached, packable = [], []
+        for key, table_data in tables:
+            if isinstance(table_data, str):
+                cache_key, _ = self._summary_identity(table_data)
+                summary = self.summary_cache.get(cache_key)
+                if summary is not None:
+                    cached.append((key, summary, None))
+                    continue
+                if self.in_flight.pending(cache_key):
+                    continue
+            packable.append((key, table_data))
+
+        packs = self._pack_tables(packable)
+        packed = {key for pack in packs for key, _ in pack} | {key for key, _, _ in cached}
+        logger.info(
+            f"Summarizing {len(tables)} tables ({len(cached)} cached, {len(packed) - len(cached)} in "
+            f"{len(packs)} packed requests) with concurrency {self.batch_concurrency}"
+        )
+
+        async def answer_cached():
+            return cached
+
+        tasks = [asyncio.ensure_future(answer_cached())] if cached else []
+        tasks += [asyncio.ensure_future(summarize_pack(pack)) for pack in packs]
+        tasks += [asyncio.ensure_future(summarize_one(key, text)) for key, text in tables if key not in packed]
+        for finished in asyncio.as_completed(tasks):
+            outcome = await finished
+            for key, summary, error in (outcome if isinstance(outcome, list) else [outcome]):
+                results[key] = (summary, error)
+                if on_result is not None:
+                    on_result(key, summary, error)
+
+        failed = sum(1 for _, error in results.values() if error is not None)
+        logger.info(f"Batch summary finished: {len(results) - failed} succeeded, {failed} failed")
+        return results
+
+    def iter_table_summaries(
+            self,
+            tables: List[Tuple[Hashable, Union[str, List[str]]]]
+    ) -> Iterator[Tuple[Hashable, Optional[str], Optional[Exception]]]:
+        """
+        Summarize many tables concurrently, yielding results as they finish.
+
+        The batch runs on the service's background event loop, so the caller
+        (e.g. the Streamlit script thread) can update progress between results.
+
+        Args:
+            tables: List of (key, formatted table text or chunks) pairs
+
+        Yields:
+            (key, summary, error) tuples in completion order
+        """
+        finished: "queue.Queue[Tuple[Hashable, Optional[str], Optional[Exception]]]" = queue.Queue()
+        batch = asyncio.run_coroutine_threadsafe(
+            self.summarize_tables_async(tables, on_result=lambda *item: finished.put(item)),
+            self._event_loop()
+        )
+
+        received = 0
+        while received < len(tables):
+            try:
+                item = finished.get(timeout=0.5)
+            except queue.Empty:
+                if batch.done():
+                    batch.result()  # Surface unexpected batch failures
+                    break
+                continue
+            received += 1
+            yield item
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the background event loop, starting it on first use.
+
+        A single long-lived loop keeps the AsyncGroq connection pool bound to
+        one loop instead of a new ``asyncio.run`` loop per batch.
+
+        Returns:
+            Running event loop
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="llm-service-loop",
+                    daemon=True
+                ).start()
+        return self._loop
+
+    def warm_up(self) -> None:
+        """
+        Probe the API and open pooled connections for the sync and async clients.
+
+        Lists the available models, which needs no completion tokens, so it is
+        cheap enough to run periodically from the health monitor.
+
+        Raises:
+            Exception: If the API cannot be reached or rejects the API key
+        """
+        self.client.models.list()
+        future = asyncio.run_coroutine_threadsafe(self.async_client.models.list(), self._event_loop())
+        future.result(timeout=self.timeout)
+
     def test_connection(self) -> bool:
         """
         Test connection to Groq API.
@@ -234,10 +1066,13 @@ class LLMService:
         try:
             logger.info("Testing Groq API connection")
 
+            test_message = "Hello, this is a connection test. Please respond with 'OK'."
+            self.rate_limiter.acquire(self._estimate_request_tokens(test_message, max_tokens=10))
+
             response = self.client.chat.completions.create(
                 model=self.model_name,
                 messages=[
-                    {"role": "user", "content": "Hello, this is a connection test. Please respond with 'OK'."}
+                    {"role": "user", "content": test_message}
                 ],
                 max_tokens=10,
             )
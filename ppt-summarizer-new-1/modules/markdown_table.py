@@ -0,0 +1,256 @@
+"""
+Markdown table module.
+
+Writes pipe-table markdown straight from cell strings, producing the same
+bytes as ``DataFrame.to_markdown(index=False)`` (tabulate's "pipe" format)
+without building a DataFrame or importing tabulate.
+"""
+
+import math
+import re
+import unicodedata
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from modules.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Column types, least to most generic (tabulate's order)
+_NONE, _BOOL, _INT, _FLOAT, _STR = range(5)
+
+_THOUSANDS = re.compile(r"^(([+-]?[0-9]{1,3})(?:,([0-9]{3}))*)?(?(1)\.[0-9]*|\.[0-9]+)?$")
+_LINE_BREAK = re.compile(r"[\r\n]")
+_HEADER_BREAK = re.compile(r"\r|\n|\r\n")
+
+# Headers are at least this much wider than their text
+_MIN_PADDING = 2
+
+
+def _is_int(value: str) -> bool:
+    """Whether a string converts to int."""
+    try:
+        int(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _is_number(value: str) -> bool:
+    """Whether a string converts to a float that did not overflow."""
+    try:
+        number = float(value)
+    except ValueError:
+        return False
+    return not (math.isinf(number) or math.isnan(number)) or value.lower() in ("inf", "-inf", "nan")
+
+
+def _cell_type(value: Any) -> int:
+    """
+    Classify one cell as tabulate does.
+
+    Args:
+        value: Cell value (normally a string)
+
+    Returns:
+        One of the _NONE.._STR type codes
+    """
+    if value is None:
+        return _NONE
+    if isinstance(value, str):
+        if not value:
+            return _NONE
+        if value in ("True", "False"):
+            return _BOOL
+        if _is_int(value) or ("." not in value and _THOUSANDS.match(value)):
+            return _INT
+        if _is_number(value) or _THOUSANDS.match(value):
+            return _FLOAT
+        return _STR
+    if type(value) is bool:
+        return _BOOL
+    if isinstance(value, (int, np.integer)):
+        return _INT
+    if hasattr(value, "isoformat"):
+        return _STR
+    try:
+        float(value)
+        return _FLOAT
+    except (TypeError, ValueError):
+        return _STR
+
+
+def _format_cell(value: Any, column_type: int) -> str:
+    """Render one cell for its column type (floats use the "g" format)."""
+    if value is None:
+        return ""
+    if isinstance(value, str) and not value:
+        return ""
+    if column_type == _FLOAT:
+        number = value.replace(",", "") if isinstance(value, str) else value
+        try:
+            return format(float(number), "g")
+        except (TypeError, ValueError):
+            return f"{value}"
+    return f"{value}"
+
+
+def _after_point(value: str) -> int:
+    """Digits after the decimal point (or exponent marker), -1 for integers and text."""
+    if not (_is_number(value) or _THOUSANDS.match(value)) or _is_int(value):
+        return -1
+    pos = value.rfind(".")
+    if pos < 0:
+        pos = value.lower().rfind("e")
+    return len(value) - pos - 1 if pos >= 0 else -1
+
+
+def display_width(text: str) -> int:
+    """
+    Terminal width of a string: wide East Asian characters count twice and
+    combining marks not at all.
+
+    Args:
+        text: Single-line string
+
+    Returns:
+        Width in columns
+    """
+    if text.isascii():
+        return len(text)
+    width = 0
+    for char in text:
+        if unicodedata.combining(char):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+    return width
+
+
+def _block_width(text: str) -> int:
+    """Width of a possibly multi-line string (its widest line)."""
+    return max(display_width(line) for line in _LINE_BREAK.split(text))
+
+
+def _pad(text: str, width: int, right: bool) -> str:
+    """Pad a single line to a display width, flush right or left."""
+    fill = " " * max(0, width - display_width(text))
+    return fill + text if right else text + fill
+
+
+def markdown_table(headers: Sequence[Any], rows: Sequence[Sequence[Any]]) -> str:
+    """
+    Render a pipe table.
+
+    Column types follow tabulate: a column whose non-empty cells all parse
+    as numbers is right-aligned on the decimal point, and float cells are
+    re-rendered with the "g" format; everything else is left-aligned text.
+
+    Args:
+        headers: Column names
+        rows: Row-major cell values (normally strings)
+
+    Returns:
+        Markdown table, identical to DataFrame.to_markdown(index=False)
+    """
+    headers = [str(header) for header in headers]
+    n_cols = len(headers)
+    if n_cols == 0:
+        return ""
+
+    multiline = any(_LINE_BREAK.search(header) for header in headers) or any(
+        isinstance(value, str) and _LINE_BREAK.search(value) for row in rows for value in row
+    )
+    width_of = _block_width if multiline else display_width
+
+    columns: List[List[str]] = []
+    numeric: List[bool] = []
+    widths: List[int] = []
+
+    for col, header in enumerate(headers):
+        values = [row[col] for row in rows]
+        column_type = max([_BOOL] + [_cell_type(value) for value in values])
+        strings = [_format_cell(value, column_type) for value in values]
+
+        is_numeric = column_type in (_INT, _FLOAT)
+        if is_numeric:
+            # Align on the decimal point
+            decimals = [_after_point(s) for s in strings]
+            most = max(decimals, default=-1)
+            strings = [s + " " * (most - d) for s, d in zip(strings, decimals)]
+        else:
+            strings = [s.strip() for s in strings]
+
+        width = max([width_of(header) + _MIN_PADDING] + [width_of(s) for s in strings])
+        if multiline:
+            strings = ["\n".join(_pad(line, width, is_numeric) for line in s.splitlines()) for s in strings]
+        else:
+            strings = [_pad(s, width, is_numeric) for s in strings]
+
+        columns.append(strings)
+        numeric.append(is_numeric)
+        widths.append(width)
+
+    if multiline:
+        header_cells = [
+            "\n".join(_pad(line, width, right) for line in _HEADER_BREAK.split(header))
+            for header, width, right in zip(headers, widths, numeric)
+        ]
+    else:
+        header_cells = [_pad(header, width, right) for header, width, right in zip(headers, widths, numeric)]
+
+    # Colons mark the alignment; a table without rows has none
+    separator = "|" + "|".join(
+        "-" * (width + 2) if not rows else
+        "-" * (width + 1) + ":" if right else ":" + "-" * (width + 1)
+        for width, right in zip(widths, numeric)
+    ) + "|"
+
+    lines = []
+    _append_row(lines, header_cells, widths, multiline)
+    lines.append(separator)
+    for r in range(len(rows)):
+        _append_row(lines, [column[r] for column in columns], widths, multiline)
+
+    return "\n".join(lines)
+
+
+def _append_row(lines: List[str], cells: List[str], widths: List[int], multiline: bool) -> None:
+    """Append one table row, spreading multi-line cells over several lines."""
+    if not multiline:
+        lines.append("| " + " | ".join(cells) + " |")
+        return
+
+    cell_lines = [cell.splitlines() for cell in cells]
+    height = max(len(parts) for parts in cell_lines)
+    for i in range(height):
+        lines.append("| " + " | ".join(
+            parts[i] if i < len(parts) else " " * width
+            for parts, width in zip(cell_lines, widths)
+        ) + " |")
+
+
+def dataframe_to_markdown(df: pd.DataFrame, emphasis: Optional[np.ndarray] = None) -> str:
+    """
+    Render a DataFrame as a pipe table without its index.
+
+    Args:
+        df: DataFrame
+        emphasis: Boolean mask of cells to wrap in ** (empty cells are left as they are)
+
+    Returns:
+        Markdown table
+    """
+    values = df.to_numpy(dtype=object)
+    if emphasis is not None and emphasis.shape == values.shape and emphasis.any():
+        values = np.where(emphasis & (values != ""), "**" + values.astype(str) + "**", values)
+    return markdown_table(list(df.columns), values.tolist())
+
+
+# Example usage
+if __name__ == "__main__":
+    print(markdown_table(
+        ["Segment", "Loan Default Rate (%)", "Net Rate (%)"],
+        [["Retail", "-2", "5"], ["Corporate", "7.25", "-1"], ["SME", "3", "**2**"]]
+    ))
@@ -0,0 +1,686 @@
+"""
+Lightweight OOXML reader module.
+
+Reads slide XML straight from the .pptx zip package so text and tables can be
+extracted without loading images, media or embedded fonts.
+"""
+
+import posixpath
+import zipfile
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from lxml import etree
+
+from modules.logger import get_logger
+
+logger = get_logger(__name__)
+
+# OOXML namespaces used by the reader
+NAMESPACES = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'c': 'http://schemas.openxmlformats.org/drawingml/2006/chart',
+}
+_PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+RT_SLIDE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide'
+RT_OFFICE_DOCUMENT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+RT_SLIDE_LAYOUT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout'
+RT_SLIDE_MASTER = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideMaster'
+RT_THEME = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme'
+RT_CHART = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/chart'
+RT_PACKAGE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/package'
+RT_OLE_OBJECT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/oleObject'
+
+# Cell colors are stored as COLOR_SET | 0xRRGGBB; 0 means no explicit color
+COLOR_SET = 1 << 24
+
+
+def qn(tag: str) -> str:
+    """
+    Convert a prefixed tag name (e.g. "a:tbl") to Clark notation.
+
+    Args:
+        tag: Namespace-prefixed tag name
+
+    Returns:
+        Tag name in "{namespace}local" form
+    """
+    prefix, local = tag.split(':')
+    return f"{{{NAMESPACES[prefix]}}}{local}"
+
+
+_A_P = qn('a:p')
+_A_R = qn('a:r')
+_A_T = qn('a:t')
+_A_BR = qn('a:br')
+_A_FLD = qn('a:fld')
+_A_TR = qn('a:tr')
+_A_TC = qn('a:tc')
+_A_TXBODY = qn('a:txBody')
+_A_TBLGRID = qn('a:tblGrid')
+_A_GRIDCOL = qn('a:gridCol')
+_A_RPR = qn('a:rPr')
+_A_SOLIDFILL = qn('a:solidFill')
+_A_SRGBCLR = qn('a:srgbClr')
+_A_SCHEMECLR = qn('a:schemeClr')
+_A_SYSCLR = qn('a:sysClr')
+_A_CLRSCHEME = qn('a:clrScheme')
+_P_CLRMAP = qn('p:clrMap')
+_TRUE = ('1', 'true')
+
+
+# Same hardening python-pptx applies to package XML
+_xml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False, no_network=True)
+
+
+def parse_xml(blob: bytes) -> etree._Element:
+    """
+    Parse an XML part.
+
+    Args:
+        blob: Raw XML bytes
+
+    Returns:
+        Root element of the part
+    """
+    return etree.fromstring(blob, _xml_parser)
+
+
+def paragraph_text(p_elm: etree._Element) -> str:
+    """
+    Get the text of an ``a:p`` paragraph the way python-pptx renders it.
+
+    Args:
+        p_elm: ``a:p`` element
+
+    Returns:
+        Paragraph text, with line breaks rendered as vertical tabs
+    """
+    parts = []
+    for child in p_elm.iterchildren():
+        if child.tag in (_A_R, _A_FLD):
+            t = child.find(_A_T)
+            if t is not None and t.text:
+                parts.append(t.text)
+        elif child.tag == _A_BR:
+            parts.append('\v')
+    return ''.join(parts)
+
+
+def text_body_paragraphs(tx_body: Optional[etree._Element]) -> List[str]:
+    """
+    Get the text of every paragraph in a text body.
+
+    Args:
+        tx_body: ``p:txBody`` or ``a:txBody`` element (may be None)
+
+    Returns:
+        List of paragraph strings, unstripped
+    """
+    if tx_body is None:
+        return []
+    return [paragraph_text(p) for p in tx_body.iterchildren(_A_P)]
+
+
+@dataclass
+class CellFormatting:
+    """Per-cell run formatting of a table, aligned with its text grid."""
+    bold: np.ndarray  # bool, any bold run in the cell
+    italic: np.ndarray  # bool, any italic run in the cell
+    color: np.ndarray  # uint32, COLOR_SET | 0xRRGGBB of the first colored run, else 0
+
+    @classmethod
+    def empty(cls, shape: Tuple[int, int]) -> 'CellFormatting':
+        """
+        Build formatting with nothing set.
+
+        Args:
+            shape: (rows, columns)
+
+        Returns:
+            CellFormatting with all-False masks and no colors
+        """
+        return cls(np.zeros(shape, dtype=bool), np.zeros(shape, dtype=bool), np.zeros(shape, dtype=np.uint32))
+
+    def rows(self, start: int) -> 'CellFormatting':
+        """
+        Drop leading rows (e.g. the header row promoted to column names).
+
+        Args:
+            start: First row to keep
+
+        Returns:
+            CellFormatting of the remaining rows
+        """
+        return CellFormatting(self.bold[start:], self.italic[start:], self.color[start:])
+
+    @property
+    def red(self) -> np.ndarray:
+        """Cells whose explicit color is a red (red channel dominant)."""
+        r = (self.color >> 16) & 0xFF
+        g = (self.color >> 8) & 0xFF
+        b = self.color & 0xFF
+        return ((self.color & COLOR_SET) > 0) & (r >= 0x80) & (r >= 2 * g) & (r >= 2 * b)
+
+    @property
+    def emphasis(self) -> np.ndarray:
+        """Cells the source deck highlights: bold or red."""
+        return self.bold | self.red
+
+
+def read_table_xml(tbl: etree._Element) -> np.ndarray:
+    """
+    Read the stripped text of every cell in an ``a:tbl`` element.
+
+    Args:
+        tbl: ``a:tbl`` element
+
+    Returns:
+        2-D object array of cell strings (rows x grid columns)
+    """
+    return _read_table(tbl, None, False)[0]
+
+
+def read_table_formatted_xml(
+        tbl: etree._Element,
+        theme_colors: Optional[Dict[str, int]] = None
+) -> Tuple[np.ndarray, CellFormatting]:
+    """
+    Read cell text and run formatting of an ``a:tbl`` element in one pass.
+
+    Args:
+        tbl: ``a:tbl`` element
+        theme_colors: Scheme color name -> 0xRRGGBB, from theme_color_map
+
+    Returns:
+        Tuple of (2-D object array of cell strings, CellFormatting)
+    """
+    return _read_table(tbl, theme_colors or {}, True)
+
+
+def _read_table(
+        tbl: etree._Element,
+        theme_colors: Optional[Dict[str, int]],
+        with_formatting: bool
+) -> Tuple[np.ndarray, Optional[CellFormatting]]:
+    """
+    Walk a table once, collecting cell text and, optionally, run formatting.
+
+    The table is walked in a single tag-filtered ``iter()`` pass instead of
+    per-cell lookups. Merged regions are resolved on the table grid: the
+    origin cell's ``gridSpan``/``rowSpan`` block is filled with its text and
+    formatting, and the ``hMerge``/``vMerge`` placeholder cells it covers are
+    skipped, so every grid position of a merged header or label carries it.
+    """
+    # rows -> cells -> [tc element, paragraphs -> text parts, bold, italic, color]
+    rows: List[list] = []
+    paragraphs: List[List[str]] = []
+    cell: list = []
+    run_format: Optional[Tuple[bool, bool, int]] = None
+
+    tags = (_A_TR, _A_TC, _A_P, _A_T, _A_BR)
+    if with_formatting:
+        tags += (_A_R, _A_FLD, _A_RPR)
+
+    for elm in tbl.iter(*tags):
+        tag = elm.tag
+        if tag == _A_T:
+            if elm.text:
+                paragraphs[-1].append(elm.text)
+                if run_format is not None:
+                    cell[2] = cell[2] or run_format[0]
+                    cell[3] = cell[3] or run_format[1]
+                    cell[4] = cell[4] or run_format[2]
+        elif tag == _A_P:
+            paragraphs.append([])
+        elif tag == _A_BR:
+            paragraphs[-1].append('\v')
+        elif tag == _A_RPR:
+            run_format = (elm.get('b') in _TRUE, elm.get('i') in _TRUE, _run_color(elm, theme_colors))
+        elif tag == _A_R or tag == _A_FLD:
+            run_format = None
+        elif tag == _A_TC:
+            paragraphs = []
+            cell = [elm, paragraphs, False, False, 0]
+            rows[-1].append(cell)
+        else:
+            rows.append([])
+
+    tbl_grid = tbl.find(_A_TBLGRID)
+    n_cols = len(tbl_grid.findall(_A_GRIDCOL)) if tbl_grid is not None else 0
+    if not n_cols:
+        n_cols = max((len(cells) for cells in rows), default=0)
+
+    shape = (len(rows), n_cols)
+    grid = np.full(shape, "", dtype=object)
+    formatting = CellFormatting.empty(shape) if with_formatting else None
+
+    for row_idx, cells in enumerate(rows):
+        grid_row = grid[row_idx]
+        # Every grid column has its own a:tc, including merge placeholders
+        for col_idx, (tc, cell_paragraphs, bold, italic, color) in enumerate(cells[:n_cols]):
+            attrib = tc.attrib
+            if attrib and (attrib.get('hMerge') in _TRUE or attrib.get('vMerge') in _TRUE):
+                # Covered by a merge origin that already filled this position
+                continue
+
+            text = '\n'.join(''.join(parts) for parts in cell_paragraphs).strip()
+            if attrib and ('gridSpan' in attrib or 'rowSpan' in attrib):
+                block = (
+                    slice(row_idx, row_idx + int(attrib.get('rowSpan', '1'))),
+                    slice(col_idx, col_idx + int(attrib.get('gridSpan', '1')))
+                )
+                grid[block] = text
+            else:
+                block = (row_idx, col_idx)
+                grid_row[col_idx] = text
+
+            if formatting is not None and (bold or italic or color):
+                formatting.bold[block] = bold
+                formatting.italic[block] = italic
+                formatting.color[block] = color
+
+    return grid, formatting
+
+
+def _run_color(r_pr: etree._Element, theme_colors: Optional[Dict[str, int]]) -> int:
+    """
+    Get the explicit fill color of a run.
+
+    Args:
+        r_pr: ``a:rPr`` element
+        theme_colors: Scheme color name -> 0xRRGGBB
+
+    Returns:
+        COLOR_SET | 0xRRGGBB, or 0 if the run has no resolvable solid fill
+    """
+    fill = r_pr.find(_A_SOLIDFILL)
+    if fill is None or len(fill) == 0:
+        return 0
+
+    clr = fill[0]
+    if clr.tag == _A_SRGBCLR:
+        rgb = _hex_color(clr.get('val'))
+    elif clr.tag == _A_SCHEMECLR:
+        rgb = (theme_colors or {}).get(clr.get('val'))
+    elif clr.tag == _A_SYSCLR:
+        rgb = _hex_color(clr.get('lastClr'))
+    else:
+        rgb = None
+
+    return COLOR_SET | rgb if rgb is not None else 0
+
+
+def _hex_color(value: Optional[str]) -> Optional[int]:
+    """Parse an RRGGBB hex string."""
+    try:
+        return int(value, 16) & 0xFFFFFF
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=32)
+def theme_color_map(theme_blob: bytes, clr_map: Tuple[Tuple[str, str], ...] = ()) -> Dict[str, int]:
+    """
+    Resolve the scheme colors of a theme part.
+
+    Args:
+        theme_blob: Theme part XML bytes
+        clr_map: Slide master ``p:clrMap`` attributes as (alias, scheme name)
+            pairs, e.g. (("tx1", "dk1"), ("bg1", "lt1"))
+
+    Returns:
+        Scheme color name (dk1, accent2, ... and clrMap aliases such as tx1)
+        -> 0xRRGGBB
+    """
+    colors: Dict[str, int] = {}
+    scheme = parse_xml(theme_blob).find(f"{qn('a:themeElements')}/{_A_CLRSCHEME}")
+    if scheme is None:
+        return colors
+
+    for slot in scheme.iterchildren():
+        if len(slot) == 0:
+            continue
+        clr = slot[0]
+        rgb = _hex_color(clr.get('lastClr') if clr.tag == _A_SYSCLR else clr.get('val'))
+        if rgb is not None:
+            colors[etree.QName(slot).localname] = rgb
+
+    for alias, name in clr_map:
+        if name in colors:
+            colors[alias] = colors[name]
+
+    return colors
+
+
+def clr_map_items(master: Optional[etree._Element]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Read the color mapping of a slide master.
+
+    Args:
+        master: ``p:sldMaster`` element
+
+    Returns:
+        Sorted (alias, scheme name) pairs, hashable for theme_color_map
+    """
+    clr_map = master.find(_P_CLRMAP) if master is not None else None
+    return tuple(sorted(clr_map.attrib.items())) if clr_map is not None else ()
+
+
+class OOXMLSlide:
+    """A slide part read lazily from the package zip."""
+
+    def __init__(self, package: 'OOXMLPresentation', partname: str, slide_number: int):
+        """
+        Initialize slide reference.
+
+        Args:
+            package: Presentation package the slide belongs to
+            partname: Zip member name of the slide part (e.g. "ppt/slides/slide1.xml")
+            slide_number: Slide number (1-indexed)
+        """
+        self.package = package
+        self.partname = partname
+        self.slide_number = slide_number
+
+    @property
+    def blob(self) -> bytes:
+        """Raw slide XML bytes."""
+        return self.package.read_part(self.partname)
+
+    @property
+    def element(self) -> etree._Element:
+        """Parsed ``p:sld`` root element (not cached, to keep memory flat)."""
+        return parse_xml(self.blob)
+
+    @property
+    def rels(self) -> Dict[str, Tuple[str, str]]:
+        """Relationships of the slide part, keyed by rId."""
+        return self.package.part_rels(self.partname)
+
+    @property
+    def theme_colors(self) -> Dict[str, int]:
+        """Scheme colors of the slide, resolved through its layout and master."""
+        return self.package.theme_colors(self.partname)
+
+    def related_size(self, r_id: str) -> Optional[int]:
+        """
+        Get the uncompressed size of a part the slide refers to, without reading it.
+
+        Args:
+            r_id: Relationship id on the slide part
+
+        Returns:
+            Size in bytes, or None for unknown, external or missing targets
+        """
+        rel = self.rels.get(r_id)
+        if rel is None or not self.package.has_part(rel[1]):
+            return None
+        return self.package.part_size(rel[1])
+
+    def related_blob(self, r_id: str) -> Optional[bytes]:
+        """
+        Read a part the slide refers to (e.g. a chart's ``r:id``).
+
+        Args:
+            r_id: Relationship id on the slide part
+
+        Returns:
+            Part bytes, or None for unknown, external or missing targets
+        """
+        rel = self.rels.get(r_id)
+        if rel is None or not self.package.has_part(rel[1]):
+            return None
+        return self.package.read_part(rel[1])
+
+    def related_blobs(self, rel_type: str, max_bytes: Optional[int] = None) -> Dict[str, bytes]:
+        """
+        Read every part of one relationship type, keyed by rId.
+
+        Args:
+            rel_type: Relationship type (e.g. RT_CHART)
+            max_bytes: Skip parts larger than this
+
+        Returns:
+            Dictionary of rId -> part bytes
+        """
+        blobs = {}
+        for r_id, (target_type, _) in self.rels.items():
+            if target_type != rel_type:
+                continue
+            size = self.related_size(r_id)
+            if size is None or (max_bytes is not None and size > max_bytes):
+                continue
+            blobs[r_id] = self.related_blob(r_id)
+        return blobs
+
+    def __repr__(self) -> str:
+        return f"OOXMLSlide(slide_number={self.slide_number}, partname='{self.partname}')"
+
+
+class DetachedSlide(OOXMLSlide):
+    """
+    Slide XML that travels without its package.
+
+    Used to hand raw slide bytes to worker processes; the scheme colors and
+    any related parts the worker needs (charts) are resolved by the sender,
+    since the package is not available.
+    """
+
+    def __init__(
+            self,
+            blob: bytes,
+            slide_number: int,
+            theme_colors: Optional[Dict[str, int]] = None,
+            related: Optional[Dict[str, bytes]] = None
+    ):
+        """
+        Initialize detached slide.
+
+        Args:
+            blob: Raw slide XML bytes
+            slide_number: Slide number (1-indexed)
+            theme_colors: Scheme colors resolved from the slide's master
+            related: Related part bytes keyed by rId
+        """
+        super().__init__(None, f"slide{slide_number}.xml", slide_number)
+        self._blob = blob
+        self._theme_colors = theme_colors or {}
+        self._related = related or {}
+
+    @property
+    def blob(self) -> bytes:
+        """Raw slide XML bytes."""
+        return self._blob
+
+    @property
+    def rels(self) -> Dict[str, Tuple[str, str]]:
+        """Detached slides carry no relationships."""
+        return {}
+
+    @property
+    def theme_colors(self) -> Dict[str, int]:
+        """Scheme colors resolved by the sender."""
+        return self._theme_colors
+
+    def related_size(self, r_id: str) -> Optional[int]:
+        """Size of a related part sent along with the slide."""
+        blob = self._related.get(r_id)
+        return len(blob) if blob is not None else None
+
+    def related_blob(self, r_id: str) -> Optional[bytes]:
+        """Related part bytes sent along with the slide."""
+        return self._related.get(r_id)
+
+    def related_blobs(self, rel_type: str, max_bytes: Optional[int] = None) -> Dict[str, bytes]:
+        """Related parts sent along with the slide (their types are not kept)."""
+        return {
+            r_id: blob for r_id, blob in self._related.items()
+            if max_bytes is None or len(blob) <= max_bytes
+        }
+
+
+class OOXMLPresentation:
+    """
+    Text-and-table-only view of a .pptx package.
+
+    Only the presentation part, relationship parts and slide parts are ever
+    decompressed; media, fonts and embedded objects stay untouched in the zip.
+    """
+
+    def __init__(self, source):
+        """
+        Open a .pptx package.
+
+        Args:
+            source: Path or binary file-like object of the .pptx file
+
+        Raises:
+            zipfile.BadZipFile: If source is not a zip package
+            KeyError: If the package has no presentation part
+        """
+        self._zip = zipfile.ZipFile(source)
+        self._theme_colors: Dict[str, Dict[str, int]] = {}
+        self.presentation_partname = self._find_presentation_part()
+        self.slides: List[OOXMLSlide] = self._load_slides()
+        logger.debug(f"Opened OOXML package with {len(self.slides)} slides")
+
+    def read_part(self, partname: str) -> bytes:
+        """
+        Read the raw bytes of a package part.
+
+        Args:
+            partname: Zip member name
+
+        Returns:
+            Part bytes
+        """
+        return self._zip.read(partname)
+
+    def part_size(self, partname: str) -> int:
+        """
+        Get the uncompressed size of a package part without reading it.
+
+        Args:
+            partname: Zip member name
+
+        Returns:
+            Size in bytes
+        """
+        return self._zip.getinfo(partname).file_size
+
+    def has_part(self, partname: str) -> bool:
+        """Check whether the package contains a part."""
+        try:
+            self._zip.getinfo(partname)
+            return True
+        except KeyError:
+            return False
+
+    def part_rels(self, partname: str) -> Dict[str, Tuple[str, str]]:
+        """
+        Read the relationships of a part.
+
+        Args:
+            partname: Zip member name of the source part ("" for package rels)
+
+        Returns:
+            Dictionary of rId -> (relationship type, target partname).
+            External targets are kept as-is.
+        """
+        base_dir, filename = posixpath.split(partname)
+        rels_name = posixpath.join(base_dir, '_rels', f"{filename}.rels")
+
+        if not self.has_part(rels_name):
+            return {}
+
+        rels = {}
+        for rel in parse_xml(self.read_part(rels_name)).iterchildren(f"{{{_PKG_REL_NS}}}Relationship"):
+            target = rel.get('Target')
+            if rel.get('TargetMode') != 'External':
+                target = posixpath.normpath(posixpath.join(base_dir, target)).lstrip('/')
+            rels[rel.get('Id')] = (rel.get('Type'), target)
+        return rels
+
+    def theme_colors(self, slide_partname: str) -> Dict[str, int]:
+        """
+        Resolve the scheme colors of a slide via slide -> layout -> master -> theme.
+
+        Results are cached per layout, so masters and themes are parsed once
+        per package.
+
+        Args:
+            slide_partname: Zip member name of the slide part
+
+        Returns:
+            Scheme color name -> 0xRRGGBB (empty if the chain is incomplete)
+        """
+        layout = self._related_part(slide_partname, RT_SLIDE_LAYOUT)
+        if layout is None:
+            return {}
+
+        if layout not in self._theme_colors:
+            colors: Dict[str, int] = {}
+            master = self._related_part(layout, RT_SLIDE_MASTER)
+            theme = self._related_part(master, RT_THEME) if master else None
+            if theme is not None and self.has_part(theme):
+                colors = theme_color_map(
+                    self.read_part(theme),
+                    clr_map_items(parse_xml(self.read_part(master)))
+                )
+            self._theme_colors[layout] = colors
+
+        return self._theme_colors[layout]
+
+    def _related_part(self, partname: str, rel_type: str) -> Optional[str]:
+        """Get the first internal part related to a part by type."""
+        for target_type, target in self.part_rels(partname).values():
+            if target_type == rel_type:
+                return target
+        return None
+
+    def close(self) -> None:
+        """Close the underlying zip file."""
+        self._zip.close()
+
+    def _find_presentation_part(self) -> str:
+        """Locate the main presentation part from the package relationships."""
+        for rel_type, target in self.part_rels('').values():
+            if rel_type == RT_OFFICE_DOCUMENT:
+                return target
+        raise KeyError("Package has no presentation part")
+
+    def _load_slides(self) -> List[OOXMLSlide]:
+        """Resolve slide parts in presentation order."""
+        prs = parse_xml(self.read_part(self.presentation_partname))
+        rels = self.part_rels(self.presentation_partname)
+
+        slides = []
+        sld_id_lst = prs.find(qn('p:sldIdLst'))
+        if sld_id_lst is None:
+            return slides
+
+        for sld_id in sld_id_lst.iterchildren(qn('p:sldId')):
+            rel = rels.get(sld_id.get(qn('r:id')))
+            if rel is None or rel[0] != RT_SLIDE:
+                continue
+            slides.append(OOXMLSlide(self, rel[1], len(slides) + 1))
+
+        return slides
+
+    def __enter__(self) -> 'OOXMLPresentation':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+# Example usage
+if __name__ == "__main__":
+    with OOXMLPresentation("sample_data/sample_loan_forecast.pptx") as prs:
+        for slide in prs.slides:
+            print(slide)
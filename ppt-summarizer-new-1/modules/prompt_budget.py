@@ -0,0 +1,409 @@
+"""
+Prompt budget module.
+
+Fits table data into a per-model token budget before it is pasted into a
+prompt. Tables over the budget are either split into row-group chunks for
+map-reduce summarization, or projected onto their relevant columns
+(segment label, default and net rates, deltas) and cut to the most
+anomalous rows; negative and highlighted rows are always kept, and the
+omitted rows are summarized in a one-line aggregates footer.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from modules.logger import get_logger
+from modules.config_manager import get_config
+from modules.table_serializers import estimate_tokens, serialize_table
+
+logger = get_logger(__name__)
+config = get_config()
+
+# Column names worth keeping when a table has to be projected
+DEFAULT_PRIORITY_COLUMNS = (
+    r"segment", r"default", r"\bnet\b", r"rate", r"delta", r"change", r"variance", r"\bq[1-4]\b",
+)
+
+# Scale factor that makes the median absolute deviation comparable to a standard deviation
+_MAD_SCALE = 1.4826
+
+# Dropped column names listed in the footer before it is cut short
+_MAX_LISTED_COLUMNS = 8
+
+# Text columns preferred for grouping rows into chunks
+_GROUP_COLUMN = re.compile(
+    r"segment|region|portfolio|division|business|sector|product|country|book", re.IGNORECASE
+)
+
+
+@dataclass
+class TableFit:
+    """Table text for a prompt and what was left out to fit the budget."""
+    text: str
+    tokens: int
+    total_rows: int
+    total_columns: int
+    omitted_rows: int = 0
+    omitted_columns: List[str] = field(default_factory=list)
+    budget: Optional[int] = None
+    # Row-group chunks for map-reduce summarization (empty when text is the whole prompt table)
+    chunks: List[str] = field(default_factory=list)
+
+    @property
+    def trimmed(self) -> bool:
+        """Whether rows or columns were left out."""
+        return bool(self.omitted_rows or self.omitted_columns)
+
+    @property
+    def note(self) -> Optional[str]:
+        """One-line description of the trimming for the UI (None if nothing was trimmed)."""
+        if self.chunks:
+            return (
+                f"Table exceeds the {self.budget:,}-token prompt budget: "
+                f"summarized in {len(self.chunks)} row-group parts and combined"
+            )
+        if not self.trimmed:
+            return None
+        kept_rows = self.total_rows - self.omitted_rows
+        kept_columns = self.total_columns - len(self.omitted_columns)
+        return (
+            f"Table trimmed to fit the {self.budget:,}-token prompt budget: "
+            f"kept {kept_rows} of {self.total_rows} rows and {kept_columns} of {self.total_columns} columns"
+        )
+
+
+def table_budget_for(model_name: str) -> Optional[int]:
+    """
+    Get the configured table token budget for a model.
+
+    llm.table_budget.models maps model names to budgets; other models use
+    llm.table_budget.default. A budget of 0 or null disables trimming.
+
+    Args:
+        model_name: LLM model name
+
+    Returns:
+        Token budget for one table, or None for no limit
+    """
+    models = config.get("llm.table_budget.models") or {}
+    budget = models.get(model_name, config.get("llm.table_budget.default", 3000))
+    return int(budget) if budget else None
+
+
+def fit_table(
+        headers: Sequence[Any],
+        rows: Sequence[Sequence[Any]],
+        typed: pd.DataFrame,
+        budget: int,
+        encoding: str,
+        emphasis: Optional[np.ndarray] = None,
+        caption: Optional[str] = None,
+        priority_columns: Optional[Sequence[str]] = None
+) -> TableFit:
+    """
+    Trim a table until its prompt text fits a token budget.
+
+    Columns are projected first: the label column and columns whose names
+    match priority_columns are kept (all numeric columns if none match).
+    Rows are then ranked by anomaly score, the largest robust z-score of
+    their numeric cells, and the top rows that fit are kept in their
+    original order. Rows with a negative value or an emphasized cell are
+    ranked ahead of the rest.
+
+    Args:
+        headers: Column names
+        rows: Body rows of display strings
+        typed: Typed copy of the table (see table_typing.normalize_table)
+        budget: Maximum estimated tokens for the table text
+        encoding: Table encoding (see table_serializers)
+        emphasis: Boolean mask of emphasized body cells
+        caption: Caption put above the table text
+        priority_columns: Regular expressions for relevant column names
+
+    Returns:
+        TableFit with the trimmed text and what was omitted
+    """
+    headers = [str(header) for header in headers]
+    n_rows, n_cols = len(rows), len(headers)
+    if priority_columns is None:
+        priority_columns = config.get("llm.table_budget.priority_columns", DEFAULT_PRIORITY_COLUMNS)
+
+    units = typed.attrs.get("units", {})
+    label_column = typed.attrs.get("label_column")
+    columns = _project_columns(headers, units, label_column, priority_columns)
+    numeric = [pos for pos in columns if pos in units]
+
+    values = (
+        np.column_stack([typed.iloc[:, pos].to_numpy(dtype=float) for pos in numeric])
+        if numeric and n_rows else np.empty((n_rows, 0))
+    )
+    scores = _anomaly_scores(values)
+    flagged = (values < 0).any(axis=1)
+    if emphasis is not None and emphasis.shape == (n_rows, n_cols):
+        flagged = flagged | emphasis.any(axis=1)
+
+    # Flagged rows first, each group by descending anomaly score
+    ranking = np.lexsort((-scores, ~flagged))
+    omitted_columns = [headers[pos] for pos in range(n_cols) if pos not in columns]
+    if emphasis is not None and emphasis.shape != (n_rows, n_cols):
+        emphasis = None
+
+    def render(k: int) -> str:
+        kept = np.sort(ranking[:k])
+        text = serialize_table(
+            [headers[pos] for pos in columns],
+            [[rows[r][pos] for pos in columns] for r in kept],
+            encoding,
+            emphasis[np.ix_(kept, columns)] if emphasis is not None else None
+        )
+        footer = _footer(
+            n_rows - k,
+            np.delete(values, kept, axis=0),
+            [headers[pos] for pos in numeric],
+            [units[pos] for pos in numeric],
+            omitted_columns
+        )
+        return "\n\n".join(part for part in (caption, text, footer) if part)
+
+    # Largest number of rows whose text fits (the estimate grows with every row)
+    low, high = 0, n_rows
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(render(mid)) <= budget:
+            low = mid
+        else:
+            high = mid - 1
+
+    text = render(low)
+    tokens = estimate_tokens(text)
+    if tokens > budget:
+        logger.warning(f"Table header and footer alone need {tokens} tokens (budget {budget})")
+
+    logger.info(
+        f"Trimmed table from {n_rows}x{n_cols} to {low}x{len(columns)} "
+        f"to fit {budget} tokens ({tokens} estimated)"
+    )
+    return TableFit(text, tokens, n_rows, n_cols, n_rows - low, omitted_columns, budget)
+
+
+def chunk_table(
+        headers: Sequence[Any],
+        rows: Sequence[Sequence[Any]],
+        typed: pd.DataFrame,
+        budget: int,
+        encoding: str,
+        emphasis: Optional[np.ndarray] = None,
+        caption: Optional[str] = None
+) -> List[str]:
+    """
+    Split a table into row-group chunks that each fit a token budget.
+
+    Rows are grouped by a repeated text column (segment, region, ...) when
+    the table has one, so a group is summarized together; groups are packed
+    into chunks in order of first appearance and oversized groups are split
+    into row ranges. Every chunk repeats the header row and the caption.
+
+    Args:
+        headers: Column names
+        rows: Body rows of display strings
+        typed: Typed copy of the table (see table_typing.normalize_table)
+        budget: Maximum estimated tokens per chunk
+        encoding: Table encoding (see table_serializers)
+        emphasis: Boolean mask of emphasized body cells
+        caption: Caption put above each chunk
+
+    Returns:
+        List of chunk texts
+    """
+    headers = [str(header) for header in headers]
+    n_rows, n_cols = len(rows), len(headers)
+    if emphasis is not None and emphasis.shape != (n_rows, n_cols):
+        emphasis = None
+    group_column = _group_column(headers, rows, typed)
+
+    def table_text(indices: List[int]) -> str:
+        return serialize_table(
+            headers,
+            [rows[r] for r in indices],
+            encoding,
+            emphasis[indices] if emphasis is not None else None
+        )
+
+    def render(indices: List[int], part: int, parts: int) -> str:
+        line = f"Part {part} of {parts}: {len(indices)} of {n_rows} rows"
+        if group_column is not None:
+            groups = list(dict.fromkeys(rows[r][group_column] for r in indices))
+            line += f"; {headers[group_column]}: {', '.join(groups)}"
+        return "\n\n".join(piece for piece in (caption, line, table_text(indices)) if piece)
+
+    # Per-row cost measured against the header-only table
+    base = estimate_tokens(render([], n_rows, n_rows))
+    header_tokens = estimate_tokens(table_text([]))
+    room = max(budget - base, 1)
+    row_tokens = [estimate_tokens(table_text([r])) - header_tokens for r in range(n_rows)]
+    # Scale to the whole table, whose column padding is at least that of any chunk
+    measured = sum(row_tokens)
+    if measured:
+        scale = max((estimate_tokens(table_text(list(range(n_rows)))) - header_tokens) / measured, 1.0)
+        row_tokens = [tokens * scale for tokens in row_tokens]
+
+    if group_column is not None:
+        groups = {}
+        for r in range(n_rows):
+            groups.setdefault(rows[r][group_column], []).append(r)
+        ordered = list(groups.values())
+    else:
+        ordered = [list(range(n_rows))]
+
+    chunks: List[List[int]] = [[]]
+    used = 0
+    for group in ordered:
+        group_tokens = sum(row_tokens[r] for r in group)
+        # Start a new chunk rather than split a group that fits in one
+        if chunks[-1] and used + group_tokens > room and group_tokens <= room:
+            chunks.append([])
+            used = 0
+        for r in group:
+            if chunks[-1] and used + row_tokens[r] > room:
+                chunks.append([])
+                used = 0
+            chunks[-1].append(r)
+            used += row_tokens[r]
+
+    # The per-row estimate ignores markdown padding: halve any chunk still over budget
+    fitted: List[List[int]] = []
+    pending = [chunk for chunk in chunks if chunk]
+    while pending:
+        chunk = pending.pop(0)
+        if len(chunk) > 1 and estimate_tokens(render(chunk, n_rows, n_rows)) > budget:
+            middle = len(chunk) // 2
+            pending[:0] = [chunk[:middle], chunk[middle:]]
+        else:
+            fitted.append(chunk)
+
+    logger.info(
+        f"Split table of {n_rows} rows into {len(fitted)} chunks of at most {budget} tokens"
+        + (f" grouped by '{headers[group_column]}'" if group_column is not None else "")
+    )
+    return [render(chunk, part, len(fitted)) for part, chunk in enumerate(fitted, 1)]
+
+
+def _group_column(headers: List[str], rows: Sequence[Sequence[Any]], typed: pd.DataFrame) -> Optional[int]:
+    """Text column whose repeated values group the rows (segment, region, ...), if any."""
+    units = typed.attrs.get("units", {})
+    candidates = []
+    for pos, header in enumerate(headers):
+        if pos in units:
+            continue
+        distinct = len({row[pos] for row in rows})
+        if 1 < distinct <= len(rows) // 2:
+            candidates.append(pos)
+    named = [pos for pos in candidates if _GROUP_COLUMN.search(headers[pos])]
+    return (named or candidates or [None])[0]
+
+
+def _project_columns(
+        headers: List[str],
+        units: dict,
+        label_column: Optional[int],
+        priority_columns: Sequence[str]
+) -> List[int]:
+    """Positions of the label column and the relevant columns, in table order."""
+    pattern = re.compile("|".join(f"(?:{p})" for p in priority_columns), re.IGNORECASE) if priority_columns else None
+    relevant = [
+        pos for pos, header in enumerate(headers)
+        if pattern is not None and pos != label_column and pattern.search(header)
+    ]
+    if not any(pos in units for pos in relevant):
+        # No relevant numeric column: keep every numeric column
+        relevant = sorted(set(relevant) | set(units))
+    if not relevant:
+        return list(range(len(headers)))
+
+    label = label_column if label_column is not None else 0
+    return sorted(set(relevant) | {label})
+
+
+def _anomaly_scores(values: np.ndarray) -> np.ndarray:
+    """Largest absolute robust z-score per row (0 for rows without numbers)."""
+    if values.size == 0:
+        return np.zeros(len(values))
+
+    with np.errstate(all="ignore"):
+        median = np.nanmedian(values, axis=0)
+        spread = _MAD_SCALE * np.nanmedian(np.abs(values - median), axis=0)
+        # Columns with mostly equal values fall back to the standard deviation
+        spread = np.where(spread > 0, spread, np.nanstd(values, axis=0))
+        z = np.abs(values - median) / np.where(spread > 0, spread, np.nan)
+
+    z = np.where(np.isnan(z), 0.0, z)
+    return z.max(axis=1)
+
+
+def _footer(
+        omitted_rows: int,
+        values: np.ndarray,
+        names: List[str],
+        units: List[str],
+        omitted_columns: List[str]
+) -> Optional[str]:
+    """Aggregates of the omitted rows and the names of dropped columns."""
+    parts = []
+    if omitted_rows:
+        aggregates = []
+        with np.errstate(all="ignore"):
+            for pos, (name, unit) in enumerate(zip(names, units)):
+                column = values[:, pos]
+                if np.isnan(column).all():
+                    continue
+                aggregates.append(
+                    f"{name} min {_number(np.nanmin(column), unit)}, "
+                    f"mean {_number(np.nanmean(column), unit)}, "
+                    f"max {_number(np.nanmax(column), unit)}"
+                )
+        line = f"{omitted_rows} rows omitted"
+        if aggregates:
+            line += ", aggregates: " + "; ".join(aggregates)
+        parts.append(line)
+
+    if omitted_columns:
+        listed = ", ".join(omitted_columns[:_MAX_LISTED_COLUMNS])
+        if len(omitted_columns) > _MAX_LISTED_COLUMNS:
+            listed += ", ..."
+        parts.append(f"{len(omitted_columns)} columns omitted: {listed}")
+
+    return "; ".join(parts) + "." if parts else None
+
+
+def _number(value: float, unit: str) -> str:
+    """Short display of an aggregate in its column's unit."""
+    text = f"{value:,.2f}".rstrip("0").rstrip(".")
+    if text == "-0":
+        text = "0"
+    if unit in ("%", "bp"):
+        return f"{text}{unit}"
+    if unit:
+        return f"-{unit}{text[1:]}" if text.startswith("-") else f"{unit}{text}"
+    return text
+
+
+# Example usage
+if __name__ == "__main__":
+    from modules.table_typing import normalize_table
+
+    rng = np.random.default_rng(7)
+    headers = ["Region", "Branch Id", "Loan Default Rate (%)", "Net Rate (%)", "Notes"]
+    rows = [
+        [f"Region {i}", f"B{i:04d}", f"{rate:.1f}%", f"{net:.1f}%", "stable"]
+        for i, (rate, net) in enumerate(zip(rng.normal(3, 0.5, 400), rng.normal(4, 1.5, 400)))
+    ]
+    rows[123][3] = "-2.5%"
+    typed = normalize_table(pd.DataFrame(rows, columns=headers))
+
+    fit = fit_table(headers, rows, typed, budget=600, encoding="csv")
+    print(fit.note)
+    print(fit.text)
@@ -0,0 +1,336 @@
+"""
+Client-side rate limiting module.
+
+Token buckets for requests per minute and tokens per minute, shared by all
+sync and async Groq calls and adapted from the rate-limit headers Groq returns.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from typing import Callable, Mapping, Optional
+
+from modules.logger import get_logger
+from modules.config_manager import get_config
+
+logger = get_logger(__name__)
+config = get_config()
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a rate-limit reset header such as "2m59.56s", "7.66s" or "120ms".
+
+    Args:
+        value: Header value (plain numbers are read as seconds)
+
+    Returns:
+        Duration in seconds, or None if the value cannot be parsed
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(number + unit for number, unit in parts) != value:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def server_retry_delay(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Read the delay a 429 response asks for, as RateLimiter.update_from_headers does.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+
+    Returns:
+        Seconds from ``retry-after`` or the reset header of an exhausted
+        quota, or None if the response names no delay
+    """
+    delays = [parse_reset_duration(headers.get("retry-after"))]
+    for kind in ("requests", "tokens"):
+        remaining = RateLimiter._header_number(headers, f"x-ratelimit-remaining-{kind}")
+        if remaining is not None and remaining <= 0:
+            delays.append(parse_reset_duration(headers.get(f"x-ratelimit-reset-{kind}")))
+    delays = [delay for delay in delays if delay]
+    return max(delays) if delays else None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with reservations.
+
+    Reservations are deducted immediately (the level may go negative), so
+    concurrent callers queue up fairly and each one knows how long to wait.
+    """
+
+    def __init__(self, capacity: float, per_seconds: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize a full bucket.
+
+        Args:
+            capacity: Maximum number of units in the bucket
+            per_seconds: Time to refill the bucket from empty
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.capacity = float(capacity)
+        self.refill_rate = self.capacity / per_seconds
+        self._clock = clock
+        self._level = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def level(self) -> float:
+        """Current number of available units."""
+        with self._lock:
+            self._refill(self._clock())
+            return self._level
+
+    def reserve(self, amount: float) -> float:
+        """
+        Reserve units from the bucket.
+
+        Args:
+            amount: Units to take (clamped to the bucket capacity)
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        amount = min(float(amount), self.capacity)
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._level -= amount
+
+            wait = max(0.0, self._blocked_until - now)
+            if self._level < 0:
+                wait = max(wait, -self._level / self.refill_rate)
+            return wait
+
+    def release(self, amount: float) -> None:
+        """
+        Return unused units (e.g. when a request used fewer tokens than reserved).
+
+        Args:
+            amount: Units to give back
+        """
+        if amount <= 0:
+            return
+        with self._lock:
+            self._refill(self._clock())
+            self._level = min(self.capacity, self._level + amount)
+
+    def observe(self, remaining: Optional[float] = None, reset_seconds: Optional[float] = None) -> None:
+        """
+        Align the bucket with the server's view of the quota.
+
+        Args:
+            remaining: Units the server says are left
+            reset_seconds: Seconds until the server's window resets
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+
+            if remaining is not None:
+                self._level = min(self._level, float(remaining))
+                if remaining <= 0 and reset_seconds:
+                    self._blocked_until = max(self._blocked_until, now + reset_seconds)
+
+    def block_for(self, seconds: float) -> None:
+        """
+        Hold all reservations for a period (e.g. from a Retry-After header).
+
+        Args:
+            seconds: Seconds to block
+        """
+        with self._lock:
+            now = self._clock()
+            self._blocked_until = max(self._blocked_until, now + seconds)
+
+    def _refill(self, now: float) -> None:
+        """Add units for the time elapsed since the last update (lock held)."""
+        elapsed = max(0.0, now - self._updated)
+        self._level = min(self.capacity, self._level + elapsed * self.refill_rate)
+        self._updated = now
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limiter for Groq calls."""
+
+    def __init__(
+            self,
+            requests_per_minute: float,
+            tokens_per_minute: float,
+            enabled: bool = True,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Request bucket size per minute
+            tokens_per_minute: Token bucket size per minute
+            enabled: When False, acquire() never waits
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.enabled = enabled
+        self.requests = TokenBucket(requests_per_minute, 60.0, clock)
+        self.tokens = TokenBucket(tokens_per_minute, 60.0, clock)
+        logger.info(
+            f"RateLimiter initialized (enabled={enabled}, rpm={requests_per_minute}, "
+            f"tpm={tokens_per_minute})"
+        )
+
+    def reserve(self, tokens: int) -> float:
+        """
+        Reserve one request and an estimated number of tokens.
+
+        Args:
+            tokens: Estimated prompt plus completion tokens
+
+        Returns:
+            Seconds to wait before sending
+        """
+        if not self.enabled:
+            return 0.0
+        return max(self.requests.reserve(1), self.tokens.reserve(tokens))
+
+    def acquire(self, tokens: int) -> float:
+        """
+        Block until a request of the given size may be sent.
+
+        Args:
+            tokens: Estimated prompt plus completion tokens
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            logger.info(f"Rate limiter delaying request by {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: int) -> float:
+        """
+        Wait (without blocking the event loop) until a request may be sent.
+
+        Args:
+            tokens: Estimated prompt plus completion tokens
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            logger.info(f"Rate limiter delaying async request by {wait:.2f}s")
+            await asyncio.sleep(wait)
+        return wait
+
+    def settle(self, reserved_tokens: int, used_tokens: Optional[int]) -> None:
+        """
+        Return the unused part of a token reservation.
+
+        Args:
+            reserved_tokens: Tokens reserved before sending
+            used_tokens: Total tokens reported by the API usage, if any
+        """
+        if self.enabled and used_tokens is not None:
+            self.tokens.release(reserved_tokens - used_tokens)
+
+    def update_from_headers(self, headers: Mapping[str, str], status_code: int = 200) -> None:
+        """
+        Adapt the buckets to Groq's ``x-ratelimit-*`` and ``retry-after`` headers.
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+            status_code: HTTP status of the response
+        """
+        if not self.enabled:
+            return
+
+        self.requests.observe(
+            self._header_number(headers, "x-ratelimit-remaining-requests"),
+            parse_reset_duration(headers.get("x-ratelimit-reset-requests"))
+        )
+        self.tokens.observe(
+            self._header_number(headers, "x-ratelimit-remaining-tokens"),
+            parse_reset_duration(headers.get("x-ratelimit-reset-tokens"))
+        )
+
+        if status_code == 429:
+            retry_after = parse_reset_duration(headers.get("retry-after"))
+            if retry_after:
+                logger.warning(f"Rate limited by server, holding requests for {retry_after:.2f}s")
+                self.requests.block_for(retry_after)
+
+    def observe_response(self, response) -> None:
+        """
+        httpx response event hook for the sync Groq client.
+
+        Args:
+            response: httpx.Response
+        """
+        self.update_from_headers(response.headers, response.status_code)
+
+    async def observe_response_async(self, response) -> None:
+        """
+        httpx response event hook for the async Groq client.
+
+        Args:
+            response: httpx.Response
+        """
+        self.update_from_headers(response.headers, response.status_code)
+
+    @staticmethod
+    def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+        """Read a numeric header, ignoring missing or malformed values."""
+        try:
+            value = headers.get(name)
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the process-wide rate limiter, creating it from configuration.
+
+    Returns:
+        Shared RateLimiter instance
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(
+                requests_per_minute=config.get("llm.rate_limit.requests_per_minute", 30),
+                tokens_per_minute=config.get("llm.rate_limit.tokens_per_minute", 6000),
+                enabled=config.get("llm.rate_limit.enabled", True)
+            )
+    return _rate_limiter
+
+
+# Example usage
+if __name__ == "__main__":
+    limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=1000)
+    for i in range(3):
+        waited = limiter.acquire(100)
+        print(f"Request {i + 1} sent after waiting {waited:.2f}s")
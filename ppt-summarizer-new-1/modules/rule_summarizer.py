@@ -0,0 +1,245 @@
+"""
+Rule-based table summarizer module.
+
+Summarizes small, regularly structured tables locally with vectorized pandas
+checks on typed tables (negatives, quarter-over-quarter changes, extremes and threshold
+breaches), using the bullet layout prompt_template.txt asks the LLM for.
+"""
+
+import re
+from typing import Optional
+
+import pandas as pd
+
+from modules.logger import get_logger
+from modules.config_manager import get_config
+from modules.table_typing import is_typed, normalize_table
+
+logger = get_logger(__name__)
+config = get_config()
+
+# When the rule summary is used instead of (or ahead of) the LLM
+POLICY_REPLACE = "replace"    # Eligible tables never go to the LLM
+POLICY_PREVIEW = "preview"    # Shown instantly while the LLM summary is generated
+POLICY_FALLBACK = "fallback"  # Only when the LLM is unavailable or fails
+POLICY_OFF = "off"
+POLICIES = (POLICY_REPLACE, POLICY_PREVIEW, POLICY_FALLBACK, POLICY_OFF)
+
+RULE_SUMMARY_FOOTER = "_⚡ Rule-based summary generated locally_"
+
+_PERIOD_COLUMN = re.compile(r"\bq[1-4]\b|\bprevious\b|\bprior\b|\bcurrent\b|\blast quarter\b", re.IGNORECASE)
+_CHANGE_COLUMN = re.compile(r"\bchange\b|\bdelta\b|\bvariance\b", re.IGNORECASE)
+_DEFAULT_COLUMN = re.compile(r"default", re.IGNORECASE)
+
+
+class RuleSummarizer:
+    """Deterministic summarizer for small numeric tables."""
+
+    def __init__(self):
+        """Initialize rule summarizer with configuration."""
+        self.policy = config.get("rule_summarizer.policy", POLICY_FALLBACK)
+        if self.policy not in POLICIES:
+            logger.warning(f"Unknown rule_summarizer.policy '{self.policy}', using '{POLICY_FALLBACK}'")
+            self.policy = POLICY_FALLBACK
+
+        self.max_rows = config.get("rule_summarizer.max_rows", 12)
+        self.max_cols = config.get("rule_summarizer.max_cols", 6)
+        self.default_rate_threshold = config.get("rule_summarizer.default_rate_threshold", 5.0)
+        self.change_threshold = config.get("rule_summarizer.change_threshold_pp", 1.0)
+
+        logger.info(f"RuleSummarizer initialized (policy={self.policy})")
+
+    def replaces_llm(self, df: Optional[pd.DataFrame]) -> bool:
+        """
+        Check whether the rule summary should be used instead of the LLM.
+
+        Args:
+            df: Table DataFrame
+
+        Returns:
+            True under the "replace" policy for eligible tables
+        """
+        return self.policy == POLICY_REPLACE and self.is_eligible(df)
+
+    @property
+    def previews(self) -> bool:
+        """Whether a rule summary is shown while the LLM summary is generated."""
+        return self.policy == POLICY_PREVIEW
+
+    @property
+    def falls_back(self) -> bool:
+        """Whether a rule summary is used when the LLM is unavailable or fails."""
+        return self.policy != POLICY_OFF
+
+    def is_eligible(self, df: Optional[pd.DataFrame]) -> bool:
+        """
+        Check whether a table is small and regular enough for the rules.
+
+        Args:
+            df: Table DataFrame
+
+        Returns:
+            True if the table has a label column, at least one numeric
+            column and fits within max_rows x max_cols
+        """
+        if df is None or df.empty:
+            return False
+        if len(df) > self.max_rows or len(df.columns) > self.max_cols:
+            return False
+
+        typed = df if is_typed(df) else normalize_table(df)
+        return bool(typed.attrs["units"]) and typed.attrs["label_column"] is not None
+
+    def summarize(self, df: Optional[pd.DataFrame]) -> Optional[str]:
+        """
+        Summarize a table as markdown bullets.
+
+        Args:
+            df: Typed table (SlideContent.typed_tables) or a display-string
+                table, which is typed first
+
+        Returns:
+            Summary text, or None if the table has no numeric columns
+        """
+        if df is None or df.empty:
+            return None
+
+        typed = df if is_typed(df) else normalize_table(df)
+        units = typed.attrs["units"]
+        numeric = sorted(units)
+        if not numeric:
+            return None
+
+        # Positional float columns, safe with duplicate headers
+        values = pd.DataFrame({pos: typed.iloc[:, pos] for pos in numeric}, index=typed.index)
+
+        headers = [str(col) for col in typed.columns]
+        label_pos = typed.attrs["label_column"]
+        labels = (
+            typed.iloc[:, label_pos].astype(str)
+            if label_pos is not None
+            else pd.Series([f"Row {i}" for i in range(1, len(typed) + 1)], index=typed.index)
+        )
+        percent = {pos: units[pos] == "%" or "%" in headers[pos] for pos in numeric}
+
+        change_cols = [pos for pos in numeric if _CHANGE_COLUMN.search(headers[pos])]
+        period_cols = [pos for pos in numeric if _PERIOD_COLUMN.search(headers[pos]) and pos not in change_cols]
+        metric_cols = [pos for pos in numeric if pos not in change_cols]
+
+        metrics = values[metric_cols]
+
+        # Quarter-over-quarter deltas between consecutive period columns
+        deltas = pd.DataFrame(index=typed.index)
+        if len(period_cols) >= 2:
+            prev_pos, cur_pos = period_cols[-2], period_cols[-1]
+            deltas["delta"] = values[cur_pos] - values[prev_pos]
+        elif change_cols:
+            prev_pos = cur_pos = None
+            deltas["delta"] = values[change_cols[0]]
+
+        negatives = metrics.lt(0)
+        default_cols = [pos for pos in metric_cols if _DEFAULT_COLUMN.search(headers[pos])]
+        breaches = metrics[default_cols].gt(self.default_rate_threshold) if default_cols else pd.DataFrame(index=typed.index)
+        big_moves = deltas["delta"].abs().ge(self.change_threshold) if "delta" in deltas else pd.Series(False, index=typed.index)
+
+        flags = negatives.sum(axis=1) + breaches.sum(axis=1) + big_moves.astype(int)
+        total_flags = int(flags.sum())
+
+        lines = [f"- **Executive Summary**: {self._executive_summary(labels, flags, negatives, breaches, big_moves, len(metric_cols))}", ""]
+
+        lines.append("- **Key Metrics**:")
+        for pos in metric_cols:
+            column = metrics[pos].dropna()
+            if column.empty:
+                continue
+            unit = "%" if percent[pos] else ""
+            lines.append(
+                f"  - {headers[pos]}: highest {labels[column.idxmax()]} ({self._fmt(column.max())}{unit}), "
+                f"lowest {labels[column.idxmin()]} ({self._fmt(column.min())}{unit}), "
+                f"average {self._fmt(column.mean())}{unit}"
+            )
+        lines.append("")
+
+        unit_name = "percentage points" if any(percent[pos] for pos in numeric) else "points"
+        if "delta" in deltas:
+            lines.append("- **Quarter-over-Quarter Changes**:")
+            for idx, delta in deltas["delta"].dropna().items():
+                direction = "up" if delta > 0 else "down" if delta < 0 else "unchanged"
+                move = f"{direction} {self._fmt(abs(delta))} {unit_name}" if delta else direction
+                if prev_pos is not None:
+                    unit = "%" if percent[cur_pos] else ""
+                    text = (
+                        f"{labels[idx]}: {self._fmt(values.at[idx, prev_pos])}{unit} to "
+                        f"{self._fmt(values.at[idx, cur_pos])}{unit} ({move})"
+                    )
+                else:
+                    text = f"{labels[idx]}: {move}"
+                lines.append(f"  - **{text}**" if big_moves[idx] else f"  - {text}")
+            lines.append("")
+
+        lines.append("- **Risk Factors**:")
+        risk_lines = []
+        for (idx, pos) in negatives.stack().loc[lambda s: s].index:
+            unit = "%" if percent[pos] else ""
+            risk_lines.append(
+                f"  - **{labels[idx]} {headers[pos]} is negative ({self._fmt(values.at[idx, pos])}{unit})**"
+            )
+        if not breaches.empty:
+            for (idx, pos) in breaches.stack().loc[lambda s: s].index:
+                risk_lines.append(
+                    f"  - {labels[idx]} {headers[pos]} of {self._fmt(metrics.at[idx, pos])}% exceeds the "
+                    f"{self._fmt(self.default_rate_threshold)}% threshold"
+                )
+        for idx in big_moves[big_moves].index:
+            risk_lines.append(
+                f"  - {labels[idx]} moved {self._fmt(abs(deltas.at[idx, 'delta']))} {unit_name} quarter-over-quarter "
+                f"(threshold {self._fmt(self.change_threshold)})"
+            )
+        lines.extend(risk_lines or ["  - No negative values or threshold breaches detected"])
+        lines.append("")
+
+        if total_flags:
+            lines.append("- **Recommendations**:")
+            for idx in flags[flags > 0].sort_values(ascending=False, kind="stable").index:
+                lines.append(f"  - Review the {labels[idx]} segment ({int(flags[idx])} risk flag{'s' if flags[idx] > 1 else ''})")
+            lines.append("")
+
+        lines.append(RULE_SUMMARY_FOOTER)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _fmt(value: float) -> str:
+        """Format a number compactly (2 decimals at most)."""
+        return f"{round(float(value), 2):g}"
+
+    @staticmethod
+    def _executive_summary(labels, flags, negatives, breaches, big_moves, metric_count) -> str:
+        """Build the one-sentence executive summary."""
+        negative_count = int(negatives.values.sum())
+        breach_count = int(breaches.values.sum()) if not breaches.empty else 0
+        move_count = int(big_moves.sum())
+
+        findings = []
+        if negative_count:
+            findings.append(f"{negative_count} negative value{'s' if negative_count > 1 else ''}")
+        if breach_count:
+            findings.append(f"{breach_count} default-rate threshold breach{'es' if breach_count > 1 else ''}")
+        if move_count:
+            findings.append(f"{move_count} large quarter-over-quarter move{'s' if move_count > 1 else ''}")
+
+        scope = f"{len(labels)} segments across {metric_count} metric{'s' if metric_count != 1 else ''}"
+        if not findings:
+            return f"Rule-based review of {scope} found no negative values or threshold breaches."
+
+        worst = labels[flags.idxmax()]
+        found = findings[0] if len(findings) == 1 else f"{', '.join(findings[:-1])} and {findings[-1]}"
+        return f"Rule-based review of {scope} found {found}; {worst} carries the most risk flags."
+
+
+# Example usage
+if __name__ == "__main__":
+    table = pd.DataFrame(
+        [["Retail", "-2", "5"], ["Corporate", "7", "-1"], ["SME", "3", "2"]],
+        columns=["Segment", "Loan Default Rate (%)", "Net Rate (%)"]
+    )
+    print(RuleSummarizer().summarize(table))
@@ -0,0 +1,210 @@
+"""
+Single-flight module.
+
+Coalesces concurrent identical requests: the first caller for a key runs
+the call and every caller arriving while it is in flight waits for the
+same result, across threads (Streamlit sessions) and asyncio tasks alike.
+Errors are re-raised to every waiter; if the caller running the call is
+cancelled, the waiters start over and one of them runs it instead.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import CancelledError as FutureCancelledError
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+from modules.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome."""
+
+    def __init__(self):
+        """Initialize an empty in-flight table."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._shared = 0
+
+    def join(self, key: Hashable) -> Tuple[Future, bool]:
+        """
+        Join the in-flight call for a key, or start one.
+
+        A leader must settle the future with ``finish`` (or ``cancel``).
+
+        Args:
+            key: Request key (e.g. the summary cache key)
+
+        Returns:
+            Tuple of (shared future, whether the caller leads the call)
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self._shared += 1
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            return future, True
+
+    def pending(self, key: Hashable) -> bool:
+        """
+        Check whether a call for a key is in flight.
+
+        Args:
+            key: Request key
+
+        Returns:
+            True if a caller is running the call
+        """
+        with self._lock:
+            return key in self._calls
+
+    def finish(self, key: Hashable, future: Future, result=None, error: BaseException = None) -> None:
+        """
+        Settle a led call and let the next caller for its key start a new one.
+
+        Args:
+            key: Request key
+            future: Future returned by ``join``
+            result: Call result
+            error: Exception raised by the call, if it failed
+        """
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def cancel(self, key: Hashable, future: Future) -> None:
+        """
+        Abandon a led call; its waiters start over.
+
+        Args:
+            key: Request key
+            future: Future returned by ``join``
+        """
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+        future.cancel()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Run ``fn`` once for all concurrent callers with the same key (blocking).
+
+        Args:
+            key: Request key
+            fn: Call to run if no identical call is in flight
+
+        Returns:
+            The call's result
+
+        Raises:
+            Exception: Whatever the call raised
+        """
+        while True:
+            future, leader = self.join(key)
+            if leader:
+                return self._lead(key, future, fn)
+            logger.info("Waiting for an identical in-flight request")
+            try:
+                return future.result()
+            except FutureCancelledError:
+                logger.info("In-flight request was cancelled; retrying")
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``fn()`` once for all concurrent callers with the same key.
+
+        Waiters can be cancelled without affecting the call or other waiters.
+
+        Args:
+            key: Request key
+            fn: Coroutine function to run if no identical call is in flight
+
+        Returns:
+            The call's result
+
+        Raises:
+            Exception: Whatever the call raised
+        """
+        while True:
+            future, leader = self.join(key)
+            if leader:
+                try:
+                    result = await fn()
+                except asyncio.CancelledError:
+                    self.cancel(key, future)
+                    raise
+                except BaseException as e:
+                    self.finish(key, future, error=e)
+                    raise
+                self.finish(key, future, result)
+                return result
+
+            logger.info("Waiting for an identical in-flight request")
+            try:
+                # Shielded so cancelling this waiter leaves the shared future alone
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                if not future.cancelled() or _cancelling():
+                    raise
+                logger.info("In-flight request was cancelled; retrying")
+
+    def _lead(self, key: Hashable, future: Future, fn: Callable[[], T]) -> T:
+        """Run a blocking call as leader and settle its future."""
+        try:
+            result = fn()
+        except Exception as e:
+            self.finish(key, future, error=e)
+            raise
+        except BaseException:
+            # KeyboardInterrupt, GeneratorExit, ...: waiters start over
+            self.cancel(key, future)
+            raise
+        self.finish(key, future, result)
+        return result
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get in-flight statistics.
+
+        Returns:
+            Dictionary with calls currently in flight and callers that
+            shared another call's result
+        """
+        with self._lock:
+            return {"in_flight": len(self._calls), "shared": self._shared}
+
+
+def _cancelling() -> bool:
+    """Whether the current task itself has a pending cancellation request."""
+    task = asyncio.current_task()
+    cancelling = getattr(task, "cancelling", None)
+    return bool(cancelling()) if cancelling is not None else False
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    flight = SingleFlight()
+    calls = []
+
+    def slow_summary():
+        calls.append(1)
+        time.sleep(0.2)
+        return "summary"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: flight.do("table-1", slow_summary), range(8)))
+
+    print(results, f"{len(calls)} call(s)", flight.get_stats())
@@ -0,0 +1,219 @@
+"""
+LLM summary cache module.
+
+Persists generated summaries in SQLite so identical requests are answered
+locally across sessions and restarts.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from modules.logger import get_logger
+from modules.config_manager import get_config
+
+logger = get_logger(__name__)
+config = get_config()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    cache_key TEXT PRIMARY KEY,
+    summary TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+)
+"""
+
+
+def sha256_text(text: str) -> str:
+    """
+    Hash a string.
+
+    Args:
+        text: Text to hash
+
+    Returns:
+        Hex SHA-256 digest of the UTF-8 encoded text
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """SQLite-backed cache of LLM summaries with TTL and size-bounded eviction."""
+
+    def __init__(self):
+        """Initialize summary cache with configuration."""
+        self.enabled = config.get("cache.summary.enabled", True)
+        self.db_path = Path(config.get("cache.summary.db_path", ".cache/summaries.sqlite3"))
+        self.ttl_seconds = float(config.get("cache.summary.ttl_hours", 720)) * 3600
+        self.max_entries = config.get("cache.summary.max_entries", 10000)
+
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if self.enabled:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # Shared by Streamlit script threads; access is serialized by _lock
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON summaries (last_access)")
+
+        logger.info(f"SummaryCache initialized (enabled={self.enabled}, db={self.db_path})")
+
+    @staticmethod
+    def prompt_version(template: str, system_role: str) -> str:
+        """
+        Fingerprint the prompt template and system role.
+
+        Args:
+            template: Prompt template text
+            system_role: System role message
+
+        Returns:
+            Hex digest that changes whenever either input is edited
+        """
+        return sha256_text(json.dumps([template, system_role]))
+
+    @staticmethod
+    def make_key(
+            model_name: str,
+            temperature: float,
+            max_tokens: int,
+            prompt: str,
+            prompt_version: str
+    ) -> str:
+        """
+        Build the cache key of a summary request.
+
+        Args:
+            model_name: LLM model name
+            temperature: Sampling temperature
+            max_tokens: Completion token limit
+            prompt: Fully rendered user prompt
+            prompt_version: Result of prompt_version()
+
+        Returns:
+            Hex SHA-256 cache key
+        """
+        return sha256_text(json.dumps({
+            "model": model_name,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "prompt": sha256_text(prompt),
+            "prompt_version": prompt_version,
+        }, sort_keys=True))
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached summary.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached summary, or None if missing or expired
+        """
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary, created_at FROM summaries WHERE cache_key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM summaries WHERE cache_key = ?", (key,))
+                self._stats["misses"] += 1
+                return None
+
+            self._conn.execute("UPDATE summaries SET last_access = ? WHERE cache_key = ?", (now, key))
+            self._stats["hits"] += 1
+
+        logger.info(f"Summary cache hit: {key[:12]}")
+        return row[0]
+
+    def put(self, key: str, summary: str, model_name: str, prompt_version: str) -> None:
+        """
+        Store a summary, evicting expired and least recently used entries.
+
+        Args:
+            key: Cache key from make_key
+            summary: Generated summary
+            model_name: LLM model name
+            prompt_version: Result of prompt_version()
+        """
+        if not self.enabled or not summary:
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, summary, model_name, prompt_version, now, now)
+                )
+                self._evict(now)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write summary cache entry: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and the number of stored entries
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = (
+                self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+                if self._conn else 0
+            )
+
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        """Remove all cached summaries."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._conn.execute("DELETE FROM summaries")
+        logger.info("Summary cache cleared")
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then the least recently used ones above max_entries (lock held)."""
+        expired = self._conn.execute(
+            "DELETE FROM summaries WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+
+        overflow = self._conn.execute(
+            "DELETE FROM summaries WHERE cache_key IN ("
+            "SELECT cache_key FROM summaries ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        ).rowcount
+
+        if expired or overflow:
+            self._stats["evictions"] += expired + overflow
+            logger.debug(f"Summary cache evicted {expired} expired and {overflow} LRU entries")
+
+
+# Example usage
+if __name__ == "__main__":
+    cache = SummaryCache()
+    version = SummaryCache.prompt_version("Analyze: {table_data}", "You are an analyst.")
+    key = SummaryCache.make_key("llama-3.1-70b-versatile", 0.3, 1024, "Analyze: | A |", version)
+    cache.put(key, "- Summary", "llama-3.1-70b-versatile", version)
+    print(f"Cached: {cache.get(key)}")
+    print(f"Stats: {cache.get_stats()}")
@@ -0,0 +1,228 @@
+"""
+Summary jobs module.
+
+Runs summary requests on a bounded pool of background threads so the
+Streamlit script thread never waits on the LLM (retries and backoff
+included). Pages submit a job, keep its id in session state and poll its
+status; jobs are shared by all sessions through the cached components.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, Iterator, Optional
+
+from modules.logger import get_logger
+from modules.config_manager import get_config
+
+logger = get_logger(__name__)
+config = get_config()
+
+# Job states shown by the UI
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+
+@dataclass
+class SummaryJob:
+    """Status of a background summary job."""
+    job_id: str
+    label: str = ""
+    state: str = JOB_PENDING
+    result: Optional[str] = None
+    error: Optional[str] = None
+    partial: str = ""
+    meta: dict = field(default_factory=dict)
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has stopped (successfully or not)."""
+        return self.state in (JOB_DONE, JOB_FAILED, JOB_CANCELLED)
+
+
+class SummaryJobQueue:
+    """Bounded worker pool for summary requests, tracked by job id."""
+
+    def __init__(self):
+        """Initialize job queue with configuration."""
+        self.max_workers = max(1, config.get("llm.jobs.max_workers", 4))
+        self.max_pending = max(1, config.get("llm.jobs.max_pending", 32))
+        self.retention = config.get("llm.jobs.retention_seconds", 600)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="summary-job")
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, SummaryJob] = {}
+        self._futures = {}
+
+        logger.info(f"SummaryJobQueue initialized (workers={self.max_workers}, max_pending={self.max_pending})")
+
+    def submit(self, fn: Callable, *args, label: str = "", meta: Optional[dict] = None) -> Optional[str]:
+        """
+        Queue a summary request.
+
+        ``fn(*args)`` returns the summary text, or an iterator of text deltas
+        (e.g. LLMService.generate_summary_stream) that the job collects while
+        exposing the text so far as ``partial``.
+
+        Args:
+            fn: Summary function
+            *args: Arguments for fn
+            label: Description used in logs and the UI
+            meta: Caller data kept with the job (e.g. the prompt note)
+
+        Returns:
+            Job id, or None if max_pending jobs are already waiting or running
+        """
+        with self._lock:
+            self._prune()
+            active = sum(1 for job in self._jobs.values() if not job.finished)
+            if active >= self.max_pending:
+                logger.warning(f"Summary job queue is full ({active} jobs); rejected {label or 'job'}")
+                return None
+
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = SummaryJob(job_id=job_id, label=label, meta=dict(meta or {}))
+            self._futures[job_id] = self._executor.submit(self._run, job_id, fn, args)
+
+        logger.info(f"Queued summary job {job_id[:8]} ({label})")
+        return job_id
+
+    def status(self, job_id: str) -> Optional[SummaryJob]:
+        """
+        Get the status of a job without waiting for it.
+
+        Args:
+            job_id: Id returned by submit
+
+        Returns:
+            Copy of the job, or None if the id is unknown or expired
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return replace(job) if job is not None else None
+
+    def pop(self, job_id: str) -> Optional[SummaryJob]:
+        """
+        Collect a finished job, removing it from the queue.
+
+        Args:
+            job_id: Id returned by submit
+
+        Returns:
+            The finished job, or None if it is unknown or still running
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job.finished:
+                return None
+            del self._jobs[job_id]
+            self._futures.pop(job_id, None)
+            return job
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job that has not started yet.
+
+        Args:
+            job_id: Id returned by submit
+
+        Returns:
+            True if the job was cancelled
+        """
+        with self._lock:
+            future = self._futures.get(job_id)
+            if future is None or not future.cancel():
+                return False
+            self._finish(self._jobs[job_id], JOB_CANCELLED)
+            return True
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get job counts by state.
+
+        Returns:
+            Dictionary of state -> number of tracked jobs
+        """
+        with self._lock:
+            stats = {state: 0 for state in (JOB_PENDING, JOB_RUNNING, JOB_DONE, JOB_FAILED, JOB_CANCELLED)}
+            for job in self._jobs.values():
+                stats[job.state] += 1
+            return stats
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Stop the workers, dropping jobs that have not started.
+
+        Args:
+            wait: Wait for running jobs to finish
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, job_id: str, fn: Callable, args: tuple) -> None:
+        """Run a job on a worker thread and record its outcome."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.state = JOB_RUNNING
+            job.started_at = time.time()
+
+        try:
+            result = fn(*args)
+            if isinstance(result, Iterator):
+                for delta in result:
+                    with self._lock:
+                        job.partial += delta
+                result = job.partial
+
+        except Exception as e:
+            logger.error(f"Summary job {job_id[:8]} ({job.label}) failed: {str(e)}", exc_info=True)
+            with self._lock:
+                job.error = str(e)
+                self._finish(job, JOB_FAILED)
+            return
+
+        with self._lock:
+            job.result = result
+            self._finish(job, JOB_DONE)
+        logger.info(f"Summary job {job_id[:8]} ({job.label}) done in {job.finished_at - job.started_at:.2f}s")
+
+    @staticmethod
+    def _finish(job: SummaryJob, state: str) -> None:
+        """Mark a job finished (caller holds the lock)."""
+        job.state = state
+        job.finished_at = time.time()
+
+    def _prune(self) -> None:
+        """Forget finished jobs nobody collected within the retention period (caller holds the lock)."""
+        cutoff = time.time() - self.retention
+        for job_id in [
+            job_id for job_id, job in self._jobs.items() if job.finished and job.finished_at < cutoff
+        ]:
+            del self._jobs[job_id]
+            self._futures.pop(job_id, None)
+
+
+# Example usage
+if __name__ == "__main__":
+    queue = SummaryJobQueue()
+
+    def slow_summary(text):
+        time.sleep(0.5)
+        return f"Summary of {text}"
+
+    job_id = queue.submit(slow_summary, "| A |", label="example")
+    while not queue.status(job_id).finished:
+        print(f"Waiting... {queue.get_stats()}")
+        time.sleep(0.2)
+
+    print(queue.pop(job_id))
+    queue.shutdown()
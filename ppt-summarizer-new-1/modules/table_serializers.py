@@ -0,0 +1,292 @@
+"""
+Table serializers module.
+
+Encodes tables for LLM prompts. Besides the padded markdown pipe table,
+tables can be written as compact CSV or TSV, JSON records or key: value
+rows, which spend far fewer prompt tokens on whitespace and dashes. The
+encoding is chosen per model (llm.table_encoding); "auto" picks the
+cheapest encoding for each table.
+
+streamlit_ppt_summary/modules/table_serializers.py keeps a copy of this
+registry for that app (which has no tabulate, so its markdown is unpadded);
+both copies must blank missing cells and escape pipes the same way, and
+their tests check the same cases.
+"""
+
+import csv
+import io
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from modules.logger import get_logger
+from modules.config_manager import get_config
+from modules.markdown_table import markdown_table
+
+logger = get_logger(__name__)
+config = get_config()
+
+MARKDOWN = "markdown"
+AUTO = "auto"
+
+# Serializer signature: (headers, rows of cell strings) -> prompt text
+Serializer = Callable[[Sequence[str], Sequence[Sequence[str]]], str]
+
+_SERIALIZERS: Dict[str, Serializer] = {}
+
+# Approximates the pre-tokenization of BPE tokenizers (tiktoken, Llama 3):
+# contractions, letter runs, up to three digits, punctuation runs and
+# whitespace runs each usually become one token
+_TOKEN_PIECE = re.compile(r"'(?:s|t|re|ve|m|ll|d)| ?[^\W\d_]+|\d{1,3}| ?[^\s\w]+|\s+(?!\S)|\s+")
+
+# Letter runs longer than this are usually split into several tokens
+_LONG_WORD = 8
+
+
+def register_serializer(name: str) -> Callable[[Serializer], Serializer]:
+    """
+    Register a table encoding under a name (decorator).
+
+    Args:
+        name: Encoding name used in llm.table_encoding
+
+    Returns:
+        Decorator that registers and returns the serializer
+    """
+    def decorator(serializer: Serializer) -> Serializer:
+        _SERIALIZERS[name] = serializer
+        return serializer
+    return decorator
+
+
+def available_encodings() -> List[str]:
+    """
+    List registered encodings.
+
+    Returns:
+        Encoding names in registration order
+    """
+    return list(_SERIALIZERS)
+
+
+def _pipe_cell(cell: str) -> str:
+    """Escape pipes in a markdown cell; a bare "|" would start a new column."""
+    return cell.replace("|", "\\|")
+
+
+@register_serializer(MARKDOWN)
+def _markdown(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> str:
+    """Padded pipe table laid out like DataFrame.to_markdown(index=False), with pipes escaped."""
+    return markdown_table(
+        [_pipe_cell(header) for header in headers],
+        [[_pipe_cell(cell) for cell in row] for row in rows]
+    )
+
+
+@register_serializer("csv")
+def _csv(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> str:
+    """Comma-separated values, quoted only where needed."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(headers)
+    writer.writerows(rows)
+    return buffer.getvalue().rstrip("\n")
+
+
+@register_serializer("tsv")
+def _tsv(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> str:
+    """Tab-separated values; tabs and line breaks inside cells become spaces."""
+    return "\n".join(
+        "\t".join(" ".join(cell.split()) if cell else "" for cell in line)
+        for line in [headers, *rows]
+    )
+
+
+@register_serializer("json")
+def _json(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> str:
+    """JSON array of row objects; empty cells are omitted."""
+    keys = _unique_headers(headers)
+    records = [{key: cell for key, cell in zip(keys, row) if cell} for row in rows]
+    return json.dumps(records, ensure_ascii=False, separators=(",", ":"))
+
+
+@register_serializer("kv")
+def _key_value(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> str:
+    """One line per row of "column: value" pairs; empty cells are omitted."""
+    return "\n".join(
+        "; ".join(f"{header}: {cell}" for header, cell in zip(headers, row) if cell)
+        for row in rows
+    )
+
+
+def _unique_headers(headers: Sequence[str]) -> List[str]:
+    """Suffix repeated column names (merged header cells) so JSON keys stay distinct."""
+    seen: Dict[str, int] = {}
+    unique = []
+    for header in headers:
+        count = seen.get(header, 0) + 1
+        seen[header] = count
+        unique.append(header if count == 1 else f"{header} ({count})")
+    return unique
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the prompt tokens of a text without a tokenizer.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Approximate token count
+    """
+    count = 0
+    for piece in _TOKEN_PIECE.findall(text):
+        word = piece.strip()
+        count += 1 + len(word) // _LONG_WORD if word.isalpha() else 1
+    return count
+
+
+def _cell_text(cell: Any) -> str:
+    """Cell string; None, NaN, NaT and pd.NA are empty cells, not the text "nan"."""
+    if pd.api.types.is_scalar(cell) and pd.isna(cell):
+        return ""
+    return str(cell)
+
+
+def _prepare(
+        headers: Sequence[Any],
+        rows: Sequence[Sequence[Any]],
+        emphasis: Optional[np.ndarray]
+) -> Tuple[List[str], List[List[str]]]:
+    """Convert cells to strings and wrap emphasized non-empty cells in **."""
+    headers = [str(header) for header in headers]
+    rows = [[_cell_text(cell) for cell in row] for row in rows]
+    if emphasis is not None and emphasis.any():
+        for r, c in zip(*np.nonzero(emphasis)):
+            if r < len(rows) and c < len(rows[r]) and rows[r][c]:
+                rows[r][c] = f"**{rows[r][c]}**"
+    return headers, rows
+
+
+def token_report(
+        headers: Sequence[Any],
+        rows: Sequence[Sequence[Any]],
+        emphasis: Optional[np.ndarray] = None
+) -> List[Tuple[str, int, int]]:
+    """
+    Measure every registered encoding on one table.
+
+    Args:
+        headers: Column names
+        rows: Row-major cell values
+        emphasis: Boolean mask of cells to mark as **value**
+
+    Returns:
+        List of (encoding, estimated tokens, characters), cheapest first
+    """
+    headers, rows = _prepare(headers, rows, emphasis)
+    report = []
+    for name, serializer in _SERIALIZERS.items():
+        text = serializer(headers, rows)
+        report.append((name, estimate_tokens(text), len(text)))
+    return sorted(report, key=lambda entry: (entry[1], entry[2]))
+
+
+def cheapest_encoding(
+        headers: Sequence[Any],
+        rows: Sequence[Sequence[Any]],
+        emphasis: Optional[np.ndarray] = None
+) -> str:
+    """
+    Pick the encoding with the fewest estimated tokens for a table.
+
+    Args:
+        headers: Column names
+        rows: Row-major cell values
+        emphasis: Boolean mask of cells to mark as **value**
+
+    Returns:
+        Encoding name
+    """
+    return token_report(headers, rows, emphasis)[0][0]
+
+
+def serialize_table(
+        headers: Sequence[Any],
+        rows: Sequence[Sequence[Any]],
+        encoding: str = MARKDOWN,
+        emphasis: Optional[np.ndarray] = None
+) -> str:
+    """
+    Encode a table for a prompt.
+
+    Args:
+        headers: Column names
+        rows: Row-major cell values
+        encoding: Registered encoding name, or "auto" for the cheapest one
+        emphasis: Boolean mask of cells to mark as **value**
+
+    Returns:
+        Table text (markdown if the encoding is unknown)
+    """
+    headers, rows = _prepare(headers, rows, emphasis)
+
+    if encoding == AUTO:
+        texts = {name: serializer(headers, rows) for name, serializer in _SERIALIZERS.items()}
+        return min(texts.values(), key=lambda text: (estimate_tokens(text), len(text)))
+
+    serializer = _SERIALIZERS.get(encoding)
+    if serializer is None:
+        logger.warning(f"Unknown table encoding '{encoding}', using '{MARKDOWN}'")
+        serializer = _SERIALIZERS[MARKDOWN]
+    return serializer(headers, rows)
+
+
+def serialize_dataframe(df: pd.DataFrame, encoding: str = MARKDOWN, emphasis: Optional[np.ndarray] = None) -> str:
+    """
+    Encode a DataFrame (without its index) for a prompt.
+
+    Args:
+        df: Table DataFrame
+        encoding: Registered encoding name, or "auto"
+        emphasis: Boolean mask of cells to mark as **value**
+
+    Returns:
+        Table text
+    """
+    return serialize_table(list(df.columns), df.to_numpy(dtype=object).tolist(), encoding, emphasis)
+
+
+def table_encoding_for(model_name: str) -> str:
+    """
+    Get the configured table encoding for a model.
+
+    llm.table_encoding.models maps model names to encodings; other models
+    use llm.table_encoding.default.
+
+    Args:
+        model_name: LLM model name
+
+    Returns:
+        Encoding name ("auto" or a registered encoding)
+    """
+    models = config.get("llm.table_encoding.models") or {}
+    encoding = models.get(model_name, config.get("llm.table_encoding.default", MARKDOWN))
+    if encoding != AUTO and encoding not in _SERIALIZERS:
+        logger.warning(f"Unknown table encoding '{encoding}' for {model_name}, using '{MARKDOWN}'")
+        return MARKDOWN
+    return encoding
+
+
+# Example usage
+if __name__ == "__main__":
+    headers = ["Segment", "Loan Default Rate (%)", "Net Rate (%)"]
+    rows = [["Retail", "-2", "5"], ["Corporate", "7", "-1"], ["SME", "3", "2"]]
+    for name, tokens, chars in token_report(headers, rows):
+        print(f"{name:>8}: {tokens:4d} tokens, {chars:4d} chars")
+        print(serialize_table(headers, rows, name))
+        print()
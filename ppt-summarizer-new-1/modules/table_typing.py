@@ -0,0 +1,137 @@
+"""
+Table typing module.
+
+Converts extracted all-string tables into typed DataFrames in one vectorized
+pass: numeric cells become float columns, the segment label column becomes
+categorical, and each numeric column's unit is recorded.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from modules.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Cells that mean "no value" rather than "not a number"
+_MISSING = {"", "-", "–", "—", "n/a", "na", "nan", "none", "null", "tbd"}
+
+# Unit of a numeric column, most specific first
+_UNIT_PRIORITY = ("bp", "%", "$", "€", "£", "")
+
+_CURRENCY = r"[$€£]"
+
+
+def parse_numbers(values: pd.Series) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """
+    Parse display strings into floats.
+
+    Handles %, currency symbols, bp/bps suffixes, thousands separators,
+    leading "+", unicode minus and accounting-style "(2.3)" negatives.
+
+    Args:
+        values: Series of display strings
+
+    Returns:
+        Tuple of (float Series with NaN where unparseable, boolean Series
+        marking missing-value cells, unit Series)
+    """
+    text = values.astype(str).str.strip()
+    lowered = text.str.lower()
+    missing = lowered.isin(_MISSING)
+
+    unit = pd.Series("", index=values.index, dtype=object)
+    unit = unit.mask(text.str.contains(_CURRENCY, regex=True), text.str.extract(f"({_CURRENCY})", expand=False))
+    unit = unit.mask(text.str.endswith("%"), "%")
+    unit = unit.mask(lowered.str.contains(r"\d\s*bps?$", regex=True), "bp")
+
+    cleaned = (
+        text.str.replace("−", "-", regex=False)
+        .str.replace(r"(?i)\s*bps?$", "", regex=True)
+        .str.replace(r"[%,+\s]|" + _CURRENCY, "", regex=True)
+        .str.replace(r"^\((.*)\)$", r"-\1", regex=True)
+    )
+    numbers = pd.to_numeric(cleaned, errors="coerce")
+
+    return numbers, missing, unit
+
+
+def normalize_table(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build a typed copy of an all-string table.
+
+    A column is numeric when every non-missing cell parses; it becomes
+    float64 with NaN for missing cells. The first non-numeric column is the
+    segment label and becomes categorical. Column units are stored in
+    ``typed.attrs["units"]`` (keyed by position) and the label position in
+    ``typed.attrs["label_column"]``.
+
+    Args:
+        df: Table DataFrame with display strings
+
+    Returns:
+        Typed DataFrame with the same shape, columns and index
+    """
+    n_rows, n_cols = df.shape
+    if n_rows == 0 or n_cols == 0:
+        typed = df.copy()
+        typed.attrs.update(units={}, label_column=None)
+        return typed
+
+    # Parse every cell in one pass over the flattened table
+    flat = pd.Series(df.to_numpy(dtype=object).ravel(order="F"))
+    numbers, missing, units = parse_numbers(flat)
+
+    numbers = numbers.to_numpy().reshape((n_rows, n_cols), order="F")
+    missing = missing.to_numpy().reshape((n_rows, n_cols), order="F")
+    units = units.to_numpy().reshape((n_rows, n_cols), order="F")
+
+    parsed = ~np.isnan(numbers)
+    numeric_mask = (parsed | missing).all(axis=0) & parsed.any(axis=0)
+
+    columns: Dict[int, pd.Series] = {}
+    column_units: Dict[int, str] = {}
+    label_column: Optional[int] = None
+
+    for pos in range(n_cols):
+        if numeric_mask[pos]:
+            columns[pos] = pd.Series(numbers[:, pos], index=df.index, dtype="float64")
+            present = set(units[parsed[:, pos], pos])
+            column_units[pos] = next(u for u in _UNIT_PRIORITY if u in present or u == "")
+        elif label_column is None:
+            label_column = pos
+            columns[pos] = df.iloc[:, pos].astype(str).str.strip().astype("category")
+        else:
+            columns[pos] = df.iloc[:, pos]
+
+    typed = pd.concat(columns, axis=1)
+    typed.columns = df.columns
+    typed.attrs.update(units=column_units, label_column=label_column)
+    return typed
+
+
+def is_typed(df: pd.DataFrame) -> bool:
+    """
+    Check whether a DataFrame was produced by normalize_table.
+
+    Args:
+        df: DataFrame
+
+    Returns:
+        True if the table carries typing metadata
+    """
+    return "units" in df.attrs
+
+
+# Example usage
+if __name__ == "__main__":
+    table = pd.DataFrame(
+        [["Retail", "−2%", "$1,200", "25bp"], ["Corporate", "(7)%", "$3,400", "n/a"]],
+        columns=["Segment", "Default Rate", "Balance", "Spread"]
+    )
+    typed = normalize_table(table)
+    print(typed.dtypes)
+    print(typed)
+    print(typed.attrs)
@@ -4,12 +4,15 @@ UI rendering module for Streamlit interface.
 Provides reusable UI components and layout functions.
 """
 
-from typing import List, Optional
+import time
+from typing import List, Optional, Set
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from modules.logger import get_logger
 from modules.content_extractor import SlideContent
+from modules.summary_jobs import JOB_PENDING, SummaryJob
 
 logger = get_logger(__name__)
 
@@ -57,12 +60,13 @@ class UIRenderer:
         return uploaded_file
 
     @staticmethod
-    def render_slide_navigation(total_slides: int) -> int:
+    def render_slide_navigation(total_slides: int, changed_slides: Optional[Set[int]] = None) -> int:
         """
         Render slide navigation controls.
 
         Args:
             total_slides: Total number of slides
+            changed_slides: Slide numbers changed since the previous deck version
 
         Returns:
             Selected slide number (0-indexed)
@@ -80,7 +84,9 @@ class UIRenderer:
             current_slide = st.selectbox(
                 "Select Slide",
                 range(total_slides),
-                format_func=lambda x: f"Slide {x + 1} of {total_slides}",
+                format_func=lambda x: f"Slide {x + 1} of {total_slides}" + (
+                    " · 🆕 changed" if changed_slides and x + 1 in changed_slides else ""
+                ),
                 key='slide_selector',
                 index=st.session_state.get('current_slide', 0)
             )
@@ -94,12 +100,15 @@ class UIRenderer:
         return current_slide
 
     @staticmethod
-    def render_slide_content(slide_content: SlideContent):
+    def render_slide_content(slide_content: SlideContent, interactive: bool = True, changed: bool = False):
         """
         Render slide content in two-column layout.
 
         Args:
             slide_content: SlideContent object containing extracted data
+            interactive: Render summary buttons and the summary panel. Set to
+                False for previews shown while the deck is still loading.
+            changed: Mark the slide as changed since the previous deck version
         """
         # Display slide title
         if slide_content.title:
@@ -107,6 +116,9 @@ class UIRenderer:
         else:
             st.markdown(f"### 📄 Slide {slide_content.slide_number}")
 
+        if changed:
+            st.caption("🆕 Changed since the previous version of this deck")
+
         st.markdown("---")
 
         # Two-column layout
@@ -137,17 +149,21 @@ class UIRenderer:
             st.markdown("#### 📊 Table Data")
 
             if slide_content.tables:
-                for idx, (df, table_text) in enumerate(
-                    zip(slide_content.tables, slide_content.table_texts), 1
-                ):
-                    with st.expander(f"Table {idx}", expanded=True):
-                        # Display table
+                formats = slide_content.table_formats or [None] * len(slide_content.tables)
+                captions = slide_content.table_captions
+                for idx, (df, formatting, caption) in enumerate(zip(slide_content.tables, formats, captions), 1):
+                    label = caption or f"Table {idx}"
+                    with st.expander(label, expanded=True):
+                        # Display table, highlighting the cells the deck highlights
                         st.dataframe(
-                            df,
+                            UIRenderer._highlight_table(df, formatting),
                             use_container_width=True,
                             hide_index=True
                         )
 
+                        if not interactive:
+                            continue
+
                         # Generate summary button
                         button_key = f"generate_summary_{slide_content.slide_number}_{idx}"
                         if st.button(
@@ -162,6 +178,9 @@ class UIRenderer:
             else:
                 st.info("No tables found on this slide.")
 
+        if not interactive:
+            return
+
         # Bottom section: AI-Generated Summary (Full Width)
         st.markdown("---")
 
@@ -209,15 +228,97 @@ class UIRenderer:
                 unsafe_allow_html=True
             )
 
+            # Report tables that were trimmed to fit the prompt budget
+            note_key = f'prompt_note_{slide_content.slide_number}_{active_summary_idx}'
+            if note_key in st.session_state:
+                st.caption(f"✂️ {st.session_state[note_key]}")
+
             # Add a clear button
             col1, col2, col3 = st.columns([1, 1, 1])
             with col2:
                 if st.button("🗑️ Clear Summary", use_container_width=True):
                     del st.session_state[summary_key]
+                    st.session_state.pop(note_key, None)
                     if 'active_summary_table' in st.session_state:
                         del st.session_state['active_summary_table']
                     st.rerun()
 
+    @staticmethod
+    def _highlight_table(df: pd.DataFrame, formatting):
+        """
+        Style table cells from the formatting masks captured at extraction.
+
+        Args:
+            df: Table DataFrame
+            formatting: CellFormatting aligned with df, or None
+
+        Returns:
+            Styler with bold/italic/red cells, or df unchanged when there is
+            nothing to highlight
+        """
+        if formatting is None or formatting.bold.shape != df.shape or not df.columns.is_unique:
+            return df
+
+        red = formatting.red
+        if not (formatting.bold.any() or formatting.italic.any() or red.any()):
+            return df
+
+        css = (
+            np.where(formatting.bold, "font-weight: bold;", "").astype(object)
+            + np.where(formatting.italic, "font-style: italic;", "")
+            + np.where(red, "color: #d62728;", "")
+        )
+        return df.style.apply(lambda _: css, axis=None)
+
+    @staticmethod
+    def render_rule_preview(table_index: int, summary: str):
+        """
+        Render an instant rule-based preview above a pending AI summary.
+
+        Args:
+            table_index: Table index on the slide (1-indexed)
+            summary: Rule-based summary text
+        """
+        st.markdown("### ⚡ Instant Preview")
+        with st.container(border=True):
+            st.markdown(f"**Rule-based checks for Table {table_index}**")
+            st.markdown(summary)
+        st.caption("The AI summary below replaces this preview once it is ready.")
+
+    @staticmethod
+    def render_summary_job(table_index: int, job: SummaryJob):
+        """
+        Render a summary that is being generated in the background.
+
+        Args:
+            table_index: Table index on the slide (1-indexed)
+            job: Latest status of the summary job
+        """
+        st.markdown("### 💡 AI-Generated Summary")
+
+        with st.container(border=True):
+            if job.state == JOB_PENDING:
+                st.markdown(f"**🤖 Analysis for Table {table_index}** · _queued…_")
+                return
+
+            elapsed = time.time() - (job.started_at or job.submitted_at)
+            st.markdown(f"**🤖 Analysis for Table {table_index}** · _generating… ({elapsed:.0f}s)_")
+            if job.partial:
+                st.markdown(job.partial)
+
+        st.caption("You can keep browsing slides; the summary appears here when it is ready.")
+
+    @staticmethod
+    def render_background_jobs(running: int):
+        """
+        Report summaries still being generated for other slides.
+
+        Args:
+            running: Number of unfinished summary jobs of this session
+        """
+        if running:
+            st.caption(f"⏳ {running} AI {'summary' if running == 1 else 'summaries'} in progress")
+
     @staticmethod
     def render_processing_status(message: str, status_type: str = "info"):
         """
@@ -265,6 +366,60 @@ class UIRenderer:
         with col4:
             st.metric("Total Tables", total_tables)
 
+    @staticmethod
+    def render_version_changes(changed_slides: Set[int], total_slides: int):
+        """
+        Render which slides changed since the previous version of the deck.
+
+        Args:
+            changed_slides: Slide numbers that were edited or added
+            total_slides: Total number of slides
+        """
+        if not changed_slides:
+            st.info(f"🔄 Same content as the previous version: all {total_slides} slides unchanged.")
+            return
+
+        listed = ", ".join(str(number) for number in sorted(changed_slides))
+        st.info(
+            f"🔄 New version of the deck: {len(changed_slides)} of {total_slides} slides changed "
+            f"(slides {listed}). Unchanged slides and their summaries were carried over."
+        )
+
+    @staticmethod
+    def render_batch_summary_button(slides: List[SlideContent]) -> bool:
+        """
+        Render the deck-wide "Summarize all tables" action.
+
+        Args:
+            slides: List of SlideContent objects
+
+        Returns:
+            True if the button was clicked
+        """
+        total_tables = sum(len(s.tables) for s in slides)
+        if total_tables == 0:
+            return False
+
+        summarized = sum(
+            1
+            for s in slides
+            for idx in range(1, len(s.tables) + 1)
+            if f'summary_{s.slide_number}_{idx}' in st.session_state
+        )
+
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            clicked = st.button(
+                "🤖 Summarize all tables",
+                key="summarize_all_tables",
+                disabled=summarized >= total_tables,
+                use_container_width=True
+            )
+        with col2:
+            st.caption(f"{summarized} of {total_tables} tables summarized")
+
+        return clicked
+
     @staticmethod
     def render_error(error_message: str):
         """
@@ -289,6 +444,59 @@ class UIRenderer:
         """
         return st.spinner(message)
 
+    @staticmethod
+    def render_cache_stats(stats: dict):
+        """
+        Render extraction cache statistics in the sidebar.
+
+        Args:
+            stats: Dictionary from ExtractionCache.get_stats()
+        """
+        with st.sidebar:
+            st.markdown("### 🗄️ Extraction Cache")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Hits", stats["memory_hits"] + stats["disk_hits"])
+            with col2:
+                st.metric("Misses", stats["misses"])
+
+            st.caption(
+                f"Hit rate: {stats['hit_rate']:.0%} · "
+                f"memory: {stats['memory_hits']} · disk: {stats['disk_hits']} · "
+                f"{stats['memory_entries']} decks in memory · "
+                f"{stats['disk_bytes'] / (1024 * 1024):.1f}MB on disk"
+            )
+
+    @staticmethod
+    def render_llm_status(status) -> bool:
+        """
+        Render the LLM health badge in the sidebar.
+
+        Args:
+            status: HealthStatus from LLMHealthMonitor.get_status()
+
+        Returns:
+            True if a re-check was requested
+        """
+        badges = {
+            "healthy": ":green[● Online]",
+            "degraded": ":orange[● Degraded]",
+            "unavailable": ":red[● Unavailable]",
+            "checking": ":gray[● Checking…]",
+        }
+
+        with st.sidebar:
+            st.markdown("### 🤖 LLM Status")
+            st.markdown(f"**{badges.get(status.state, status.state)}**")
+
+            if status.latency_ms is not None:
+                st.caption(f"Last probe: {status.latency_ms:.0f}ms")
+            if status.error:
+                st.caption(f"⚠️ {status.error}")
+
+            return st.button("🔄 Re-check", key="llm_recheck", disabled=status.state == "checking")
+
     @staticmethod
     def render_sidebar_info():
         """Render sidebar information."""
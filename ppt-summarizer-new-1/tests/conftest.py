@@ -38,7 +38,8 @@ def mock_config():
             'max_tokens': 1024,
             'timeout_seconds': 30,
             'max_retries': 3,
-            'retry_delay_seconds': 2
+            'retry_delay_seconds': 2,
+            'rate_limit': {'enabled': False}
         },
         'logging': {
             'level': 'INFO',
@@ -53,6 +54,10 @@ def mock_config():
         'prompts': {
             'template_file': 'prompt_template.txt',
             'system_role': 'You are a test assistant.'
+        },
+        'cache': {
+            # Tests opt in to the persistent summary cache explicitly
+            'summary': {'enabled': False}
         }
     }
 
@@ -226,3 +231,50 @@ def mock_slide_content():
         table_texts=["| Segment | Rate (%) |\n|---------|----------|\n| Commercial | 2.3 |"],
         has_content=True
     )
+
+
+@pytest.fixture
+def sample_pptx_file(tmp_path):
+    """Build a small loan forecast deck with a title, text, a table and a group."""
+    from pptx import Presentation
+    from pptx.dml.color import RGBColor
+    from pptx.util import Inches
+
+    prs = Presentation()
+
+    # Slide 1 - title and text
+    slide1 = prs.slides.add_slide(prs.slide_layouts[5])
+    slide1.shapes.title.text = "Quarterly Loan Forecast"
+    slide1.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(1)).text_frame.text = (
+        "Forecast for commercial banking segments."
+    )
+
+    # Slide 2 - title, table with red bold negatives, grouped text
+    slide2 = prs.slides.add_slide(prs.slide_layouts[5])
+    slide2.shapes.title.text = "Loan Performance Metrics"
+    rows = [
+        ["Segment", "Loan Default Rate (%)", "Net Rate (%)"],
+        ["Retail", "-2", "5"],
+        ["Corporate", "7", "-1"],
+        ["SME", "3", "2"],
+    ]
+    table = slide2.shapes.add_table(4, 3, Inches(0.5), Inches(1.5), Inches(9), Inches(3)).table
+    for r, row in enumerate(rows):
+        for c, value in enumerate(row):
+            table.cell(r, c).text = value
+            if r > 0 and c > 0 and value.startswith("-"):
+                run = table.cell(r, c).text_frame.paragraphs[0].runs[0]
+                run.font.color.rgb = RGBColor(255, 0, 0)
+                run.font.bold = True
+
+    group = slide2.shapes.add_group_shape()
+    group.shapes.add_textbox(Inches(1), Inches(5), Inches(4), Inches(1)).text_frame.text = "Grouped note"
+    group.shapes.add_textbox(Inches(5), Inches(5), Inches(4), Inches(1)).text_frame.text = "Source: Risk team"
+
+    # Slide 3 - empty
+    prs.slides.add_slide(prs.slide_layouts[6])
+
+    pptx_path = tmp_path / "sample_loan_forecast.pptx"
+    prs.save(str(pptx_path))
+
+    return str(pptx_path)
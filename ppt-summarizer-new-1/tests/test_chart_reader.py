@@ -0,0 +1,122 @@
+"""
+Unit tests for chart reader module.
+"""
+
+import pytest
+
+from modules.chart_reader import format_number, read_chart_blob
+
+C_NS = 'xmlns:c="http://schemas.openxmlformats.org/drawingml/2006/chart" ' \
+       'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+
+
+def _chart(plot: str, title: str = "") -> bytes:
+    return (
+        f'<c:chartSpace {C_NS}><c:chart>{title}<c:plotArea>{plot}</c:plotArea></c:chart></c:chartSpace>'
+    ).encode()
+
+
+def _str_cache(*values: str) -> str:
+    points = "".join(f'<c:pt idx="{i}"><c:v>{v}</c:v></c:pt>' for i, v in enumerate(values))
+    return f'<c:strRef><c:f>Sheet1!A1</c:f><c:strCache><c:ptCount val="{len(values)}"/>{points}</c:strCache></c:strRef>'
+
+
+def _num_cache(format_code: str, count: int, points: dict) -> str:
+    pts = "".join(f'<c:pt idx="{i}"><c:v>{v}</c:v></c:pt>' for i, v in points.items())
+    return (
+        f'<c:numRef><c:f>Sheet1!B2</c:f><c:numCache><c:formatCode>{format_code}</c:formatCode>'
+        f'<c:ptCount val="{count}"/>{pts}</c:numCache></c:numRef>'
+    )
+
+
+class TestFormatNumber:
+    """Test cases for Excel number format rendering."""
+
+    @pytest.mark.parametrize("value, code, expected", [
+        (0.0234, "0.0%", "2.3%"),
+        (1234567, "#,##0", "1,234,567"),
+        (1.25, '0.0"pp"', "1.3pp"),
+        (1.5, "0.0#", "1.5"),
+        (12345678, '#,##0.0,,"M"', "12.3M"),
+        (-12.5, "$#,##0.00;($#,##0.00)", "($12.50)"),
+        (3, "[$€-407] #,##0.00", "€ 3.00"),
+        (12345, "0.00E+00", "1.23E+04"),
+        (45382, "mmm-yy", "2024-03-31"),
+        (0.30000000000000004, "General", "0.3"),
+        (-4.0, "General", "-4"),
+        (0, '0.00;-0.00;"-"', "-"),
+        (0.0, '0.0%;(0.0%);"nil"', "nil"),
+        (0, "0.00;(0.00)", "0.00"),
+        (0.5, "#.00", ".50"),
+        (1234, '_($* #,##0_);_($* (#,##0);_($* "-"??_);_(@_)', "$ 1,234"),
+        (-1234, '_($* #,##0_);_($* (#,##0);_($* "-"??_);_(@_)', "$ (1,234)"),
+        (0, '_($* #,##0_);_($* (#,##0);_($* "-"??_);_(@_)', "$ -"),
+    ])
+    def test_formats(self, value, code, expected):
+        """Test the format codes charts use in practice."""
+        assert format_number(value, code) == expected
+
+
+class TestReadChart:
+    """Test cases for reading chart caches."""
+
+    def test_line_chart(self):
+        """Test categories, series names, missing points and the title."""
+        plot = (
+            '<c:lineChart>'
+            f'<c:ser><c:idx val="0"/><c:tx>{_str_cache("Retail")}</c:tx>'
+            f'<c:cat>{_str_cache("Q1", "Q2", "Q3")}</c:cat>'
+            f'<c:val>{_num_cache("0.0%", 3, {0: 0.021, 1: 0.025, 2: 0.031})}</c:val></c:ser>'
+            f'<c:ser><c:idx val="1"/><c:tx>{_str_cache("Corporate")}</c:tx>'
+            f'<c:cat>{_str_cache("Q1", "Q2", "Q3")}</c:cat>'
+            f'<c:val>{_num_cache("0.0%", 3, {0: 0.012, 2: 0.015})}</c:val></c:ser>'
+            '</c:lineChart>'
+        )
+        title = '<c:title><c:tx><c:rich><a:p><a:r><a:t>Default Rate Trend</a:t></a:r></a:p></c:rich></c:tx></c:title>'
+
+        chart = read_chart_blob(_chart(plot, title))
+
+        assert chart.caption == "Line chart: Default Rate Trend"
+        assert chart.series[0].format_code == "0.0%"
+        assert chart.cells().tolist() == [
+            ["Category", "Retail", "Corporate"],
+            ["Q1", "2.1%", "1.2%"],
+            ["Q2", "2.5%", ""],
+            ["Q3", "3.1%", "1.5%"],
+        ]
+
+    def test_multi_level_categories_and_unnamed_series(self):
+        """Test that outer category labels are carried over their points."""
+        levels = (
+            '<c:multiLvlStrRef><c:multiLvlStrCache><c:ptCount val="3"/>'
+            '<c:lvl><c:pt idx="0"><c:v>Q1</c:v></c:pt><c:pt idx="1"><c:v>Q2</c:v></c:pt>'
+            '<c:pt idx="2"><c:v>Q1</c:v></c:pt></c:lvl>'
+            '<c:lvl><c:pt idx="0"><c:v>2024</c:v></c:pt><c:pt idx="2"><c:v>2025</c:v></c:pt></c:lvl>'
+            '</c:multiLvlStrCache></c:multiLvlStrRef>'
+        )
+        plot = f'<c:barChart><c:ser><c:cat>{levels}</c:cat><c:val>{_num_cache("General", 3, {0: 1, 1: 2, 2: 3.5})}</c:val></c:ser></c:barChart>'
+
+        chart = read_chart_blob(_chart(plot))
+
+        assert chart.caption == "Bar chart"
+        assert chart.cells()[1:].tolist() == [["2024 Q1", "1"], ["2024 Q2", "2"], ["2025 Q1", "3.5"]]
+        assert chart.cells()[0, 1] == "Series 1"
+
+    def test_scatter_series_with_own_x_values(self):
+        """Test the long layout for series that do not share categories."""
+        def series(name, xs, ys):
+            return (
+                f'<c:ser><c:tx><c:v>{name}</c:v></c:tx>'
+                f'<c:xVal>{_num_cache("General", len(xs), dict(enumerate(xs)))}</c:xVal>'
+                f'<c:yVal>{_num_cache("0.0", len(ys), dict(enumerate(ys)))}</c:yVal></c:ser>'
+            )
+        plot = f'<c:scatterChart>{series("A", [1, 2], [3, 4])}{series("B", [5], [6])}</c:scatterChart>'
+
+        assert read_chart_blob(_chart(plot)).cells().tolist() == [
+            ["Series", "X", "Value"], ["A", "1", "3.0"], ["A", "2", "4.0"], ["B", "5", "6.0"]
+        ]
+
+    def test_chart_without_data(self):
+        """Test that charts without cached values are skipped."""
+        assert read_chart_blob(_chart('<c:pieChart><c:ser><c:tx><c:v>x</c:v></c:tx></c:ser></c:pieChart>')) is None
+        assert read_chart_blob(_chart('')) is None
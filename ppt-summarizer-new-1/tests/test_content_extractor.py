@@ -3,6 +3,7 @@ Unit tests for content extractor module.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from unittest.mock import Mock, MagicMock
 
@@ -204,3 +205,493 @@ class TestContentExtractor:
 
         assert len(slide_content.tables) == 2
         assert len(slide_content.table_texts) == 2
+
+    def test_single_pass_visitor_on_real_deck(self, mock_config, sample_pptx_file):
+        """Test that one traversal fills title, text, tables and counters."""
+        from pptx import Presentation
+
+        extractor = ContentExtractor()
+        slides = extractor.extract_all_slides(Presentation(sample_pptx_file))
+
+        assert len(slides) == 3
+
+        table_slide = slides[1]
+        assert table_slide.title == "Loan Performance Metrics"
+        assert "Grouped note" in table_slide.text_content
+        assert "Source: Risk team" in table_slide.text_content
+        assert len(table_slide.tables) == 1
+        assert list(table_slide.tables[0].columns) == ["Segment", "Loan Default Rate (%)", "Net Rate (%)"]
+
+        # title + table + group + two grouped text boxes
+        assert table_slide.shapes_visited == 5
+        assert table_slide.cells_read == 12
+
+        assert slides[2].has_content is False
+        assert slides[2].shapes_visited == 0
+
+    def test_red_bold_cells_marked_in_prompt(self, mock_config, sample_pptx_file):
+        """Test that highlighted cells reach the LLM text and the masks."""
+        from pptx import Presentation
+
+        table_slide = ContentExtractor().extract_all_slides(Presentation(sample_pptx_file))[1]
+        formatting = table_slide.table_formats[0]
+
+        # Masks are aligned with the DataFrame body (header row excluded)
+        assert formatting.bold.shape == table_slide.tables[0].shape
+        assert formatting.emphasis.tolist() == [
+            [False, True, False],
+            [False, False, True],
+            [False, False, False],
+        ]
+        assert "| **-2** " in table_slide.table_texts[0]
+        assert "| **-1** " in table_slide.table_texts[0]
+        assert "**5**" not in table_slide.table_texts[0]
+
+    def test_formatting_not_preserved(self, mock_config, sample_pptx_file):
+        """Test that extraction.preserve_formatting: false skips masks and markers."""
+        from pptx import Presentation
+
+        mock_config.set('extraction.preserve_formatting', False)
+
+        table_slide = ContentExtractor().extract_all_slides(Presentation(sample_pptx_file))[1]
+
+        assert not table_slide.table_formats[0].emphasis.any()
+        assert "**" not in table_slide.table_texts[0]
+        assert " -2 |" in table_slide.table_texts[0]
+
+    def test_get_slide_summary_reports_counters(self, mock_config, mock_slide_content):
+        """Test that traversal counters are part of the slide summary."""
+        extractor = ContentExtractor()
+        mock_slide_content.shapes_visited = 4
+        mock_slide_content.cells_read = 6
+
+        summary = extractor.get_slide_summary(mock_slide_content)
+
+        assert summary['shapes_visited'] == 4
+        assert summary['cells_read'] == 6
+
+    def test_extract_iter_yields_progressively(self, mock_config, mock_presentation):
+        """Test that extract_iter yields one SlideContent per slide lazily."""
+        extractor = ContentExtractor()
+
+        iterator = extractor.extract_iter(mock_presentation)
+        first = next(iterator)
+
+        assert isinstance(first, SlideContent)
+        assert first.slide_number == 1
+        assert [s.slide_number for s in iterator] == [2]
+
+    def test_extract_iter_isolates_slide_errors(self, mock_config, mock_presentation):
+        """Test that a failing slide does not discard the others."""
+        extractor = ContentExtractor()
+        original = extractor.extract_slide_content
+
+        def flaky(slide, slide_number):
+            if slide_number == 1:
+                raise RuntimeError("corrupt slide")
+            return original(slide, slide_number)
+
+        extractor.extract_slide_content = flaky
+
+        slides = list(extractor.extract_iter(mock_presentation))
+
+        assert [s.slide_number for s in slides] == [1, 2]
+        assert slides[0].has_content is False
+
+    def test_extract_all_slides_keeps_partial_results(self, mock_config):
+        """Test that slides extracted before a fatal error are kept."""
+        extractor = ContentExtractor()
+
+        def broken_slides():
+            yield MagicMock()
+            raise RuntimeError("package truncated")
+
+        presentation = MagicMock()
+        presentation.slides = broken_slides()
+
+        slides = extractor.extract_all_slides(presentation)
+
+        assert len(slides) == 1
+
+
+class TestParallelExtraction:
+    """Test cases for process-pool extraction."""
+
+    @staticmethod
+    def _enable_parallel(mock_config):
+        mock_config.set('extraction.parallel.enabled', True)
+        mock_config.set('extraction.parallel.workers', 2)
+        mock_config.set('extraction.parallel.min_slides', 3)
+        mock_config.set('extraction.parallel.chunksize', 1)
+
+    def test_parallel_matches_sequential(self, mock_config, sample_pptx_file):
+        """Test that worker results equal in-process extraction, in slide order."""
+        from pptx import Presentation
+        from modules.ooxml_reader import OOXMLPresentation
+
+        expected = ContentExtractor().extract_all_slides(Presentation(sample_pptx_file))
+
+        self._enable_parallel(mock_config)
+        extractor = ContentExtractor()
+        try:
+            for source in (Presentation(sample_pptx_file), OOXMLPresentation(sample_pptx_file)):
+                actual = extractor.extract_all_slides(source)
+
+                assert [s.slide_number for s in actual] == [1, 2, 3]
+                for exp, act in zip(expected, actual):
+                    assert act.title == exp.title
+                    assert act.text_content == exp.text_content
+                    assert act.table_texts == exp.table_texts
+                    assert act.cells_read == exp.cells_read
+                    for exp_fmt, act_fmt in zip(exp.table_formats, act.table_formats):
+                        assert (act_fmt.color == exp_fmt.color).all()
+        finally:
+            extractor.shutdown()
+
+    def test_small_decks_stay_in_process(self, mock_config, sample_pptx_file, monkeypatch):
+        """Test the minimum deck size for parallelism."""
+        from pptx import Presentation
+
+        self._enable_parallel(mock_config)
+        mock_config.set('extraction.parallel.min_slides', 4)
+        extractor = ContentExtractor()
+        monkeypatch.setattr(extractor, '_get_pool', Mock(side_effect=AssertionError("pool used")))
+
+        assert len(extractor.extract_all_slides(Presentation(sample_pptx_file))) == 3
+
+    def test_broken_pool_falls_back_to_sequential(self, mock_config, sample_pptx_file, monkeypatch):
+        """Test that a pool failure finishes the deck in-process."""
+        from concurrent.futures.process import BrokenProcessPool
+        from pptx import Presentation
+
+        self._enable_parallel(mock_config)
+        extractor = ContentExtractor()
+        monkeypatch.setattr(extractor, '_get_pool', Mock(side_effect=BrokenProcessPool("worker died")))
+
+        slides = extractor.extract_all_slides(Presentation(sample_pptx_file))
+
+        assert [s.slide_number for s in slides] == [1, 2, 3]
+        assert slides[1].title == "Loan Performance Metrics"
+
+
+class TestIncrementalExtraction:
+    """Test cases for re-extracting only the slides that changed."""
+
+    @staticmethod
+    def _extract(path, previous=None, extractor=None):
+        from modules.file_parser import FileParser
+        from modules.ooxml_reader import OOXMLPresentation
+
+        presentation = OOXMLPresentation(path)
+        fingerprints = FileParser().slide_fingerprints(presentation)
+        return (extractor or ContentExtractor()).extract_all_slides(presentation, fingerprints, previous)
+
+    @staticmethod
+    def _edit_table_slide(sample_pptx_file, tmp_path):
+        from pptx import Presentation
+
+        prs = Presentation(sample_pptx_file)
+        prs.slides[1].shapes.title.text = "Loan Performance Metrics (Q3)"
+        path = str(tmp_path / "edited.pptx")
+        prs.save(path)
+        return path
+
+    def test_unchanged_slides_are_reused(self, mock_config, sample_pptx_file, tmp_path):
+        """Test that only edited slides are extracted again."""
+        first = self._extract(sample_pptx_file)
+        assert all(s.fingerprint for s in first)
+
+        extractor = ContentExtractor()
+        extracted = []
+        original = extractor.extract_slide_content
+
+        def tracking(slide, slide_number):
+            extracted.append(slide_number)
+            return original(slide, slide_number)
+
+        extractor.extract_slide_content = tracking
+        second = self._extract(self._edit_table_slide(sample_pptx_file, tmp_path), first, extractor)
+
+        assert extracted == [2]
+        assert second[1].title == "Loan Performance Metrics (Q3)"
+        assert second[1].fingerprint != first[1].fingerprint
+        assert second[0].text_content is first[0].text_content
+        assert second[2].compact_tables is first[2].compact_tables
+        assert second[0].fingerprint == first[0].fingerprint
+
+    def test_reused_slides_take_their_new_number(self, mock_config, sample_pptx_file, tmp_path):
+        """Test that a slide moved by deleting an earlier one is reused under its new number."""
+        from pptx import Presentation
+
+        first = self._extract(sample_pptx_file)
+
+        prs = Presentation(sample_pptx_file)
+        sld_id_lst = prs.slides._sldIdLst
+        sld_id_lst.remove(sld_id_lst[0])
+        path = str(tmp_path / "shorter.pptx")
+        prs.save(path)
+
+        second = self._extract(path, first)
+
+        assert [s.slide_number for s in second] == [1, 2]
+        assert second[0].title == "Loan Performance Metrics"
+        assert second[0].compact_tables[0] is first[1].compact_tables[0]
+        assert first[1].slide_number == 2
+
+    def test_parallel_extraction_only_sends_changed_slides(self, mock_config, sample_pptx_file, tmp_path, monkeypatch):
+        """Test that unchanged slides never reach the worker pool."""
+        from modules import content_extractor
+
+        first = self._extract(sample_pptx_file)
+
+        mock_config.set('extraction.parallel.enabled', True)
+        mock_config.set('extraction.parallel.workers', 2)
+        mock_config.set('extraction.parallel.min_slides', 1)
+        extractor = ContentExtractor()
+
+        pool = Mock()
+        pool.map = lambda fn, jobs, chunksize: map(fn, list(jobs))
+        monkeypatch.setattr(extractor, '_get_pool', Mock(return_value=pool))
+        monkeypatch.setattr(content_extractor, '_worker_extractor', ContentExtractor(), raising=False)
+
+        jobs = []
+        original = content_extractor._extract_detached_slide
+        monkeypatch.setattr(
+            content_extractor, '_extract_detached_slide', lambda job: jobs.append(job[0]) or original(job)
+        )
+
+        second = self._extract(self._edit_table_slide(sample_pptx_file, tmp_path), first, extractor)
+
+        assert jobs == [2]
+        assert [s.slide_number for s in second] == [1, 2, 3]
+        assert second[1].title == "Loan Performance Metrics (Q3)"
+        assert second[1].fingerprint is not None
+
+
+class TestCompactSlideContent:
+    """Test cases for the compact, lazily materialized SlideContent."""
+
+    def test_tables_are_materialized_on_access(self, mock_config, sample_pptx_file):
+        """Test that DataFrames and LLM text are built on first access and memoized."""
+        from pptx import Presentation
+
+        extractor = ContentExtractor()
+        slide = extractor.extract_all_slides(Presentation(sample_pptx_file))[1]
+        table = slide.compact_tables[0]
+
+        assert len(slide.tables) == 1
+        assert table._frame is None and table._text is None and table._typed is None
+
+        df = slide.tables[0]
+        assert slide.tables[0] is df
+        assert table._text is None
+
+        data = np.array(table.cells, dtype=object).reshape(table.n_rows, table.n_cols)
+        expected_df = pd.DataFrame(data[1:], columns=list(data[0]))
+        expected_text = extractor._format_table_for_llm(expected_df, table.formatting.emphasis)
+        pd.testing.assert_frame_equal(df, expected_df)
+        assert slide.table_texts[0] == expected_text
+        assert slide.table_texts == [expected_text]
+
+    def test_cells_are_interned(self, mock_config, sample_pptx_file):
+        """Test that repeated cell strings share one object across tables."""
+        from modules.ooxml_reader import OOXMLPresentation
+
+        first, second = (
+            ContentExtractor().extract_all_slides(OOXMLPresentation(sample_pptx_file))[1].compact_tables[0]
+            for _ in range(2)
+        )
+
+        assert all(a is b for a, b in zip(first.cells, second.cells))
+
+    def test_pickle_drops_memoized_objects(self, mock_config, sample_pptx_file):
+        """Test that only cells and masks are pickled, and tables rebuild identically."""
+        import pickle
+        from pptx import Presentation
+
+        slide = ContentExtractor().extract_all_slides(Presentation(sample_pptx_file))[1]
+        df, text, fmt = slide.tables[0], slide.table_texts[0], slide.table_formats[0]
+
+        restored = pickle.loads(pickle.dumps(slide))
+
+        assert restored.compact_tables[0]._frame is None
+        assert restored.slide_number == 2 and restored.title == slide.title
+        pd.testing.assert_frame_equal(restored.tables[0], df)
+        assert restored.table_texts[0] == text
+        assert (restored.table_formats[0].color == fmt.color).all()
+
+    def test_dataframe_constructor_still_supported(self, mock_config, sample_dataframe):
+        """Test building SlideContent from DataFrames and texts, as before."""
+        slide = SlideContent(
+            slide_number=4,
+            title="Manual",
+            text_content=[],
+            tables=[sample_dataframe],
+            table_texts=["| table |"],
+            has_content=True
+        )
+
+        assert slide.tables[0] is sample_dataframe
+        assert slide.table_texts[0] == "| table |"
+        assert slide.table_formats[0].bold.shape == sample_dataframe.shape
+        assert slide.renumbered(5).tables[0] is sample_dataframe
+
+
+class TestChartExtraction:
+    """Test cases for native chart extraction."""
+
+    @pytest.fixture
+    def chart_pptx_file(self, tmp_path):
+        """Deck with a titled line chart next to a table."""
+        from pptx import Presentation
+        from pptx.chart.data import CategoryChartData
+        from pptx.enum.chart import XL_CHART_TYPE
+        from pptx.util import Inches
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = "Default Rate Outlook"
+
+        chart_data = CategoryChartData(number_format='0.0%')
+        chart_data.categories = ["Q1", "Q2", "Q3"]
+        chart_data.add_series("Retail", (0.021, 0.025, 0.031))
+        chart_data.add_series("Corporate", (0.012, 0.011, 0.015))
+        chart = slide.shapes.add_chart(
+            XL_CHART_TYPE.LINE_MARKERS, Inches(0.5), Inches(1.5), Inches(6), Inches(4), chart_data
+        ).chart
+        chart.has_title = True
+        chart.chart_title.text_frame.text = "Default Rate Trend"
+
+        table = slide.shapes.add_table(3, 2, Inches(6.5), Inches(1.5), Inches(3), Inches(2)).table
+        for r, row in enumerate([["Segment", "Limit (%)"], ["Retail", "3.0"], ["Corporate", "2.0"]]):
+            for c, value in enumerate(row):
+                table.cell(r, c).text = value
+
+        path = tmp_path / "chart_deck.pptx"
+        prs.save(str(path))
+        return str(path)
+
+    EXPECTED_ROWS = [["Q1", "2.1%", "1.2%"], ["Q2", "2.5%", "1.1%"], ["Q3", "3.1%", "1.5%"]]
+
+    def _assert_chart(self, slide):
+        assert slide.table_captions[:] == ["Line chart: Default Rate Trend", None]
+        chart = slide.tables[0]
+        assert list(chart.columns) == ["Category", "Retail", "Corporate"]
+        assert chart.values.tolist() == self.EXPECTED_ROWS
+        assert slide.table_texts[0].startswith("Line chart: Default Rate Trend\n\n| Category")
+        assert slide.typed_tables[0]["Retail"].tolist() == [2.1, 2.5, 3.1]
+
+    def test_charts_are_read_alongside_tables(self, mock_config, chart_pptx_file):
+        """Test chart series from python-pptx and lightweight slides."""
+        from pptx import Presentation
+        from modules.ooxml_reader import OOXMLPresentation
+
+        for source in (Presentation(chart_pptx_file), OOXMLPresentation(chart_pptx_file)):
+            self._assert_chart(ContentExtractor().extract_all_slides(source)[0])
+
+    def test_parallel_workers_receive_chart_parts(self, mock_config, chart_pptx_file, monkeypatch):
+        """Test that detached slides carry their chart parts to the workers."""
+        from pptx import Presentation
+        from modules import content_extractor
+
+        mock_config.set('extraction.parallel.enabled', True)
+        mock_config.set('extraction.parallel.workers', 2)
+        mock_config.set('extraction.parallel.min_slides', 1)
+        extractor = ContentExtractor()
+
+        pool = Mock()
+        pool.map = lambda fn, jobs, chunksize: map(fn, list(jobs))
+        monkeypatch.setattr(extractor, '_get_pool', Mock(return_value=pool))
+        monkeypatch.setattr(content_extractor, '_worker_extractor', ContentExtractor(), raising=False)
+
+        self._assert_chart(extractor.extract_all_slides(Presentation(chart_pptx_file))[0])
+
+    def test_charts_can_be_disabled(self, mock_config, chart_pptx_file):
+        """Test the extraction.extract_charts switch and its cache key."""
+        from pptx import Presentation
+
+        mock_config.set('extraction.extract_charts', False)
+        extractor = ContentExtractor()
+
+        slide = extractor.extract_all_slides(Presentation(chart_pptx_file))[0]
+
+        assert slide.table_captions[:] == [None]
+        assert extractor.cache_settings()["extract_charts"] is False
+
+
+class TestEmbeddedWorkbookExtraction:
+    """Test cases for tables read from embedded Excel objects."""
+
+    @pytest.fixture
+    def ole_pptx_file(self, tmp_path):
+        """Deck with an embedded Excel workbook."""
+        import io
+        from openpyxl import Workbook
+        from pptx import Presentation
+        from pptx.enum.shapes import PROG_ID
+        from pptx.util import Inches
+
+        workbook = Workbook()
+        ws = workbook.active
+        ws.title = "Model"
+        for row in [["Segment", "PD", "Exposure"], ["Retail", 0.021, 1200], ["SME", 0.034, 450]]:
+            ws.append(row)
+        ws["B2"].number_format = ws["B3"].number_format = "0.0%"
+        xlsx = io.BytesIO()
+        workbook.save(xlsx)
+        xlsx.seek(0)
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = "Risk Model"
+        slide.shapes.add_ole_object(xlsx, PROG_ID.XLSX, Inches(1), Inches(1.5), Inches(4), Inches(3))
+
+        path = tmp_path / "ole_deck.pptx"
+        prs.save(str(path))
+        return str(path)
+
+    def _assert_sheet(self, slide):
+        assert slide.table_captions[:] == ["Embedded Excel sheet: Model"]
+        sheet = slide.tables[0]
+        assert list(sheet.columns) == ["Segment", "PD", "Exposure"]
+        assert sheet.values.tolist() == [["Retail", "2.1%", "1200"], ["SME", "3.4%", "450"]]
+        assert slide.table_texts[0].startswith("Embedded Excel sheet: Model\n\n| Segment")
+
+    def test_sheets_are_read_from_all_slide_readers(self, mock_config, ole_pptx_file):
+        """Test embedded sheets from python-pptx and lightweight slides."""
+        from pptx import Presentation
+        from modules.ooxml_reader import OOXMLPresentation
+
+        for source in (Presentation(ole_pptx_file), OOXMLPresentation(ole_pptx_file)):
+            self._assert_sheet(ContentExtractor().extract_all_slides(source)[0])
+
+    def test_parallel_workers_receive_packages(self, mock_config, ole_pptx_file, monkeypatch):
+        """Test that detached slides carry embedded packages to the workers."""
+        from modules import content_extractor
+        from modules.ooxml_reader import OOXMLPresentation
+
+        mock_config.set('extraction.parallel.enabled', True)
+        mock_config.set('extraction.parallel.workers', 2)
+        mock_config.set('extraction.parallel.min_slides', 1)
+        extractor = ContentExtractor()
+
+        pool = Mock()
+        pool.map = lambda fn, jobs, chunksize: map(fn, list(jobs))
+        monkeypatch.setattr(extractor, '_get_pool', Mock(return_value=pool))
+        monkeypatch.setattr(content_extractor, '_worker_extractor', ContentExtractor(), raising=False)
+
+        self._assert_sheet(extractor.extract_all_slides(OOXMLPresentation(ole_pptx_file))[0])
+
+    def test_oversized_packages_skipped(self, mock_config, ole_pptx_file):
+        """Test that packages over the byte budget are never read."""
+        from pptx import Presentation
+        from modules.ooxml_reader import OOXMLPresentation
+
+        mock_config.set('extraction.embedded_excel.max_bytes', 1024)
+        extractor = ContentExtractor()
+
+        for source in (Presentation(ole_pptx_file), OOXMLPresentation(ole_pptx_file)):
+            slide = extractor.extract_all_slides(source)[0]
+            assert slide.table_captions[:] == []
+            assert extractor._slide_related_parts(source.slides[0]) == {}
+        assert extractor.cache_settings()["embedded_excel"]["max_bytes"] == 1024
@@ -0,0 +1,120 @@
+"""
+Unit tests for embedded workbook module.
+"""
+
+import io
+from datetime import datetime
+
+import pytest
+from openpyxl import Workbook
+
+from modules.embedded_workbook import EmbeddedWorkbookReader, SHEETS_ALL
+
+
+def _xlsx(sheets):
+    """Build an .xlsx package from {title: rows}; the first sheet is active."""
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for title, rows in sheets.items():
+        ws = workbook.create_sheet(title)
+        for row in rows:
+            ws.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+class TestEmbeddedWorkbookReader:
+    """Test cases for EmbeddedWorkbookReader class."""
+
+    def test_reads_active_sheet(self, mock_config):
+        """Test reading the active sheet as display strings."""
+        blob = _xlsx({
+            "Forecast": [["Segment", "Rate", "Loans"], ["Retail", 0.021, 1200], ["SME", 0.034, 450]],
+            "Notes": [["ignored"]],
+        })
+
+        grids = EmbeddedWorkbookReader().read(blob)
+
+        assert len(grids) == 1
+        caption, grid = grids[0]
+        assert caption == "Embedded Excel sheet: Forecast"
+        assert grid.tolist() == [["Segment", "Rate", "Loans"], ["Retail", "0.021", "1200"], ["SME", "0.034", "450"]]
+
+    def test_number_formats_and_dates(self, mock_config):
+        """Test that cells are rendered with their number formats."""
+        workbook = Workbook()
+        ws = workbook.active
+        ws.append(["Month", "Rate", "Balance", "Flag"])
+        ws.append([datetime(2024, 3, 31), 0.0215, 1234567.891, True])
+        ws["B2"].number_format = "0.0%"
+        ws["C2"].number_format = "#,##0.00"
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+
+        _, grid = EmbeddedWorkbookReader().read(buffer.getvalue())[0]
+
+        assert grid[1].tolist() == ["2024-03-31", "2.2%", "1,234,567.89", "TRUE"]
+
+    def test_row_and_column_caps(self, mock_config):
+        """Test that large sheets are cut off and captioned as such."""
+        mock_config.set('extraction.embedded_excel.max_rows', 5)
+        mock_config.set('extraction.embedded_excel.max_cols', 3)
+        blob = _xlsx({"Data": [[f"r{r}c{c}" for c in range(10)] for r in range(50)]})
+
+        caption, grid = EmbeddedWorkbookReader().read(blob)[0]
+
+        assert grid.shape == (5, 3)
+        assert caption == "Embedded Excel sheet: Data (first 5 rows)"
+
+    def test_empty_rows_and_columns_dropped(self, mock_config):
+        """Test that blank spacer rows and columns are removed."""
+        blob = _xlsx({"Data": [[None, None, None], [None, "A", None, "B"], [None, None], [None, "1", None, "2"]]})
+
+        _, grid = EmbeddedWorkbookReader().read(blob)[0]
+
+        assert grid.tolist() == [["A", "B"], ["1", "2"]]
+
+    def test_all_visible_sheets(self, mock_config):
+        """Test reading every visible sheet up to max_sheets."""
+        mock_config.set('extraction.embedded_excel.sheets', SHEETS_ALL)
+        mock_config.set('extraction.embedded_excel.max_sheets', 2)
+        blob = _xlsx({name: [["x", "y"], [1, 2]] for name in ("One", "Two", "Three")})
+
+        captions = [caption for caption, _ in EmbeddedWorkbookReader().read(blob)]
+
+        assert captions == ["Embedded Excel sheet: One", "Embedded Excel sheet: Two"]
+
+    def test_legacy_and_broken_packages_skipped(self, mock_config):
+        """Test that .xls storages and corrupt packages yield no sheets."""
+        reader = EmbeddedWorkbookReader()
+
+        assert reader.read(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\0" * 64) == []
+        assert reader.read(b"PK\x03\x04 not a zip") == []
+
+    def test_byte_budget(self, mock_config):
+        """Test the package and shared-strings budgets."""
+        mock_config.set('extraction.embedded_excel.max_bytes', 1000)
+        reader = EmbeddedWorkbookReader()
+
+        assert reader.fits(1000) is True
+        assert reader.fits(1001) is False
+        # Shared strings alone exceed the budget once unpacked
+        blob = _xlsx({"Data": [[f"distinct text value {i}" * 5] for i in range(100)]})
+        assert reader.read(blob) == []
+
+    @pytest.mark.parametrize("prog_id, expected", [
+        ("Excel.Sheet.12", True),
+        ("Excel.SheetMacroEnabled.12", True),
+        ("Word.Document.12", False),
+        (None, False),
+    ])
+    def test_accepts(self, mock_config, prog_id, expected):
+        """Test that only Excel OLE objects are read."""
+        assert EmbeddedWorkbookReader().accepts(prog_id) is expected
+
+    def test_disabled(self, mock_config):
+        """Test the extraction.embedded_excel.enabled switch."""
+        mock_config.set('extraction.embedded_excel.enabled', False)
+
+        assert EmbeddedWorkbookReader().accepts("Excel.Sheet.12") is False
@@ -0,0 +1,125 @@
+"""
+Unit tests for extraction cache module.
+"""
+
+import io
+import os
+
+import pytest
+
+from modules.content_extractor import SlideContent
+from modules.extraction_cache import ExtractionCache
+
+
+@pytest.fixture
+def extraction_cache(mock_config, tmp_path):
+    """Extraction cache writing to a temporary directory."""
+    mock_config.set('cache.extraction.disk_dir', str(tmp_path / "extraction"))
+    mock_config.set('cache.extraction.memory_entries', 2)
+    return ExtractionCache()
+
+
+def _slides(title):
+    return [SlideContent(
+        slide_number=1,
+        title=title,
+        text_content=["text"],
+        tables=[],
+        table_texts=[],
+        has_content=True
+    )]
+
+
+class TestExtractionCache:
+    """Test cases for ExtractionCache class."""
+
+    def test_key_depends_on_content_not_name(self):
+        """Test that keys change with file bytes and settings only."""
+        settings = {"min_table_rows": 2, "min_table_cols": 2}
+
+        key_a = ExtractionCache.make_key(io.BytesIO(b"deck v1"), settings)
+        key_b = ExtractionCache.make_key(io.BytesIO(b"deck v1"), settings)
+        key_edited = ExtractionCache.make_key(io.BytesIO(b"deck v2"), settings)
+        key_settings = ExtractionCache.make_key(io.BytesIO(b"deck v1"), {**settings, "min_table_rows": 3})
+
+        assert key_a == key_b
+        assert key_a != key_edited
+        assert key_a != key_settings
+
+    def test_make_key_restores_position(self):
+        """Test that hashing leaves the upload readable for the parser."""
+        upload = io.BytesIO(b"deck bytes")
+        upload.seek(3)
+
+        ExtractionCache.make_key(upload, {})
+
+        assert upload.tell() == 3
+
+    def test_miss_then_memory_hit(self, extraction_cache):
+        """Test the memory tier."""
+        assert extraction_cache.get("key1") is None
+
+        extraction_cache.put("key1", _slides("Deck"))
+
+        assert extraction_cache.get("key1")[0].title == "Deck"
+        stats = extraction_cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["memory_hits"] == 1
+
+    def test_disk_tier_shared_across_instances(self, extraction_cache):
+        """Test that a fresh process-level cache is served from disk."""
+        extraction_cache.put("key1", _slides("Deck"))
+
+        other = ExtractionCache()
+        slides = other.get("key1")
+
+        assert slides[0].title == "Deck"
+        assert other.get_stats()["disk_hits"] == 1
+        assert other.get("key1") is not None
+        assert other.get_stats()["memory_hits"] == 1
+
+    def test_memory_lru_eviction(self, extraction_cache):
+        """Test that the least recently used deck leaves memory first."""
+        extraction_cache.put("a", _slides("A"))
+        extraction_cache.put("b", _slides("B"))
+        extraction_cache.get("a")
+        extraction_cache.put("c", _slides("C"))
+
+        assert list(extraction_cache._memory) == ["a", "c"]
+
+    def test_disk_size_eviction(self, extraction_cache):
+        """Test that disk entries are evicted above the size limit."""
+        extraction_cache.put("a", _slides("A" * 5000))
+        os.utime(extraction_cache._disk_path("a"), (1, 1))
+        entry_size = extraction_cache.get_stats()["disk_bytes"]
+        extraction_cache.max_disk_bytes = int(entry_size * 1.5)
+
+        extraction_cache.put("b", _slides("B" * 5000))
+
+        assert not extraction_cache._disk_path("a").exists()
+        assert extraction_cache._disk_path("b").exists()
+        assert extraction_cache.get_stats()["evictions"] == 1
+
+    def test_disk_bytes_tracked_without_scanning(self, extraction_cache):
+        """Test that get_stats reports the disk size from a running total."""
+        from unittest.mock import patch
+
+        extraction_cache.put("a", _slides("A" * 5000))
+        extraction_cache.put("b", _slides("B" * 5000))
+        on_disk = sum(path.stat().st_size for path in extraction_cache.disk_dir.glob("*.pkl"))
+
+        with patch.object(extraction_cache, '_disk_entries', side_effect=AssertionError("scanned")):
+            assert extraction_cache.get_stats()["disk_bytes"] == on_disk
+
+        # A new instance picks up the entries already on disk
+        assert ExtractionCache().get_stats()["disk_bytes"] == on_disk
+
+        extraction_cache.clear()
+        assert extraction_cache.get_stats()["disk_bytes"] == 0
+
+    def test_disabled_cache(self, extraction_cache):
+        """Test that a disabled cache never stores entries."""
+        extraction_cache.enabled = False
+        extraction_cache.put("a", _slides("A"))
+
+        assert extraction_cache.get("a") is None
@@ -173,3 +173,116 @@ class TestFileParser:
         count = parser.get_slide_count(invalid_prs)
 
         assert count == 0
+
+    def test_lightweight_reader_mode(self, mock_config, sample_pptx_file):
+        """Test that lightweight mode returns the slide-XML-only reader."""
+        from modules.ooxml_reader import OOXMLPresentation
+
+        mock_config.set('app.reader_mode', 'lightweight')
+        parser = FileParser()
+
+        result = parser.parse_presentation(sample_pptx_file)
+
+        assert isinstance(result, OOXMLPresentation)
+        assert parser.get_slide_count(result) == 3
+
+    def test_lightweight_reader_size_limit(self, mock_config):
+        """Test that the lightweight reader has its own, larger size limit."""
+        mock_config.set('app.reader_mode', 'lightweight')
+        mock_config.set('app.lightweight_max_file_size_mb', 50)
+
+        uploaded = Mock(size=20 * 1024 * 1024)
+        uploaded.name = "deck.pptx"
+
+        assert FileParser().max_file_size_mb == 50
+        assert FileParser().validate_uploaded_file(uploaded) == (True, None)
+
+        mock_config.set('app.reader_mode', 'full')
+        is_valid, error = FileParser().validate_uploaded_file(uploaded)
+        assert is_valid is False
+        assert 'exceeds' in error
+
+
+    def test_slide_fingerprints_change_only_for_edited_slides(self, mock_config, sample_pptx_file, tmp_path):
+        """Test that editing one slide changes only that slide's fingerprint, for both readers."""
+        from pptx import Presentation
+
+        prs = Presentation(sample_pptx_file)
+        prs.slides[0].shapes.title.text = "Quarterly Loan Forecast (revised)"
+        edited_path = str(tmp_path / "edited.pptx")
+        prs.save(edited_path)
+
+        for mode in ('full', 'lightweight'):
+            mock_config.set('app.reader_mode', mode)
+            parser = FileParser()
+
+            before = parser.slide_fingerprints(parser.parse_presentation(sample_pptx_file), sample_pptx_file)
+            again = parser.slide_fingerprints(parser.parse_presentation(sample_pptx_file), sample_pptx_file)
+            after = parser.slide_fingerprints(parser.parse_presentation(edited_path), edited_path)
+
+            assert before == again
+            assert len(set(before)) == 3
+            assert after[0] != before[0]
+            assert after[1:] == before[1:]
+
+    def test_slide_fingerprints_same_for_both_readers(self, mock_config, sample_pptx_file, tmp_path):
+        """Test that both readers hash the raw package bytes, not python-pptx's re-serialized XML."""
+        import zipfile
+
+        # Write slide XML the way PowerPoint does, which python-pptx re-serializes differently
+        deck = str(tmp_path / "powerpoint.pptx")
+        with zipfile.ZipFile(sample_pptx_file) as src, zipfile.ZipFile(deck, "w") as dst:
+            for item in src.infolist():
+                data = src.read(item.filename)
+                if item.filename == "ppt/slides/slide1.xml":
+                    data = data.replace(b"?>\n", b"?>\r\n", 1).replace(b"><p:cSld", b">\r\n  <p:cSld", 1)
+                dst.writestr(item, data)
+
+        fingerprints = {}
+        for mode in ('full', 'lightweight'):
+            mock_config.set('app.reader_mode', mode)
+            parser = FileParser()
+            fingerprints[mode] = parser.slide_fingerprints(parser.parse_presentation(deck), deck)
+
+        assert fingerprints['full'] == fingerprints['lightweight']
+        assert None not in fingerprints['full']
+
+    def test_slide_fingerprints_need_source_for_python_pptx(self, mock_config, sample_pptx_file):
+        """Test that a python-pptx presentation cannot be fingerprinted without its package."""
+        parser = FileParser()
+
+        with pytest.raises(ValueError):
+            parser.slide_fingerprints(parser.parse_presentation(sample_pptx_file))
+
+    def test_slide_fingerprints_include_chart_parts(self, mock_config, tmp_path):
+        """Test that new chart data changes the fingerprint although the slide XML does not."""
+        from pptx import Presentation
+        from pptx.chart.data import CategoryChartData
+        from pptx.enum.chart import XL_CHART_TYPE
+        from pptx.util import Inches
+
+        def chart_data(values):
+            data = CategoryChartData()
+            data.categories = ["Q1", "Q2"]
+            data.add_series("Default Rate", values)
+            return data
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        chart = slide.shapes.add_chart(
+            XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(1), Inches(1), Inches(6), Inches(4), chart_data((1.0, 2.0))
+        ).chart
+        original = str(tmp_path / "chart.pptx")
+        prs.save(original)
+
+        chart.replace_data(chart_data((1.0, 9.0)))
+        updated = str(tmp_path / "chart_updated.pptx")
+        prs.save(updated)
+
+        mock_config.set('app.reader_mode', 'lightweight')
+        parser = FileParser()
+        before = parser.parse_presentation(original)
+        after = parser.parse_presentation(updated)
+
+        assert before.slides[0].blob == after.slides[0].blob
+        assert parser.slide_fingerprints(before) != parser.slide_fingerprints(after)
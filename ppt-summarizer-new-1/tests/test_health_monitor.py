@@ -0,0 +1,76 @@
+"""
+Unit tests for LLM health monitor module.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+from modules.health_monitor import (
+    LLMHealthMonitor, HEALTH_CHECKING, HEALTH_DEGRADED, HEALTH_OK, HEALTH_UNAVAILABLE
+)
+
+
+class TestLLMHealthMonitor:
+    """Test cases for LLMHealthMonitor class."""
+
+    def test_missing_service_reports_unavailable(self, mock_config):
+        """Test that an LLM init failure is reported without probing."""
+        monitor = LLMHealthMonitor(None, init_error="GROQ_API_KEY must be set")
+        monitor.start()
+
+        status = monitor.get_status()
+        assert status.state == HEALTH_UNAVAILABLE
+        assert status.error == "GROQ_API_KEY must be set"
+        assert not status.available
+        assert monitor.check().state == HEALTH_UNAVAILABLE
+
+    def test_status_before_first_check(self, mock_config):
+        """Test that the cached status starts out as checking."""
+        monitor = LLMHealthMonitor(MagicMock())
+        assert monitor.get_status().state == HEALTH_CHECKING
+
+    def test_check_states(self, mock_config):
+        """Test healthy, degraded and unavailable results."""
+        service = MagicMock()
+        monitor = LLMHealthMonitor(service)
+
+        assert monitor.check().state == HEALTH_OK
+        service.warm_up.assert_called_once()
+
+        monitor.slow_ms = -1
+        assert monitor.check().state == HEALTH_DEGRADED
+        assert monitor.get_status().available
+
+        service.warm_up.side_effect = ConnectionError("API unreachable")
+        status = monitor.check()
+        assert status.state == HEALTH_UNAVAILABLE
+        assert status.error == "API unreachable"
+        assert monitor.get_status().state == HEALTH_UNAVAILABLE
+
+    def test_background_thread_checks_and_rechecks(self, mock_config):
+        """Test that start() returns immediately and checks run in the background."""
+        probed = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_probe():
+            calls.append(1)
+            probed.set()
+            release.wait(5)
+
+        service = MagicMock()
+        service.warm_up.side_effect = slow_probe
+        monitor = LLMHealthMonitor(service)
+        monitor.interval = 60
+
+        monitor.start()
+        assert probed.wait(5)
+        # The probe is still running, but callers see the cached status
+        assert monitor.get_status().state == HEALTH_CHECKING
+        release.set()
+
+        probed.clear()
+        monitor.request_check()
+        assert probed.wait(5)
+        monitor.stop()
+        assert len(calls) == 2
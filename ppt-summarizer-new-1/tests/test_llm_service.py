@@ -2,13 +2,21 @@
 Unit tests for LLM service module.
 """
 
+import json
+
+import httpx
 import pytest
-from unittest.mock import Mock, MagicMock, patch, mock_open
+from unittest.mock import MagicMock, patch, mock_open
 from groq import RateLimitError, APITimeoutError, APIError
 
 from modules.llm_service import LLMService
 
 
+def _rate_limited(headers=None):
+    """429 response as the Groq client sees it."""
+    return httpx.Response(429, headers=headers, request=httpx.Request("POST", "https://api.groq.com"))
+
+
 class TestLLMService:
     """Test cases for LLMService class."""
 
@@ -86,7 +94,7 @@ class TestLLMService:
         mock_client = MagicMock()
         # First call raises RateLimitError, second succeeds
         mock_client.chat.completions.create.side_effect = [
-            RateLimitError("Rate limit exceeded", response=Mock(), body=None),
+            RateLimitError("Rate limit exceeded", response=_rate_limited(), body=None),
             mock_groq_response
         ]
         mock_groq_class.return_value = mock_client
@@ -114,7 +122,7 @@ class TestLLMService:
         mock_client = MagicMock()
         mock_client.chat.completions.create.side_effect = RateLimitError(
             "Rate limit exceeded",
-            response=Mock(),
+            response=_rate_limited(),
             body=None
         )
         mock_groq_class.return_value = mock_client
@@ -154,6 +162,46 @@ class TestLLMService:
             assert summary == "This is a test summary."
             assert mock_client.chat.completions.create.call_count == 2
 
+    @patch('modules.llm_service.Groq')
+    @patch('modules.llm_service.Path')
+    @patch('time.sleep')
+    def test_rate_limit_retry_waits_in_limiter(self, mock_sleep, mock_path, mock_groq_class, mock_config,
+                                               mock_groq_response):
+        """Test that a 429 with retry-after is retried through the limiter without another sleep."""
+        mock_path.return_value = MagicMock(exists=MagicMock(return_value=True))
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.side_effect = [
+            RateLimitError("Rate limit exceeded", response=_rate_limited({"retry-after": "3"}), body=None),
+            mock_groq_response
+        ]
+        mock_groq_class.return_value = mock_client
+
+        with patch('builtins.open', mock_open(read_data="Test: {table_data}")):
+            service = LLMService()
+        service.rate_limiter = MagicMock(enabled=True)
+
+        assert service.generate_summary("| A |") == "This is a test summary."
+        assert service.rate_limiter.acquire.call_count == 2
+        mock_sleep.assert_not_called()
+
+    @patch('modules.llm_service.Path')
+    def test_rate_limit_wait(self, mock_path, mock_config):
+        """Test the fallback delays used when the limiter has no server delay to apply."""
+        mock_path.return_value = MagicMock(exists=MagicMock(return_value=True))
+        with patch('builtins.open', mock_open(read_data="Test: {table_data}")):
+            service = LLMService()
+        reset = _rate_limited({"x-ratelimit-remaining-tokens": "0", "x-ratelimit-reset-tokens": "7.5s"})
+
+        # Disabled limiter (as configured in tests): sleep what the server asked for
+        assert service._rate_limit_wait(RateLimitError("429", response=reset, body=None), 0) == 7.5
+        # No header: exponential backoff
+        assert service._rate_limit_wait(RateLimitError("429", response=_rate_limited(), body=None), 2) == (
+            service.retry_delay * 4
+        )
+
+        service.rate_limiter = MagicMock(enabled=True)
+        assert service._rate_limit_wait(RateLimitError("429", response=reset, body=None), 0) == 0.0
+
     @patch('modules.llm_service.Groq')
     @patch('modules.llm_service.Path')
     def test_test_connection_success(self, mock_path, mock_groq_class, mock_config, mock_groq_response):
@@ -221,3 +269,466 @@ class TestLLMService:
             summary = await service.generate_summary_async(table_data)
 
             assert summary == "This is a test summary."
+
+
+class TestBatchSummaries:
+    """Test cases for concurrent deck-wide summaries."""
+
+    @patch('modules.llm_service.AsyncGroq')
+    @patch('modules.llm_service.Groq')
+    @patch('modules.llm_service.Path')
+    def test_concurrency_cap_and_failure_isolation(self, mock_path, mock_groq_class, mock_async_groq_class,
+                                                   mock_config, mock_groq_response):
+        """Test that batches respect the cap and isolate failing tables."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        mock_config.set('llm.batch_concurrency', 2)
+        mock_path.return_value = MagicMock(exists=MagicMock(return_value=True))
+
+        in_flight = {"now": 0, "max": 0}
+
+        async def fake_create(**kwargs):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            if "FAIL" in kwargs["messages"][1]["content"]:
+                raise ValueError("bad table")
+            return mock_groq_response
+
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = AsyncMock(side_effect=fake_create)
+        mock_async_groq_class.return_value = mock_async_client
+
+        with patch('builtins.open', mock_open(read_data="Test: {table_data}")):
+            service = LLMService()
+
+        tables = [((1, 1), "| A |"), ((1, 2), "| FAIL |"), ((2, 1), "| B |"), ((3, 1), "| C |")]
+        results = list(service.iter_table_summaries(tables))
+
+        assert sorted(key for key, _, _ in results) == [(1, 1), (1, 2), (2, 1), (3, 1)]
+        outcome = {key: (summary, error) for key, summary, error in results}
+        assert outcome[(1, 1)][0] == "This is a test summary."
+        assert isinstance(outcome[(1, 2)][1], ValueError)
+        assert in_flight["max"] == 2
+
+
+def _completion(content):
+    """Build a mock ChatCompletion with the given text."""
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=content))]
+    response.usage = MagicMock(total_tokens=10)
+    return response
+
+
+class TestMapReduceSummaries:
+    """Test cases for map-reduce summaries of oversized tables."""
+
+    @pytest.fixture
+    def service(self, mock_config, tmp_path):
+        """LLMService with a summary cache and an async client that echoes chunk names."""
+        from unittest.mock import AsyncMock
+
+        mock_config.set('cache.summary.enabled', True)
+        mock_config.set('cache.summary.db_path', str(tmp_path / "summaries.sqlite3"))
+
+        async def fake_create(**kwargs):
+            prompt = kwargs["messages"][1]["content"]
+            if prompt.startswith("Test:"):
+                return _completion("combined summary")
+            return _completion("facts of " + prompt.rsplit("\n", 1)[-1])
+
+        with patch('modules.llm_service.Path') as mock_path, \
+                patch('modules.llm_service.Groq'), \
+                patch('modules.llm_service.AsyncGroq') as mock_async_groq_class, \
+                patch('builtins.open', mock_open(read_data="Test: {table_data}")):
+            mock_path.return_value = MagicMock(exists=MagicMock(return_value=True))
+            mock_async_client = MagicMock()
+            mock_async_client.chat.completions.create = AsyncMock(side_effect=fake_create)
+            mock_async_groq_class.return_value = mock_async_client
+            yield LLMService()
+
+    def _prompts(self, service):
+        return [call.kwargs["messages"][1]["content"] for call in service.async_client.chat.completions.create.call_args_list]
+
+    def test_map_then_reduce(self, service):
+        """Test that chunks are summarized, then combined with the summary template."""
+        summary = service.generate_summary_hierarchical(["Part 1\nretail", "Part 2\nsme"])
+
+        assert summary == "combined summary"
+        prompts = self._prompts(service)
+        assert len(prompts) == 3
+        reduce_prompt = prompts[-1]
+        assert reduce_prompt.startswith("Test: The table was too large")
+        assert "### Part 1 of 2\nfacts of retail" in reduce_prompt
+        assert "### Part 2 of 2\nfacts of sme" in reduce_prompt
+
+    def test_rerun_only_redoes_changed_chunks(self, service):
+        """Test that chunk summaries are cached individually."""
+        service.generate_summary_hierarchical(["Part 1\nretail", "Part 2\nsme"])
+        service.generate_summary_hierarchical(["Part 1\nretail", "Part 2\nsme (edited)"])
+
+        prompts = self._prompts(service)
+        assert len(prompts) == 5
+        assert prompts[3].endswith("sme (edited)")
+
+    def test_chunks_use_retry_and_backoff(self, service):
+        """Test that a failing chunk request is retried with the usual backoff."""
+        from unittest.mock import AsyncMock
+
+        create = service.async_client.chat.completions.create
+        create.side_effect = [APITimeoutError(request=MagicMock()), _completion("facts"), _completion("done")]
+        service._async_sleep = AsyncMock()
+
+        assert service.generate_summary_hierarchical(["Part 1\nretail"]) == "done"
+        service._async_sleep.assert_awaited_once_with(service.retry_delay)
+
+    def test_chunk_rate_limits_wait_in_limiter(self, service):
+        """Test that an async 429 with retry-after is paced by the limiter alone."""
+        from unittest.mock import AsyncMock
+
+        create = service.async_client.chat.completions.create
+        create.side_effect = [
+            RateLimitError("Rate limit exceeded", response=_rate_limited({"retry-after": "3"}), body=None),
+            _completion("facts"),
+            _completion("done"),
+        ]
+        service._async_sleep = AsyncMock()
+        service.rate_limiter = MagicMock(enabled=True, acquire_async=AsyncMock())
+
+        assert service.generate_summary_hierarchical(["Part 1\nretail"]) == "done"
+        service._async_sleep.assert_not_awaited()
+        assert service.rate_limiter.acquire_async.await_count == 3
+
+    def test_partial_summaries_condensed_over_budget(self, service):
+        """Test that too many partial summaries are condensed before the reduce step."""
+        service.table_budget = 40
+        chunks = [f"Part {i}\nsegment {i} " + "word " * 5 for i in range(6)]
+
+        assert service.generate_summary_hierarchical(chunks) == "combined summary"
+        prompts = self._prompts(service)
+        # Six chunk requests, at least one condensing round, then the reduce step
+        assert len(prompts) > 7
+        assert prompts[-1].startswith("Test: ")
+
+    def test_batch_accepts_chunks(self, service):
+        """Test that batches summarize chunk lists with map-reduce."""
+        results = list(service.iter_table_summaries([((1, 1), ["Part 1\nretail", "Part 2\nsme"]), ((1, 2), "| A |")]))
+
+        assert {key: summary for key, summary, _ in results} == {(1, 1): "combined summary", (1, 2): "combined summary"}
+        assert len(self._prompts(service)) == 4
+
+
+class TestTablePacking:
+    """Test cases for packing small tables into one request."""
+
+    @pytest.fixture
+    def service(self, mock_config, tmp_path):
+        """LLMService with a summary cache and a scripted async client."""
+        from unittest.mock import AsyncMock
+
+        mock_config.set('cache.summary.enabled', True)
+        mock_config.set('cache.summary.db_path', str(tmp_path / "summaries.sqlite3"))
+
+        with patch('modules.llm_service.Path') as mock_path, \
+                patch('modules.llm_service.Groq'), \
+                patch('modules.llm_service.AsyncGroq') as mock_async_groq_class, \
+                patch('builtins.open', mock_open(read_data="Test: {table_data}")):
+            mock_path.return_value = MagicMock(exists=MagicMock(return_value=True))
+            mock_async_client = MagicMock()
+            mock_async_client.chat.completions.create = AsyncMock()
+            mock_async_groq_class.return_value = mock_async_client
+            yield LLMService()
+
+    TABLES = [((1, 1), "| A |"), ((1, 2), "| B |"), ((2, 1), "| C |")]
+
+    def test_tables_share_one_request(self, service):
+        """Test that small tables are summarized by one JSON request and split back."""
+        create = service.async_client.chat.completions.create
+        create.return_value = _completion(json.dumps({
+            "slide_1_table_1": ["Retail rose", "- SME fell"],
+            "slide_1_table_2": ["Stable"],
+            "slide_2_table_1": "- Net rate negative\n- Watch Q3",
+        }))
+
+        results = {key: summary for key, summary, _ in service.iter_table_summaries(self.TABLES)}
+
+        assert results == {
+            (1, 1): "- Retail rose\n- SME fell",
+            (1, 2): "- Stable",
+            (2, 1): "- Net rate negative\n- Watch Q3",
+        }
+        assert create.call_count == 1
+        kwargs = create.call_args.kwargs
+        assert kwargs["response_format"] == {"type": "json_object"}
+        prompt = kwargs["messages"][1]["content"]
+        assert prompt.startswith("Test: ### Table slide_1_table_1\n| A |")
+        assert "(slide_1_table_1, slide_1_table_2, slide_2_table_1)" in prompt
+
+    def test_malformed_json_falls_back_per_table(self, service):
+        """Test that an unusable packed response is neither used nor cached."""
+        create = service.async_client.chat.completions.create
+
+        async def fake_create(**kwargs):
+            if "response_format" in kwargs:
+                return _completion('{"slide_1_table_1": ["only one table"]')
+            return _completion("single " + kwargs["messages"][1]["content"])
+
+        create.side_effect = fake_create
+
+        results = {key: summary for key, summary, _ in service.iter_table_summaries(self.TABLES)}
+
+        assert results == {key: f"single Test: {text}" for key, text in self.TABLES}
+        assert create.call_count == 4
+
+        # The per-table summaries were cached, so a rerun sends nothing
+        list(service.iter_table_summaries(self.TABLES))
+        assert create.call_count == 4
+
+    def test_packed_summaries_cached_per_table(self, service):
+        """Test that a second batch run answers every table from the cache."""
+        create = service.async_client.chat.completions.create
+        create.return_value = _completion(json.dumps({
+            "slide_1_table_1": ["Retail rose"],
+            "slide_1_table_2": ["Stable"],
+            "slide_2_table_1": ["Net rate negative"],
+        }))
+
+        first = {key: summary for key, summary, _ in service.iter_table_summaries(self.TABLES)}
+        second = {key: summary for key, summary, _ in service.iter_table_summaries(self.TABLES)}
+
+        assert second == first
+        assert create.call_count == 1
+        # Single-table requests share the packed results too
+        assert service.generate_summary("| B |") == "- Stable"
+
+    def test_only_uncached_tables_packed(self, service):
+        """Test that cached tables are left out of packed requests."""
+        create = service.async_client.chat.completions.create
+        cache_key, prompt_version = service._summary_identity("| A |")
+        service.summary_cache.put(cache_key, "- Cached", service.model_name, prompt_version)
+        create.return_value = _completion(json.dumps({"slide_1_table_2": ["Stable"], "slide_2_table_1": ["Down"]}))
+
+        results = {key: summary for key, summary, _ in service.iter_table_summaries(self.TABLES)}
+
+        assert results[(1, 1)] == "- Cached"
+        prompt = create.call_args.kwargs["messages"][1]["content"]
+        assert "| A |" not in prompt and "(slide_1_table_2, slide_2_table_1)" in prompt
+
+    def test_pack_limits(self, service):
+        """Test max_tables, the token budget and which tables are left alone."""
+        service.pack_max_tables = 2
+        service.pack_max_tokens = 100
+        big = "| " + " | ".join(f"cell{i}" for i in range(40)) + " |"
+        tables = [(1, "| A |"), (2, "| B |"), (3, "| C |"), (4, big), (5, ["chunk"]), (6, "| D |")]
+
+        packs = service._pack_tables(tables)
+
+        assert [[key for key, _ in pack] for pack in packs] == [[1, 2], [3, 6]]
+
+    def test_packing_disabled(self, service):
+        """Test the llm.table_packing.enabled switch."""
+        service.pack_max_tables = 1
+
+        assert service._pack_tables(self.TABLES) == []
+
+    def test_parse_pack(self):
+        """Test fenced JSON and missing tables."""
+        ids = ["slide_1_table_1", "slide_1_table_2"]
+        fenced = '```json\n{"slide_1_table_1": ["a"], "slide_1_table_2": ["* b"]}\n```'
+
+        assert LLMService._parse_pack(fenced, ids) == {"slide_1_table_1": "- a", "slide_1_table_2": "- b"}
+        assert LLMService._parse_pack('{"slide_1_table_1": ["a"]}', ids) is None
+        assert LLMService._parse_pack('["a", "b"]', ids) is None
+        assert LLMService._parse_pack('{"slide_1_table_1": [], "slide_1_table_2": ["b"]}', ids) is None
+
+
+def _stream_chunk(content=None, total_tokens=None):
+    """Build a mock ChatCompletionChunk."""
+    chunk = MagicMock()
+    chunk.choices = [MagicMock(delta=MagicMock(content=content))]
+    chunk.x_groq = MagicMock(usage=MagicMock(total_tokens=total_tokens)) if total_tokens else None
+    return chunk
+
+
+class TestStreamingSummaries:
+    """Test cases for token streaming."""
+
+    @patch('modules.llm_service.Groq')
+    @patch('modules.llm_service.Path')
+    def test_stream_yields_deltas_and_caches_result(self, mock_path, mock_groq_class, mock_config, tmp_path):
+        """Test that deltas are yielded in order and the full text is cached."""
+        mock_config.set('cache.summary.enabled', True)
+        mock_config.set('cache.summary.db_path', str(tmp_path / "summaries.sqlite3"))
+
+        mock_path.return_value = MagicMock(exists=MagicMock(return_value=True))
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = iter([
+            _stream_chunk("Revenue "),
+            _stream_chunk(None),
+            _stream_chunk("grew 5%."),
+            _stream_chunk(None, total_tokens=42),
+        ])
+        mock_groq_class.return_value = mock_client
+
+        with patch('builtins.open', mock_open(read_data="Test: {table_data}")):
+            service = LLMService()
+
+        assert list(service.generate_summary_stream("| A |")) == ["Revenue ", "grew 5%."]
+        assert mock_client.chat.completions.create.call_args.kwargs['stream'] is True
+
+        # A repeated request is answered from the cache as a single delta
+        assert list(service.generate_summary_stream("| A |")) == ["Revenue grew 5%."]
+        assert service.generate_summary("| A |") == "Revenue grew 5%."
+        assert mock_client.chat.completions.create.call_count == 1
+
+    @patch('modules.llm_service.Groq')
+    @patch('modules.llm_service.Path')
+    @patch('time.sleep')
+    def test_stream_open_retries(self, mock_sleep, mock_path, mock_groq_class, mock_config):
+        """Test that opening the stream is retried on API errors."""
+        mock_path.return_value = MagicMock(exists=MagicMock(return_value=True))
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.side_effect = [
+            APITimeoutError(request=MagicMock()),
+            iter([_stream_chunk("ok")]),
+        ]
+        mock_groq_class.return_value = mock_client
+
+        with patch('builtins.open', mock_open(read_data="Test: {table_data}")):
+            service = LLMService()
+
+        assert list(service.generate_summary_stream("| A |")) == ["ok"]
+        assert mock_client.chat.completions.create.call_count == 2
+        mock_sleep.assert_called_once()
+
+    @patch('modules.llm_service.Groq')
+    @patch('modules.llm_service.Path')
+    @patch('time.sleep')
+    def test_stream_rate_limits_wait_in_limiter(self, mock_sleep, mock_path, mock_groq_class, mock_config):
+        """Test that a 429 with retry-after reopens the stream through the limiter only."""
+        mock_path.return_value = MagicMock(exists=MagicMock(return_value=True))
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.side_effect = [
+            RateLimitError("Rate limit exceeded", response=_rate_limited({"retry-after": "3"}), body=None),
+            iter([_stream_chunk("ok")]),
+        ]
+        mock_groq_class.return_value = mock_client
+
+        with patch('builtins.open', mock_open(read_data="Test: {table_data}")):
+            service = LLMService()
+        service.rate_limiter = MagicMock(enabled=True)
+
+        assert list(service.generate_summary_stream("| A |")) == ["ok"]
+        assert service.rate_limiter.acquire.call_count == 2
+        mock_sleep.assert_not_called()
+
+
+class TestRequestCoalescing:
+    """Test cases for sharing identical in-flight requests."""
+
+    @pytest.fixture
+    def service(self, mock_config):
+        """LLMService with scripted sync and async clients."""
+        from unittest.mock import AsyncMock
+
+        with patch('modules.llm_service.Path') as mock_path, \
+                patch('modules.llm_service.Groq') as mock_groq_class, \
+                patch('modules.llm_service.AsyncGroq') as mock_async_groq_class, \
+                patch('builtins.open', mock_open(read_data="Test: {table_data}")):
+            mock_path.return_value = MagicMock(exists=MagicMock(return_value=True))
+            mock_groq_class.return_value = MagicMock()
+            mock_async_client = MagicMock()
+            mock_async_client.chat.completions.create = AsyncMock()
+            mock_async_groq_class.return_value = mock_async_client
+            yield LLMService()
+
+    def test_concurrent_clicks_share_one_call(self, service):
+        """Test that identical summaries requested from several threads make one API call."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        release = threading.Event()
+
+        def slow_create(**kwargs):
+            release.wait(5)
+            return _completion("Shared summary")
+
+        create = service.client.chat.completions.create
+        create.side_effect = slow_create
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(service.generate_summary, "| A |") for _ in range(3)]
+            while service.in_flight.get_stats()["shared"] < 2:
+                release.wait(0.01)
+            release.set()
+
+            assert [f.result(5) for f in futures] == ["Shared summary"] * 3
+
+        assert create.call_count == 1
+
+    def test_identical_tables_in_a_batch_share_one_call(self, service):
+        """Test that duplicate tables in one batch coalesce across asyncio tasks."""
+        import asyncio
+
+        async def fake_create(**kwargs):
+            await asyncio.sleep(0.05)
+            return _completion("Summary of " + kwargs["messages"][1]["content"])
+
+        create = service.async_client.chat.completions.create
+        create.side_effect = fake_create
+        service.pack_max_tables = 1
+
+        tables = [((1, 1), "| A |"), ((2, 1), "| A |"), ((3, 1), "| B |")]
+        results = {key: summary for key, summary, _ in service.iter_table_summaries(tables)}
+
+        assert results[(1, 1)] == results[(2, 1)] == "Summary of Test: | A |"
+        assert create.call_count == 2
+
+    def test_failures_reach_every_caller(self, service):
+        """Test that a failed shared call raises to the callers waiting on it."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        service.max_retries = 0
+        release = threading.Event()
+
+        def failing_create(**kwargs):
+            release.wait(5)
+            raise ValueError("bad request")
+
+        service.client.chat.completions.create.side_effect = failing_create
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(service.generate_summary, "| A |") for _ in range(2)]
+            while service.in_flight.get_stats()["shared"] < 1:
+                release.wait(0.01)
+            release.set()
+
+            for future in futures:
+                with pytest.raises(ValueError, match="bad request"):
+                    future.result(5)
+
+    def test_closed_stream_hands_over(self, service):
+        """Test that abandoning a leading stream lets a waiting caller start over."""
+        service.client.chat.completions.create.side_effect = [
+            iter([_stream_chunk("Partial "), _stream_chunk("text")]),
+            _completion("Fresh summary"),
+        ]
+
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        stream = service.generate_summary_stream("| A |")
+        assert next(stream) == "Partial "
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            follower = pool.submit(service.generate_summary, "| A |")
+            while service.in_flight.get_stats()["shared"] < 1:
+                time.sleep(0.01)
+            stream.close()
+
+            assert follower.result(5) == "Fresh summary"
+
+        assert service.client.chat.completions.create.call_count == 2
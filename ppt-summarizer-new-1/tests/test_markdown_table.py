@@ -0,0 +1,93 @@
+"""
+Unit tests for markdown table module.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.markdown_table import dataframe_to_markdown, display_width, markdown_table
+
+
+class TestMarkdownTable:
+    """Test cases for markdown_table."""
+
+    def test_numeric_and_text_columns(self):
+        """Test alignment markers, decimal alignment and header padding."""
+        text = markdown_table(
+            ["Segment", "Rate"],
+            [["Retail", "-2"], ["Corporate", "7.25"], ["SME", "3"]]
+        )
+
+        assert text == (
+            "| Segment   |   Rate |\n"
+            "|:----------|-------:|\n"
+            "| Retail    |  -2    |\n"
+            "| Corporate |   7.25 |\n"
+            "| SME       |   3    |"
+        )
+
+    def test_floats_rerendered(self):
+        """Test thousands separators and trailing zeros in float columns."""
+        text = markdown_table(["Value"], [["1,234.50"], ["0.10"]])
+
+        assert text.splitlines()[2:] == ["|  1234.5 |", "|     0.1 |"]
+
+    def test_multiline_cells(self):
+        """Test that line breaks spread a row over several lines."""
+        text = markdown_table(["A", "B"], [["one\ntwo", "x"]])
+
+        assert text.splitlines()[2:] == ["| one | x   |", "| two |     |"]
+
+    def test_empty_tables(self):
+        """Test tables without rows or columns."""
+        assert markdown_table([], []) == ""
+        assert markdown_table(["A"], []) == "| A   |\n|-----|"
+
+    def test_wide_characters(self):
+        """Test that East Asian wide characters count double."""
+        assert display_width("売上") == 4
+        assert markdown_table(["売上"], [["x"]]).splitlines()[0] == "| 売上   |"
+
+    @pytest.mark.parametrize("rows", [
+        [["Retail", "-2", "5"], ["Corporate", "7", "-1"], ["SME", "3", "2"]],
+        [["A", "1,200", "True"], ["B", "", "False"], ["C", "3.5", ""]],
+        [["x", "inf", "1e5"], ["y", "nan", "2.50"], ["z", "-0", " padded "]],
+        [["a\nb", "1", "c"], ["d", "2\n3", "e"]],
+    ])
+    def test_matches_to_markdown(self, rows):
+        """Test byte-identical output with DataFrame.to_markdown."""
+        pytest.importorskip("tabulate")
+        headers = ["Segment", "Value (%)", "Other"]
+
+        expected = pd.DataFrame(rows, columns=headers).to_markdown(index=False)
+
+        assert markdown_table(headers, rows) == expected
+
+
+class TestDataFrameToMarkdown:
+    """Test cases for dataframe_to_markdown."""
+
+    def test_emphasis(self):
+        """Test that emphasized non-empty cells are wrapped in **."""
+        df = pd.DataFrame([["Retail", "-2"], ["SME", ""]], columns=["Segment", "Rate"])
+        emphasis = np.array([[False, True], [False, True]])
+
+        lines = dataframe_to_markdown(df, emphasis).splitlines()
+
+        assert "**-2**" in lines[2]
+        assert "**" not in lines[3]
+
+    def test_extractor_serializes_without_frame(self, mock_config, sample_pptx_file):
+        """Test that table text is built from the cells without a DataFrame."""
+        from pptx import Presentation
+        from modules.content_extractor import ContentExtractor
+
+        slide = ContentExtractor().extract_all_slides(Presentation(sample_pptx_file))[1]
+
+        text = slide.table_texts[0]
+
+        assert slide.compact_tables[0]._frame is None
+        assert text == dataframe_to_markdown(slide.tables[0], slide.compact_tables[0].formatting.emphasis)
+        # Bold red negatives are emphasized
+        assert "**-2**" in text
@@ -0,0 +1,193 @@
+"""
+Unit tests for the lightweight OOXML reader module.
+"""
+
+import io
+import zipfile
+
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
+
+from modules.ooxml_reader import COLOR_SET, OOXMLPresentation, read_table_formatted_xml, read_table_xml
+from modules.content_extractor import ContentExtractor
+
+
+class TestOOXMLPresentation:
+    """Test cases for OOXMLPresentation class."""
+
+    def test_slides_in_presentation_order(self, sample_pptx_file):
+        """Test that slide parts are resolved in presentation order."""
+        with OOXMLPresentation(sample_pptx_file) as prs:
+            assert len(prs.slides) == 3
+            assert [s.slide_number for s in prs.slides] == [1, 2, 3]
+            assert all(s.partname.startswith("ppt/slides/") for s in prs.slides)
+
+    def test_opens_file_like_object(self, sample_pptx_file):
+        """Test opening an in-memory upload."""
+        with open(sample_pptx_file, "rb") as f:
+            buffer = io.BytesIO(f.read())
+
+        prs = OOXMLPresentation(buffer)
+
+        assert len(prs.slides) == 3
+
+    def test_media_parts_are_never_read(self, tmp_path, sample_pptx_file, monkeypatch):
+        """Test that only XML parts are decompressed."""
+        prs = Presentation(sample_pptx_file)
+        image_path = tmp_path / "logo.png"
+        image_path.write_bytes(_tiny_png())
+        prs.slides[0].shapes.add_picture(str(image_path), Inches(1), Inches(1))
+        deck = tmp_path / "with_media.pptx"
+        prs.save(str(deck))
+
+        read_parts = []
+        original_read = zipfile.ZipFile.read
+
+        def tracking_read(self, name, *args, **kwargs):
+            read_parts.append(name if isinstance(name, str) else name.filename)
+            return original_read(self, name, *args, **kwargs)
+
+        monkeypatch.setattr(zipfile.ZipFile, "read", tracking_read)
+
+        with OOXMLPresentation(str(deck)) as light_prs:
+            for slide in light_prs.slides:
+                slide.element
+
+        assert read_parts
+        assert not [name for name in read_parts if "/media/" in name]
+
+    def test_rejects_non_zip(self, tmp_path):
+        """Test that non-package files raise BadZipFile."""
+        bad_file = tmp_path / "bad.pptx"
+        bad_file.write_text("not a zip")
+
+        with pytest.raises(zipfile.BadZipFile):
+            OOXMLPresentation(str(bad_file))
+
+
+class TestReadTableXml:
+    """Test cases for the merge-aware table reader."""
+
+    def test_merged_cells_fill_the_grid(self):
+        """Test gridSpan/rowSpan origins and hMerge/vMerge placeholders."""
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        table = slide.shapes.add_table(4, 4, Inches(1), Inches(1), Inches(6), Inches(3)).table
+
+        for r in range(4):
+            for c in range(4):
+                table.cell(r, c).text = f"r{r}c{c}"
+        # merge() moves the covered cells' text into the origin, so set it afterwards
+        table.cell(0, 1).merge(table.cell(0, 3))
+        table.cell(0, 1).text = "FY 2025"
+        table.cell(1, 0).merge(table.cell(3, 0))
+        table.cell(1, 0).text = "Retail"
+        table.cell(2, 2).text = "Line 1\nLine 2"
+
+        grid = read_table_xml(table._tbl)
+
+        assert grid.shape == (4, 4)
+        assert grid[0].tolist() == ["r0c0", "FY 2025", "FY 2025", "FY 2025"]
+        assert grid[:, 0].tolist() == ["r0c0", "Retail", "Retail", "Retail"]
+        assert grid[2, 2] == "Line 1\nLine 2"
+        assert grid[3, 3] == "r3c3"
+
+    def test_matches_proxy_text_without_merges(self, sample_pptx_file):
+        """Test that unmerged tables read the same as python-pptx cell.text."""
+        prs = Presentation(sample_pptx_file)
+        table = next(shape.table for shape in prs.slides[1].shapes if shape.has_table)
+
+        expected = [[cell.text.strip() for cell in row.cells] for row in table.rows]
+
+        assert read_table_xml(table._tbl).tolist() == expected
+
+
+class TestCellFormatting:
+    """Test cases for run formatting captured with the cell text."""
+
+    def test_bold_italic_and_colors(self, tmp_path):
+        """Test explicit RGB, theme colors resolved via the master, and merges."""
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        table = slide.shapes.add_table(3, 3, Inches(1), Inches(1), Inches(6), Inches(2)).table
+        for r in range(3):
+            for c in range(3):
+                table.cell(r, c).text = f"r{r}c{c}"
+
+        font = table.cell(1, 1).text_frame.paragraphs[0].runs[0].font
+        font.bold = True
+        font.color.rgb = RGBColor(0xFF, 0x00, 0x00)
+
+        font = table.cell(1, 2).text_frame.paragraphs[0].runs[0].font
+        font.italic = True
+        font.color.theme_color = MSO_THEME_COLOR.ACCENT_2
+
+        table.cell(2, 0).merge(table.cell(2, 1))
+        table.cell(2, 0).text = "Total"
+        table.cell(2, 0).text_frame.paragraphs[0].runs[0].font.bold = True
+
+        path = tmp_path / "formatted.pptx"
+        prs.save(path)
+
+        with OOXMLPresentation(str(path)) as package:
+            theme_colors = package.slides[0].theme_colors
+            tbl = package.slides[0].element.find('.//a:tbl', namespaces={'a': _A_NS})
+            text, formatting = read_table_formatted_xml(tbl, theme_colors)
+
+        assert theme_colors["accent2"] == 0xC0504D
+        assert theme_colors["tx1"] == theme_colors["dk1"]
+        assert text.tolist() == read_table_xml(tbl).tolist()
+        assert formatting.bold.tolist() == [[False] * 3, [False, True, False], [True, True, False]]
+        assert formatting.italic[1].tolist() == [False, False, True]
+        assert formatting.color[1, 1] == COLOR_SET | 0xFF0000
+        assert formatting.color[1, 2] == COLOR_SET | 0xC0504D
+        assert formatting.color[0, 0] == 0
+        # Both the explicit and the theme red count as red
+        assert formatting.red[1].tolist() == [False, True, True]
+        assert formatting.emphasis[2].tolist() == [True, True, False]
+
+
+class TestLightweightExtraction:
+    """Test that both readers produce the same SlideContent."""
+
+    def test_matches_python_pptx_extraction(self, mock_config, sample_pptx_file):
+        """Test lightweight extraction against the python-pptx path."""
+        extractor = ContentExtractor()
+
+        full = extractor.extract_all_slides(Presentation(sample_pptx_file))
+        light = extractor.extract_all_slides(OOXMLPresentation(sample_pptx_file))
+
+        assert len(full) == len(light)
+        for expected, actual in zip(full, light):
+            assert actual.slide_number == expected.slide_number
+            assert actual.title == expected.title
+            assert actual.text_content == expected.text_content
+            assert actual.table_texts == expected.table_texts
+            assert actual.has_content == expected.has_content
+            assert actual.shapes_visited == expected.shapes_visited
+            assert actual.cells_read == expected.cells_read
+            for expected_df, actual_df in zip(expected.tables, actual.tables):
+                assert actual_df.equals(expected_df)
+            for expected_fmt, actual_fmt in zip(expected.table_formats, actual.table_formats):
+                assert (actual_fmt.bold == expected_fmt.bold).all()
+                assert (actual_fmt.color == expected_fmt.color).all()
+
+
+_A_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+
+
+def _tiny_png() -> bytes:
+    """Build a valid 1x1 PNG."""
+    import struct
+    import zlib
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(b"\x00\xff\x00\x00")) + chunk(b"IEND", b""))
@@ -0,0 +1,164 @@
+"""
+Unit tests for prompt budget module.
+"""
+
+import numpy as np
+import pandas as pd
+
+from modules.content_extractor import CompactTable, SlideContent
+from modules.prompt_budget import TableFit, fit_table, table_budget_for
+from modules.table_serializers import estimate_tokens
+from modules.table_typing import normalize_table
+
+HEADERS = ["Region", "Branch Id", "Loan Default Rate (%)", "Net Rate (%)", "Notes"]
+
+
+def _rows(n=300):
+    """Steady regions with one outlier and one negative net rate."""
+    rows = [[f"Region {i}", f"B{i:04d}", f"{3 + (i % 5) * 0.1:.1f}%", f"{4 + (i % 3) * 0.1:.1f}%", "stable"]
+            for i in range(n)]
+    rows[150][2] = "19.5%"
+    rows[220][3] = "-2.5%"
+    return rows
+
+
+def _fit(rows, budget, encoding="csv", emphasis=None):
+    typed = normalize_table(pd.DataFrame(rows, columns=HEADERS))
+    return fit_table(HEADERS, rows, typed, budget, encoding, emphasis)
+
+
+class TestFitTable:
+    """Test cases for fit_table."""
+
+    def test_fits_budget(self, mock_config):
+        """Test that the trimmed text stays within the budget."""
+        fit = _fit(_rows(), 400)
+
+        assert fit.tokens == estimate_tokens(fit.text) <= 400
+        assert fit.trimmed
+        assert 0 < fit.omitted_rows < 300
+
+    def test_projects_relevant_columns(self, mock_config):
+        """Test that only the label and rate columns are kept."""
+        fit = _fit(_rows(), 400)
+
+        assert fit.text.splitlines()[0] == "Region,Loan Default Rate (%),Net Rate (%)"
+        assert fit.omitted_columns == ["Branch Id", "Notes"]
+
+    def test_keeps_anomalies_and_negatives(self, mock_config):
+        """Test that the outlier and the negative row survive a tight budget."""
+        fit = _fit(_rows(), 120)
+
+        assert "Region 150,19.5%" in fit.text
+        assert "Region 220,3.0%,-2.5%" in fit.text
+
+    def test_keeps_emphasized_rows(self, mock_config):
+        """Test that highlighted rows are kept ahead of anomalies."""
+        emphasis = np.zeros((300, len(HEADERS)), dtype=bool)
+        emphasis[42, 1] = True
+
+        fit = _fit(_rows(), 120, emphasis=emphasis)
+
+        assert "Region 42," in fit.text
+
+    def test_footer_aggregates(self, mock_config):
+        """Test the omitted-rows footer."""
+        fit = _fit(_rows(), 400)
+        footer = fit.text.splitlines()[-1]
+
+        assert footer.startswith(f"{fit.omitted_rows} rows omitted, aggregates: Loan Default Rate (%) min 3%")
+        assert footer.endswith("2 columns omitted: Branch Id, Notes.")
+
+    def test_rows_stay_in_table_order(self, mock_config):
+        """Test that kept rows are not reordered by score."""
+        fit = _fit(_rows(), 400)
+        numbers = [int(line.split(",")[0].split()[1]) for line in fit.text.splitlines()[1:-2]]
+
+        assert numbers == sorted(numbers)
+
+    def test_note(self, mock_config):
+        """Test the UI note."""
+        assert _fit(_rows(), 400).note.startswith("Table trimmed to fit the 400-token prompt budget: kept ")
+        assert TableFit("text", 1, 3, 2).note is None
+
+
+class TestTableBudgets:
+    """Test cases for per-model budgets and table integration."""
+
+    def test_table_budget_for(self, mock_config):
+        """Test default, per-model and disabled budgets."""
+        mock_config.set('llm.table_budget.default', 2000)
+        mock_config.set('llm.table_budget.models', {"big-model": 16000, "no-limit": 0})
+
+        assert table_budget_for("small-model") == 2000
+        assert table_budget_for("big-model") == 16000
+        assert table_budget_for("no-limit") is None
+
+    def test_small_tables_unchanged(self, mock_config):
+        """Test that tables within the budget use their encoded text."""
+        table = CompactTable.from_cells(
+            np.array([["Segment", "Rate"], ["Retail", "2%"], ["SME", "3%"]], dtype=object), True
+        )
+
+        fit = table.fit("csv", 3000)
+
+        assert fit.text == table.encode("csv")
+        assert not fit.trimmed
+        assert table.fit("csv", None).text == table.encode("csv")
+
+    def test_slide_prompt_tables(self, mock_config):
+        """Test trimming through SlideContent.prompt_tables."""
+        cells = np.array([HEADERS] + _rows(), dtype=object)
+        slide = SlideContent(1, "Appendix", [], [CompactTable.from_cells(cells, True, caption="Regional appendix")])
+
+        fit = slide.prompt_tables("markdown", 500)[0]
+
+        assert fit.text.startswith("Regional appendix\n\n| Region")
+        assert fit.tokens <= 500
+        assert fit.total_rows == 300 and fit.total_columns == 5
+
+
+class TestChunkTable:
+    """Test cases for map-reduce chunking."""
+
+    SEGMENTS = ["Retail", "Corporate", "SME", "Mortgage"]
+
+    def _segment_rows(self, n=400):
+        return [[self.SEGMENTS[i % 4], f"Region {i}", f"{2 + i % 7 * 0.3:.1f}%", f"{3 + i % 5 * 0.2:.1f}%"]
+                for i in range(n)]
+
+    def _chunks(self, rows, budget, encoding="markdown"):
+        from modules.prompt_budget import chunk_table
+
+        headers = ["Segment", "Region", "Default Rate (%)", "Net Rate (%)"]
+        typed = normalize_table(pd.DataFrame(rows, columns=headers))
+        return chunk_table(headers, rows, typed, budget, encoding, caption="Appendix")
+
+    def test_chunks_fit_budget_and_cover_rows(self, mock_config):
+        """Test that every row lands in exactly one chunk within the budget."""
+        rows = self._segment_rows()
+        chunks = self._chunks(rows, 1500)
+
+        assert len(chunks) > 1
+        assert all(estimate_tokens(chunk) <= 1500 for chunk in chunks)
+        regions = [line.split("|")[2].strip() for chunk in chunks for line in chunk.splitlines()[6:]]
+        assert sorted(regions) == sorted(row[1] for row in rows)
+
+    def test_chunks_grouped_by_segment(self, mock_config):
+        """Test that rows are grouped by their segment column."""
+        chunks = self._chunks(self._segment_rows(), 1500, "csv")
+
+        assert chunks[0].startswith(f"Appendix\n\nPart 1 of {len(chunks)}: ")
+        assert chunks[0].splitlines()[2].endswith("Segment: Retail")
+        segments = [{line.split(",")[0] for line in chunk.splitlines()[5:]} for chunk in chunks]
+        assert all(len(group) <= 2 for group in segments)
+
+    def test_slide_prompt_tables_split(self, mock_config):
+        """Test that oversized tables carry chunks when splitting is allowed."""
+        cells = np.array([HEADERS] + _rows(), dtype=object)
+        table = CompactTable.from_cells(cells, True)
+
+        fit = table.fit("csv", 800, max_chunks=16)
+        assert fit.chunks and fit.note.endswith(f"summarized in {len(fit.chunks)} row-group parts and combined")
+        assert table.fit("csv", 800, max_chunks=1).chunks == []
+        assert table.fit("csv", 800).chunks == []
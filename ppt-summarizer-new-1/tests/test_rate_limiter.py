@@ -0,0 +1,246 @@
+"""
+Unit tests for rate limiter module.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, mock_open, patch
+
+import pytest
+
+from modules.rate_limiter import RateLimiter, TokenBucket, parse_reset_duration, server_retry_delay
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestParseResetDuration:
+    """Test cases for parse_reset_duration."""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("7.66s", 7.66),
+        ("2m59.56s", 179.56),
+        ("1h2m", 3720.0),
+        ("120ms", 0.12),
+        ("3", 3.0),
+    ])
+    def test_valid_durations(self, value, expected):
+        assert parse_reset_duration(value) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "5x"])
+    def test_invalid_durations(self, value):
+        assert parse_reset_duration(value) is None
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket class."""
+
+    def test_reservations_queue_when_empty(self):
+        """Test that exhausted buckets return increasing waits."""
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=60, per_seconds=60, clock=clock)
+
+        assert bucket.reserve(60) == 0.0
+        assert bucket.reserve(1) == pytest.approx(1.0)
+        assert bucket.reserve(1) == pytest.approx(2.0)
+
+    def test_refill_over_time(self):
+        """Test that the bucket refills at capacity per period."""
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=60, per_seconds=60, clock=clock)
+        bucket.reserve(60)
+
+        clock.now = 30.0
+
+        assert bucket.level == pytest.approx(30.0)
+        assert bucket.reserve(30) == 0.0
+
+    def test_oversized_reservation_is_clamped(self):
+        """Test that a request larger than the bucket still gets through."""
+        bucket = TokenBucket(capacity=10, per_seconds=60, clock=FakeClock())
+
+        assert bucket.reserve(1000) == 0.0
+
+    def test_observe_clamps_to_server_remaining(self):
+        """Test adapting to the server's remaining quota and reset time."""
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=100, per_seconds=60, clock=clock)
+
+        bucket.observe(remaining=0, reset_seconds=5.0)
+
+        assert bucket.reserve(0) == pytest.approx(5.0)
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter class."""
+
+    def test_request_and_token_buckets(self):
+        """Test that the tighter of the two buckets decides the wait."""
+        clock = FakeClock()
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600, clock=clock)
+
+        assert limiter.reserve(600) == 0.0
+        # Request bucket has room, token bucket needs 10s for 100 tokens
+        assert limiter.reserve(100) == pytest.approx(10.0)
+
+    def test_retry_after_blocks_requests(self):
+        """Test that a 429 Retry-After header pauses new requests."""
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=6000, clock=FakeClock())
+
+        limiter.update_from_headers({"retry-after": "3"}, status_code=429)
+
+        assert limiter.reserve(1) == pytest.approx(3.0)
+
+    def test_server_retry_delay(self):
+        """Test reading the delay a 429 asks for from its headers."""
+        assert server_retry_delay({"retry-after": "3"}) == 3.0
+        assert server_retry_delay({
+            "x-ratelimit-remaining-tokens": "0", "x-ratelimit-reset-tokens": "7.5s",
+            "x-ratelimit-remaining-requests": "5", "x-ratelimit-reset-requests": "20s"
+        }) == 7.5
+        assert server_retry_delay({"x-ratelimit-remaining-requests": "5", "x-ratelimit-reset-requests": "2s"}) is None
+        assert server_retry_delay({}) is None
+
+    def test_settle_returns_unused_tokens(self):
+        """Test that unused reserved tokens go back to the bucket."""
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=1000, clock=FakeClock())
+
+        limiter.reserve(800)
+        limiter.settle(800, 300)
+
+        assert limiter.tokens.level == pytest.approx(700)
+
+    def test_disabled_limiter_never_waits(self):
+        """Test that a disabled limiter is a no-op."""
+        limiter = RateLimiter(requests_per_minute=1, tokens_per_minute=1, enabled=False, clock=FakeClock())
+
+        assert limiter.acquire(100) == 0.0
+        assert limiter.acquire(100) == 0.0
+
+
+class _GroqStandIn(BaseHTTPRequestHandler):
+    """Minimal chat completions endpoint returning Groq rate-limit headers."""
+
+    requests_seen = []
+    rate_limited = 0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        _GroqStandIn.requests_seen.append((self.path, body))
+
+        if _GroqStandIn.rate_limited:
+            _GroqStandIn.rate_limited -= 1
+            payload = json.dumps({"error": {"message": "Rate limit reached", "type": "tokens"}}).encode()
+            self.send_response(429)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("retry-after", "0.2")
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+
+        payload = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body["model"],
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "- Stand-in summary"},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": 20, "completion_tokens": 10, "total_tokens": 30}
+        }).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("x-ratelimit-remaining-requests", "2")
+        self.send_header("x-ratelimit-remaining-tokens", "250")
+        self.send_header("x-ratelimit-reset-tokens", "7.66s")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def groq_stand_in():
+    """Local HTTP server standing in for the Groq API."""
+    _GroqStandIn.requests_seen = []
+    _GroqStandIn.rate_limited = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _GroqStandIn)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestLLMServiceRateLimiting:
+    """Test LLMService against a local stand-in server."""
+
+    @patch('modules.llm_service.Path')
+    def test_requests_acquire_and_headers_adapt(self, mock_path, mock_config, groq_stand_in):
+        """Test that calls acquire from the limiter and feed back response headers."""
+        from modules.llm_service import LLMService
+
+        mock_config.set('llm.base_url', groq_stand_in)
+        mock_config.set('llm.max_retries', 0)
+        mock_path.return_value = MagicMock(exists=MagicMock(return_value=True))
+        limiter = RateLimiter(requests_per_minute=30, tokens_per_minute=6000)
+
+        with patch('modules.llm_service.get_rate_limiter', return_value=limiter), \
+                patch('builtins.open', mock_open(read_data="Test: {table_data}")):
+            service = LLMService()
+
+        with patch.object(limiter, 'acquire', wraps=limiter.acquire) as acquire:
+            summary = service.generate_summary("| A | B |")
+
+        assert summary == "- Stand-in summary"
+        acquire.assert_called_once()
+        assert len(_GroqStandIn.requests_seen) == 1
+        assert _GroqStandIn.requests_seen[0][0].endswith("/chat/completions")
+
+        # Buckets were clamped to the server's remaining quota
+        # (allowing for refill while the test runs)
+        assert limiter.requests.level < 3
+        assert limiter.tokens.level < 250 + acquire.call_args[0][0]
+
+    @patch('modules.llm_service.Path')
+    def test_rate_limited_request_waits_once(self, mock_path, mock_config, groq_stand_in):
+        """Test that a 429 is retried after the limiter waits out retry-after, with no extra backoff."""
+        from modules.llm_service import LLMService
+
+        mock_config.set('llm.base_url', groq_stand_in)
+        mock_config.set('llm.max_retries', 1)
+        mock_config.set('llm.retry_delay_seconds', 30)
+        mock_path.return_value = MagicMock(exists=MagicMock(return_value=True))
+        limiter = RateLimiter(requests_per_minute=30, tokens_per_minute=6000)
+        _GroqStandIn.rate_limited = 1
+
+        with patch('modules.llm_service.get_rate_limiter', return_value=limiter), \
+                patch('builtins.open', mock_open(read_data="Test: {table_data}")):
+            service = LLMService()
+
+        started = time.monotonic()
+        with patch.object(limiter, 'acquire', wraps=limiter.acquire) as acquire:
+            summary = service.generate_summary("| A | B |")
+        elapsed = time.monotonic() - started
+
+        assert summary == "- Stand-in summary"
+        # The SDK did not retry on its own; the limiter held the retry for
+        # retry-after instead of the 30s backoff
+        assert len(_GroqStandIn.requests_seen) == 2
+        assert acquire.call_count == 2
+        assert 0.15 <= elapsed < 5
@@ -0,0 +1,108 @@
+"""
+Unit tests for rule-based summarizer module.
+"""
+
+import pandas as pd
+import pytest
+
+from modules.rule_summarizer import RuleSummarizer, RULE_SUMMARY_FOOTER
+
+
+@pytest.fixture
+def loan_table():
+    """Table from generate_sample_ppt.py."""
+    return pd.DataFrame(
+        [["Retail", "-2", "5"], ["Corporate", "7", "-1"], ["SME", "3", "2"]],
+        columns=["Segment", "Loan Default Rate (%)", "Net Rate (%)"]
+    )
+
+
+@pytest.fixture
+def quarterly_table():
+    """Table from Example 1 of prompt_template.txt."""
+    return pd.DataFrame(
+        [
+            ["Commercial", "2.3", "2.8", "1.2"],
+            ["Retail", "3.1", "4.5", "−0.5"],
+            ["Mortgage", "1.5", "1.6", "0.8"],
+        ],
+        columns=["Segment", "Q1 Default Rate (%)", "Q2 Default Rate (%)", "Net Rate (%)"]
+    )
+
+
+class TestRuleSummarizer:
+    """Test cases for RuleSummarizer class."""
+
+    def test_negatives_extremes_and_breaches(self, mock_config, loan_table):
+        """Test the checks on the sample loan table."""
+        summary = RuleSummarizer().summarize(loan_table)
+
+        assert summary.startswith("- **Executive Summary**:")
+        assert "2 negative values and 1 default-rate threshold breach" in summary
+        assert "Loan Default Rate (%): highest Corporate (7%), lowest Retail (-2%)" in summary
+        assert "**Retail Loan Default Rate (%) is negative (-2%)**" in summary
+        assert "**Corporate Net Rate (%) is negative (-1%)**" in summary
+        assert "Corporate Loan Default Rate (%) of 7% exceeds the 5% threshold" in summary
+        assert "Review the Corporate segment (2 risk flags)" in summary
+        assert summary.endswith(RULE_SUMMARY_FOOTER)
+
+    def test_quarter_over_quarter_deltas(self, mock_config, quarterly_table):
+        """Test period-column deltas and unicode minus parsing."""
+        summary = RuleSummarizer().summarize(quarterly_table)
+
+        assert "- Commercial: 2.3% to 2.8% (up 0.5 percentage points)" in summary
+        assert "- **Retail: 3.1% to 4.5% (up 1.4 percentage points)**" in summary
+        assert "**Retail Net Rate (%) is negative (-0.5%)**" in summary
+        assert "Review the Retail segment (2 risk flags)" in summary
+
+    def test_change_column_and_number_formats(self, mock_config):
+        """Test explicit change columns, accounting negatives and separators."""
+        table = pd.DataFrame(
+            [["North", "$1,200", "(0.1)"], ["South", "$3,400", "+1.4"]],
+            columns=["Region", "Balance", "Change"]
+        )
+        summary = RuleSummarizer().summarize(table)
+
+        assert "Balance: highest South (3400), lowest North (1200)" in summary
+        assert "- North: down 0.1 points" in summary
+        assert "- **South: up 1.4 points**" in summary
+        # Decreases in a change column are not negative values
+        assert "is negative" not in summary
+
+    def test_no_findings(self, mock_config):
+        """Test a table without risk indicators."""
+        table = pd.DataFrame([["A", "1"], ["B", "2"]], columns=["Segment", "Net Rate (%)"])
+        summary = RuleSummarizer().summarize(table)
+
+        assert "found no negative values or threshold breaches" in summary
+        assert "No negative values or threshold breaches detected" in summary
+        assert "Recommendations" not in summary
+
+    def test_non_numeric_table(self, mock_config):
+        """Test that text-only tables are left to the LLM."""
+        table = pd.DataFrame([["Owner", "Risk team"]], columns=["Field", "Value"])
+        summarizer = RuleSummarizer()
+
+        assert summarizer.summarize(table) is None
+        assert summarizer.summarize(None) is None
+        assert not summarizer.is_eligible(table)
+
+    def test_policy(self, mock_config, loan_table):
+        """Test policy switches and the replace size limits."""
+        mock_config.set('rule_summarizer.policy', 'replace')
+        summarizer = RuleSummarizer()
+        assert summarizer.replaces_llm(loan_table)
+        assert summarizer.falls_back and not summarizer.previews
+
+        summarizer.max_rows = 2
+        assert not summarizer.replaces_llm(loan_table)
+
+        mock_config.set('rule_summarizer.policy', 'preview')
+        summarizer = RuleSummarizer()
+        assert summarizer.previews and not summarizer.replaces_llm(loan_table)
+
+        mock_config.set('rule_summarizer.policy', 'off')
+        assert not RuleSummarizer().falls_back
+
+        mock_config.set('rule_summarizer.policy', 'bogus')
+        assert RuleSummarizer().policy == 'fallback'
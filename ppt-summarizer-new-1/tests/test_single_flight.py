@@ -0,0 +1,187 @@
+"""
+Unit tests for single-flight module.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from modules.single_flight import SingleFlight
+
+
+class TestSingleFlightThreads:
+    """Test cases for blocking callers."""
+
+    def test_concurrent_callers_share_one_call(self):
+        """Test that callers arriving while a call runs get its result."""
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def summarize():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "summary"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            leader = pool.submit(flight.do, "key", summarize)
+            started.wait(5)
+            followers = [pool.submit(flight.do, "key", summarize) for _ in range(3)]
+            while flight.get_stats()["shared"] < 3:
+                threading.Event().wait(0.01)
+            release.set()
+
+            assert [f.result(5) for f in [leader] + followers] == ["summary"] * 4
+
+        assert len(calls) == 1
+        assert flight.get_stats() == {"in_flight": 0, "shared": 3}
+
+    def test_errors_reach_followers(self):
+        """Test that a failed call raises its error to every waiter."""
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def fail():
+            started.set()
+            release.wait(5)
+            raise ValueError("quota exhausted")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, "key", fail)
+            started.wait(5)
+            follower = pool.submit(flight.do, "key", lambda: "unused")
+            while flight.get_stats()["shared"] < 1:
+                threading.Event().wait(0.01)
+            release.set()
+
+            for future in (leader, follower):
+                with pytest.raises(ValueError, match="quota exhausted"):
+                    future.result(5)
+
+    def test_settled_calls_are_not_reused(self):
+        """Test that a later caller starts a new call."""
+        flight = SingleFlight()
+        results = iter(["first", "second"])
+
+        assert flight.do("key", lambda: next(results)) == "first"
+        assert flight.do("key", lambda: next(results)) == "second"
+
+    def test_pending(self):
+        """Test reporting whether a key has a call in flight."""
+        flight = SingleFlight()
+        seen = []
+
+        flight.do("key", lambda: seen.append(flight.pending("key")))
+
+        assert seen == [True]
+        assert flight.pending("key") is False
+
+    def test_distinct_keys_run_separately(self):
+        """Test that different keys never share a call."""
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.get_stats()["shared"] == 0
+
+
+class TestSingleFlightAsync:
+    """Test cases for asyncio callers."""
+
+    def test_tasks_share_one_call(self):
+        """Test that concurrent tasks await the same call."""
+        flight = SingleFlight()
+        calls = []
+
+        async def summarize():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "summary"
+
+        async def main():
+            return await asyncio.gather(*(flight.do_async("key", summarize) for _ in range(5)))
+
+        assert asyncio.run(main()) == ["summary"] * 5
+        assert len(calls) == 1
+
+    def test_errors_reach_followers(self):
+        """Test that a failed call raises its error to every task."""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.05)
+            raise ValueError("bad request")
+
+        async def main():
+            return await asyncio.gather(*(flight.do_async("key", fail) for _ in range(3)), return_exceptions=True)
+
+        results = asyncio.run(main())
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_cancelled_leader_hands_over(self):
+        """Test that a waiter runs the call itself when the leader is cancelled."""
+        flight = SingleFlight()
+        calls = []
+
+        async def summarize():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "summary"
+
+        async def main():
+            leader = asyncio.create_task(flight.do_async("key", summarize))
+            await asyncio.sleep(0.01)
+            follower = asyncio.create_task(flight.do_async("key", summarize))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        assert asyncio.run(main()) == "summary"
+        assert len(calls) == 2
+
+    def test_cancelled_follower_leaves_call_running(self):
+        """Test that cancelling a waiter does not cancel the shared call."""
+        flight = SingleFlight()
+
+        async def summarize():
+            await asyncio.sleep(0.05)
+            return "summary"
+
+        async def main():
+            leader = asyncio.create_task(flight.do_async("key", summarize))
+            await asyncio.sleep(0.01)
+            follower = asyncio.create_task(flight.do_async("key", summarize))
+            other = asyncio.create_task(flight.do_async("key", summarize))
+            await asyncio.sleep(0.01)
+            follower.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await follower
+            return await leader, await other
+
+        assert asyncio.run(main()) == ("summary", "summary")
+
+    def test_task_joins_thread_call(self):
+        """Test that a task waits for a blocking call running in another thread."""
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def summarize():
+            started.set()
+            release.wait(5)
+            return "summary"
+
+        async def follow():
+            return await flight.do_async("key", lambda: asyncio.sleep(0, "unused"))
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(flight.do, "key", summarize)
+            started.wait(5)
+            threading.Timer(0.05, release.set).start()
+
+            assert asyncio.run(follow()) == "summary"
+            assert leader.result(5) == "summary"
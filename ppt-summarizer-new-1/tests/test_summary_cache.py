@@ -0,0 +1,122 @@
+"""
+Unit tests for LLM summary cache module.
+"""
+
+import time
+from unittest.mock import MagicMock, mock_open, patch
+
+import pytest
+
+from modules.config_manager import get_config
+from modules.summary_cache import SummaryCache
+
+
+@pytest.fixture
+def summary_cache(mock_config, tmp_path):
+    """Enabled summary cache backed by a temporary database."""
+    mock_config.set('cache.summary.enabled', True)
+    mock_config.set('cache.summary.db_path', str(tmp_path / "summaries.sqlite3"))
+    mock_config.set('cache.summary.max_entries', 3)
+    return SummaryCache()
+
+
+def _key(prompt, version="v1", model="test-model", temperature=0.3, max_tokens=1024):
+    return SummaryCache.make_key(model, temperature, max_tokens, prompt, version)
+
+
+class TestSummaryCache:
+    """Test cases for SummaryCache class."""
+
+    def test_key_covers_request_parameters(self):
+        """Test that every request parameter changes the key."""
+        base = _key("prompt")
+
+        assert base == _key("prompt")
+        assert base != _key("other prompt")
+        assert base != _key("prompt", version="v2")
+        assert base != _key("prompt", model="other-model")
+        assert base != _key("prompt", temperature=0.7)
+        assert base != _key("prompt", max_tokens=512)
+
+    def test_prompt_version_tracks_template_and_role(self):
+        """Test that editing the template or system role changes the version."""
+        version = SummaryCache.prompt_version("Analyze: {table_data}", "analyst")
+
+        assert version == SummaryCache.prompt_version("Analyze: {table_data}", "analyst")
+        assert version != SummaryCache.prompt_version("Summarize: {table_data}", "analyst")
+        assert version != SummaryCache.prompt_version("Analyze: {table_data}", "auditor")
+
+    def test_put_and_get(self, summary_cache):
+        """Test storing and reading a summary."""
+        assert summary_cache.get(_key("p")) is None
+
+        summary_cache.put(_key("p"), "- summary", "test-model", "v1")
+
+        assert summary_cache.get(_key("p")) == "- summary"
+        stats = summary_cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_survives_restart(self, summary_cache):
+        """Test that entries persist for a new cache instance."""
+        summary_cache.put(_key("p"), "- summary", "test-model", "v1")
+
+        assert SummaryCache().get(_key("p")) == "- summary"
+
+    def test_ttl_expiry(self, summary_cache):
+        """Test that expired entries are not returned."""
+        summary_cache.put(_key("p"), "- summary", "test-model", "v1")
+        summary_cache.ttl_seconds = 0
+
+        time.sleep(0.01)
+
+        assert summary_cache.get(_key("p")) is None
+        assert summary_cache.get_stats()["entries"] == 0
+
+    def test_size_bounded_eviction(self, summary_cache):
+        """Test that the least recently used entry is evicted."""
+        for name in ["a", "b", "c"]:
+            summary_cache.put(_key(name), name, "test-model", "v1")
+            time.sleep(0.01)
+
+        summary_cache.get(_key("a"))
+        summary_cache.put(_key("d"), "d", "test-model", "v1")
+
+        assert summary_cache.get(_key("b")) is None
+        assert summary_cache.get(_key("a")) == "a"
+        assert summary_cache.get_stats()["entries"] == 3
+
+
+class TestLLMServiceSummaryCache:
+    """Test LLMService integration with the summary cache."""
+
+    @patch('modules.llm_service.Groq')
+    @patch('modules.llm_service.Path')
+    def test_repeated_summary_served_from_cache(self, mock_path, mock_groq_class, summary_cache,
+                                                mock_groq_response):
+        """Test that a repeated request does not call the API again."""
+        from modules.llm_service import LLMService
+
+        mock_path.return_value = MagicMock(exists=MagicMock(return_value=True))
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mock_groq_response
+        mock_groq_class.return_value = mock_client
+
+        with patch('builtins.open', mock_open(read_data="Test: {table_data}")):
+            service = LLMService()
+
+        assert service.generate_summary("| A |") == "This is a test summary."
+        assert service.generate_summary("| A |") == "This is a test summary."
+        assert mock_client.chat.completions.create.call_count == 1
+
+        # Editing the template invalidates earlier entries
+        service.prompt_template = "Edited: {table_data}"
+        service.generate_summary("| A |")
+        assert mock_client.chat.completions.create.call_count == 2
+
+        # So does changing the system role, even with an identical user prompt
+        get_config().set('prompts.system_role', 'You are an auditor.')
+        service.generate_summary("| A |")
+        assert mock_client.chat.completions.create.call_count == 3
+        assert service.summary_cache.get_stats()["entries"] == 3
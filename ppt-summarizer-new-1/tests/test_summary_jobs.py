@@ -0,0 +1,113 @@
+"""
+Unit tests for summary jobs module.
+"""
+
+import threading
+
+import pytest
+
+from modules.summary_jobs import (
+    JOB_CANCELLED, JOB_DONE, JOB_FAILED, JOB_PENDING, JOB_RUNNING, SummaryJobQueue
+)
+
+
+@pytest.fixture
+def job_queue(mock_config):
+    """Single-worker job queue, shut down after the test."""
+    mock_config.set('llm.jobs.max_workers', 1)
+    mock_config.set('llm.jobs.max_pending', 2)
+    queue = SummaryJobQueue()
+    yield queue
+    queue.shutdown(wait=True)
+
+
+def _wait(queue, job_id):
+    """Wait for a job to finish and collect it."""
+    for _ in range(500):
+        if queue.status(job_id).finished:
+            return queue.pop(job_id)
+        threading.Event().wait(0.01)
+    raise AssertionError("job did not finish")
+
+
+class TestSummaryJobQueue:
+    """Test cases for SummaryJobQueue class."""
+
+    def test_submit_returns_immediately(self, job_queue):
+        """Test that submitting does not wait for the summary."""
+        release = threading.Event()
+
+        def summarize(text):
+            release.wait(5)
+            return f"Summary of {text}"
+
+        job_id = job_queue.submit(summarize, "| A |", label="slide 1, table 1", meta={'note': "trimmed"})
+
+        assert job_queue.status(job_id).state in (JOB_PENDING, JOB_RUNNING)
+        assert job_queue.pop(job_id) is None
+
+        release.set()
+        job = _wait(job_queue, job_id)
+
+        assert job.state == JOB_DONE
+        assert job.result == "Summary of | A |"
+        assert job.meta == {'note': "trimmed"}
+        assert job.finished_at >= job.started_at >= job.submitted_at
+        assert job_queue.status(job_id) is None
+
+    def test_failures_are_recorded(self, job_queue):
+        """Test that an exception becomes the job's error instead of escaping."""
+        def summarize(text):
+            raise RuntimeError("Rate limit exceeded")
+
+        job = _wait(job_queue, job_queue.submit(summarize, "| A |"))
+
+        assert job.state == JOB_FAILED
+        assert job.error == "Rate limit exceeded"
+        assert job.result is None
+
+    def test_streamed_results_expose_partial_text(self, job_queue):
+        """Test that iterator results are collected delta by delta."""
+        first, release = threading.Event(), threading.Event()
+
+        def stream(text):
+            yield "Revenue "
+            first.set()
+            release.wait(5)
+            yield "grew 5%."
+
+        job_id = job_queue.submit(stream, "| A |")
+        first.wait(5)
+        threading.Event().wait(0.05)
+
+        assert job_queue.status(job_id).partial == "Revenue "
+
+        release.set()
+        assert _wait(job_queue, job_id).result == "Revenue grew 5%."
+
+    def test_bounded_and_cancellable(self, job_queue):
+        """Test the max_pending limit and cancelling a queued job."""
+        release = threading.Event()
+
+        running = job_queue.submit(lambda: release.wait(5) and "done")
+        queued = job_queue.submit(lambda: "queued")
+
+        assert job_queue.submit(lambda: "rejected") is None
+        assert job_queue.cancel(queued) is True
+        assert job_queue.status(queued).state == JOB_CANCELLED
+        assert job_queue.cancel(running) is False
+
+        release.set()
+        assert _wait(job_queue, running).result == "done"
+        assert job_queue.get_stats()[JOB_CANCELLED] == 1
+
+    def test_uncollected_jobs_expire(self, job_queue):
+        """Test that finished jobs are forgotten after the retention period."""
+        job_queue.retention = 0
+        job_id = job_queue.submit(lambda: "summary")
+        while not job_queue.status(job_id).finished:
+            threading.Event().wait(0.01)
+
+        job_queue.submit(lambda: "next")
+
+        assert job_queue.status(job_id) is None
@@ -0,0 +1,164 @@
+"""
+Unit tests for table serializers module.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.table_serializers import (
+    AUTO, MARKDOWN, available_encodings, cheapest_encoding, estimate_tokens, register_serializer,
+    serialize_dataframe, serialize_table, table_encoding_for, token_report
+)
+
+HEADERS = ["Segment", "Loan Default Rate (%)", "Net Rate (%)"]
+ROWS = [["Retail", "-2", "5"], ["Corporate", "7", "-1"], ["SME", "3", ""]]
+
+
+class TestSerializers:
+    """Test cases for the registered encodings."""
+
+    def test_registry(self):
+        """Test the built-in encodings and registering a new one."""
+        assert available_encodings()[:5] == ["markdown", "csv", "tsv", "json", "kv"]
+
+        @register_serializer("test-first-column")
+        def first_column(headers, rows):
+            return "\n".join(row[0] for row in rows)
+
+        try:
+            assert serialize_table(HEADERS, ROWS, "test-first-column") == "Retail\nCorporate\nSME"
+        finally:
+            from modules import table_serializers
+            del table_serializers._SERIALIZERS["test-first-column"]
+
+    def test_encodings(self):
+        """Test the text of each encoding."""
+        assert serialize_table(HEADERS, ROWS, "csv") == (
+            "Segment,Loan Default Rate (%),Net Rate (%)\nRetail,-2,5\nCorporate,7,-1\nSME,3,"
+        )
+        assert serialize_table(HEADERS, ROWS, "tsv").splitlines()[1] == "Retail\t-2\t5"
+        assert json.loads(serialize_table(HEADERS, ROWS, "json"))[2] == {"Segment": "SME", "Loan Default Rate (%)": "3"}
+        assert serialize_table(HEADERS, ROWS, "kv").splitlines()[0] == (
+            "Segment: Retail; Loan Default Rate (%): -2; Net Rate (%): 5"
+        )
+        assert serialize_table(HEADERS, ROWS, MARKDOWN) == serialize_dataframe(pd.DataFrame(ROWS, columns=HEADERS))
+
+    def test_cells_with_separators(self):
+        """Test quoting in CSV, whitespace in TSV and repeated JSON keys."""
+        headers = ["Segment", "FY", "FY"]
+        rows = [["Retail, consumer", "1\t2", "line\nbreak"]]
+
+        assert serialize_table(headers, rows, "csv").splitlines()[1] == '"Retail, consumer",1\t2,"line'
+        assert serialize_table(headers, rows, "tsv").splitlines()[1] == "Retail, consumer\t1 2\tline break"
+        assert list(json.loads(serialize_table(headers, rows, "json"))[0]) == ["Segment", "FY", "FY (2)"]
+
+    def test_markdown_escapes_pipes(self):
+        """Test that pipes in headers and cells do not start new columns."""
+        text = serialize_table(["Segment | Region", "Rate (%)"], [["Retail|North", "1.5"]], MARKDOWN)
+        lines = text.splitlines()
+
+        assert lines[0].startswith("| Segment \\| Region ")
+        assert lines[2].startswith("| Retail\\|North ")
+        assert all(line.replace("\\|", "").count("|") == 3 for line in lines)
+
+    @pytest.mark.parametrize("encoding", ["markdown", "csv", "tsv", "json", "kv"])
+    def test_missing_values_never_render_as_nan(self, encoding):
+        """Test that None, NaN, NaT and pd.NA are written as empty cells."""
+        df = pd.DataFrame({
+            "Segment": ["Retail", None, "SME"],
+            "Rate (%)": [1.5, np.nan, -2.0],
+            "Date": [pd.Timestamp("2024-01-31"), pd.NaT, pd.NA],
+        })
+
+        text = serialize_dataframe(df, encoding).lower()
+
+        assert "nan" not in text and "nat" not in text and "<na>" not in text
+
+    def test_json_drops_missing_cells(self):
+        """Test that missing cells are left out of JSON records."""
+        df = pd.DataFrame({"Segment": ["Retail", "SME"], "Rate (%)": [1.5, np.nan]})
+
+        assert json.loads(serialize_dataframe(df, "json"))[1] == {"Segment": "SME"}
+
+    def test_key_value_drops_missing_cells(self):
+        """Test that missing cells are left out of key: value rows."""
+        df = pd.DataFrame({"Segment": ["Retail", "SME"], "Rate (%)": [1.5, np.nan]})
+
+        assert serialize_dataframe(df, "kv").splitlines()[1] == "Segment: SME"
+
+    def test_emphasis(self):
+        """Test that emphasized non-empty cells are marked in every encoding."""
+        emphasis = np.zeros((3, 3), dtype=bool)
+        emphasis[0, 1] = emphasis[2, 2] = True
+
+        for encoding in available_encodings():
+            text = serialize_table(HEADERS, ROWS, encoding, emphasis)
+            assert "**-2**" in text
+            assert text.count("**") == 2
+
+    def test_unknown_encoding_falls_back_to_markdown(self):
+        """Test that an unknown encoding name produces markdown."""
+        assert serialize_table(HEADERS, ROWS, "yaml") == serialize_table(HEADERS, ROWS, MARKDOWN)
+
+
+class TestTokenReport:
+    """Test cases for token estimates and the auto encoding."""
+
+    def test_estimate_tokens(self):
+        """Test that padding and long numbers cost tokens."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("Retail") == 1
+        assert estimate_tokens("1234567") == 3
+        assert estimate_tokens("| a |") < estimate_tokens("| a | b | c |")
+
+    def test_report_sorted_cheapest_first(self):
+        """Test that the report covers every encoding, cheapest first."""
+        report = token_report(HEADERS, ROWS)
+
+        assert sorted(name for name, _, _ in report) == sorted(available_encodings())
+        assert [tokens for _, tokens, _ in report] == sorted(tokens for _, tokens, _ in report)
+        assert dict((name, tokens) for name, tokens, _ in report)["markdown"] > report[0][1]
+
+    def test_auto_picks_cheapest(self):
+        """Test that "auto" returns the cheapest encoding's text."""
+        cheapest = cheapest_encoding(HEADERS, ROWS)
+
+        assert cheapest != MARKDOWN
+        assert serialize_table(HEADERS, ROWS, AUTO) == serialize_table(HEADERS, ROWS, cheapest)
+
+
+class TestEncodingConfig:
+    """Test cases for the per-model encoding setting."""
+
+    def test_per_model_encoding(self, mock_config):
+        """Test model overrides, the default and unknown names."""
+        from modules.config_manager import ConfigManager
+
+        ConfigManager._config['llm']['table_encoding'] = {
+            'default': 'csv',
+            'models': {'small-model': 'auto', 'odd-model': 'yaml'}
+        }
+
+        assert table_encoding_for('small-model') == AUTO
+        assert table_encoding_for('test-model') == 'csv'
+        assert table_encoding_for('odd-model') == MARKDOWN
+
+    def test_default_is_markdown(self, mock_config):
+        """Test that the encoding is markdown when nothing is configured."""
+        assert table_encoding_for('test-model') == MARKDOWN
+
+    def test_slide_encoded_tables(self, mock_config, sample_pptx_file):
+        """Test per-encoding table text on extracted slides."""
+        from pptx import Presentation
+        from modules.content_extractor import ContentExtractor
+
+        slide = ContentExtractor().extract_all_slides(Presentation(sample_pptx_file))[1]
+
+        assert slide.encoded_tables(MARKDOWN)[0] == slide.table_texts[0]
+        csv_text = slide.encoded_tables("csv")[0]
+        assert csv_text.splitlines()[1] == "Retail,**-2**,5"
+        assert slide.encoded_tables("csv")[0] is csv_text
+        assert slide.compact_tables[0]._frame is None
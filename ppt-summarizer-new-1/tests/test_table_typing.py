@@ -0,0 +1,80 @@
+"""
+Unit tests for table typing module.
+"""
+
+import numpy as np
+import pandas as pd
+
+from modules.table_typing import is_typed, normalize_table, parse_numbers
+
+
+class TestParseNumbers:
+    """Test cases for parse_numbers."""
+
+    def test_formats(self):
+        """Test the supported number formats and units."""
+        values = pd.Series(["12.5%", "$1,234.50", "(2.3)", "−4", "+1.4", "25 bp", "15bps", "(7)%", "-$5", "abc", ""])
+
+        numbers, missing, units = parse_numbers(values)
+
+        assert numbers.tolist()[:9] == [12.5, 1234.5, -2.3, -4.0, 1.4, 25.0, 15.0, -7.0, -5.0]
+        assert np.isnan(numbers.iloc[9]) and np.isnan(numbers.iloc[10])
+        assert units.tolist()[:9] == ["%", "$", "", "", "", "bp", "bp", "%", "$"]
+        assert missing.tolist() == [False] * 10 + [True]
+
+
+class TestNormalizeTable:
+    """Test cases for normalize_table."""
+
+    def test_typed_columns(self):
+        """Test float columns, categorical labels and units."""
+        table = pd.DataFrame(
+            [["Retail", "-2%", "$1,200", "n/a", "note"], ["Corporate", "7%", "$3,400", "25bp", "x"]],
+            columns=["Segment", "Default Rate", "Balance", "Spread", "Comment"]
+        )
+
+        typed = normalize_table(table)
+
+        assert is_typed(typed) and not is_typed(table)
+        assert list(typed.columns) == list(table.columns)
+        assert isinstance(typed["Segment"].dtype, pd.CategoricalDtype)
+        assert typed["Default Rate"].dtype == np.float64
+        assert typed["Default Rate"].tolist() == [-2.0, 7.0]
+        assert typed["Balance"].tolist() == [1200.0, 3400.0]
+        assert np.isnan(typed["Spread"].iloc[0]) and typed["Spread"].iloc[1] == 25.0
+        assert typed["Comment"].tolist() == ["note", "x"]
+        assert typed.attrs["units"] == {1: "%", 2: "$", 3: "bp"}
+        assert typed.attrs["label_column"] == 0
+        # Display strings are untouched
+        assert table["Default Rate"].tolist() == ["-2%", "7%"]
+
+    def test_partially_numeric_column_stays_text(self):
+        """Test that a column with any non-numeric cell is not typed."""
+        table = pd.DataFrame([["A", "1"], ["B", "see note"]], columns=["Segment", "Value"])
+
+        typed = normalize_table(table)
+
+        assert typed.attrs["units"] == {}
+        assert typed["Value"].tolist() == ["1", "see note"]
+
+    def test_duplicate_headers_and_empty_table(self):
+        """Test tables with repeated headers (merged cells) and no rows."""
+        table = pd.DataFrame([["A", "1", "2"]], columns=["Segment", "FY", "FY"])
+        typed = normalize_table(table)
+        assert typed.iloc[0, 1:].tolist() == [1.0, 2.0]
+
+        empty = normalize_table(pd.DataFrame(columns=["A", "B"]))
+        assert empty.attrs == {"units": {}, "label_column": None}
+
+    def test_extractor_stores_typed_tables(self, mock_config, sample_pptx_file):
+        """Test that extracted slides carry typed copies of their tables."""
+        from pptx import Presentation
+        from modules.content_extractor import ContentExtractor
+
+        slide = ContentExtractor().extract_all_slides(Presentation(sample_pptx_file))[1]
+
+        assert len(slide.typed_tables) == len(slide.tables) == 1
+        typed = slide.typed_tables[0]
+        assert typed["Loan Default Rate (%)"].tolist() == [-2.0, 7.0, 3.0]
+        assert isinstance(typed["Segment"].dtype, pd.CategoricalDtype)
+        assert slide.tables[0]["Net Rate (%)"].tolist() == ["5", "-1", "2"]
@@ -1,6 +1,6 @@
 import streamlit as st
 import logging
-from modules import file_handler, ppt_parser, llm_handler, ui_renderer, config_manager
+from modules import file_handler, ppt_parser, llm_handler, ui_renderer, config_manager, table_serializers
 
 # ---------------- Logging ----------------
 config = config_manager.load_config()
@@ -26,7 +26,8 @@ if file_handler.validate_upload(uploaded_file):
             model_name=config['llm']['model'],
             api_key=api_key,
             timeout=config['llm']['timeout'],
-            retries=config['llm']['retry_attempts']
+            retries=config['llm']['retry_attempts'],
+            table_encoding=table_serializers.table_encoding_for(config['llm'], config['llm']['model'])
         )
 
         prompt_template = open('prompt_template.txt', 'r').read()
@@ -7,6 +7,7 @@ import logging
 import pandas as pd
 from groq import Groq, AsyncGroq
 from groq import APIConnectionError, RateLimitError, APIStatusError, APITimeoutError
+from modules.table_serializers import MARKDOWN, serialize_dataframe
 #from app_logger import get_logger
 
 logger = logging.getLogger(__name__)
@@ -18,8 +19,10 @@ load_dotenv()
 
 class LLMSummarizer:
     def __init__(self, model_name: str, api_key_env_var: str,
-                 timeout: float = 20.0, max_retries: int = 3, async_mode: bool = False):
+                 timeout: float = 20.0, max_retries: int = 3, async_mode: bool = False,
+                 table_encoding: str = MARKDOWN):
         self.model_name = model_name
+        self.table_encoding = table_encoding
         self.api_key = os.getenv(api_key_env_var)
         if not self.api_key:
             raise ValueError(f"Environment variable {api_key_env_var} is not set.")
@@ -32,7 +35,7 @@ class LLMSummarizer:
             self.client = Groq(api_key=self.api_key, timeout=self.timeout)
 
     def _build_prompt(self, prompt_template: str, table_df: pd.DataFrame) -> str:
-        table_text = table_df.to_string(index=False)
+        table_text = serialize_dataframe(table_df, self.table_encoding)
         prompt = prompt_template.replace("{table_data}", table_text)
         return prompt
 
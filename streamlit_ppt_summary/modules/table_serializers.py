@@ -0,0 +1,132 @@
+# modules/table_serializers.py
+#
+# Prompt encodings for table data: markdown pipe tables, compact CSV/TSV,
+# JSON records and key: value rows. A copy of the registry in
+# ppt-summarizer-new-1/modules/table_serializers.py: both must blank missing
+# cells and escape pipes the same way, and their tests check the same cases.
+# This app has no tabulate, so its markdown is an unpadded pipe table like
+# the examples in prompt_template.txt.
+
+import csv
+import io
+import json
+import re
+import logging
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MARKDOWN = "markdown"
+AUTO = "auto"
+
+_SERIALIZERS = {}
+
+# Approximates BPE pre-tokenization: contractions, letter runs, up to three
+# digits, punctuation runs and whitespace runs each usually become one token
+_TOKEN_PIECE = re.compile(r"'(?:s|t|re|ve|m|ll|d)| ?[^\W\d_]+|\d{1,3}| ?[^\s\w]+|\s+(?!\S)|\s+")
+_LONG_WORD = 8
+
+
+def register_serializer(name):
+    def decorator(serializer):
+        _SERIALIZERS[name] = serializer
+        return serializer
+    return decorator
+
+
+def available_encodings():
+    return list(_SERIALIZERS)
+
+
+def _pipe_cell(cell):
+    # A bare "|" would start a new column
+    return " ".join(cell.split()).replace("|", "\\|")
+
+
+@register_serializer(MARKDOWN)
+def _markdown(headers, rows):
+    lines = ["| " + " | ".join(map(_pipe_cell, headers)) + " |", "|" + "|".join("---" for _ in headers) + "|"]
+    lines += ["| " + " | ".join(map(_pipe_cell, row)) + " |" for row in rows]
+    return "\n".join(lines)
+
+
+@register_serializer("csv")
+def _csv(headers, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(headers)
+    writer.writerows(rows)
+    return buffer.getvalue().rstrip("\n")
+
+
+@register_serializer("tsv")
+def _tsv(headers, rows):
+    return "\n".join("\t".join(" ".join(cell.split()) for cell in line) for line in [headers, *rows])
+
+
+@register_serializer("json")
+def _json(headers, rows):
+    keys, seen = [], {}
+    for header in headers:
+        seen[header] = seen.get(header, 0) + 1
+        keys.append(header if seen[header] == 1 else f"{header} ({seen[header]})")
+    records = [{key: cell for key, cell in zip(keys, row) if cell} for row in rows]
+    return json.dumps(records, ensure_ascii=False, separators=(",", ":"))
+
+
+@register_serializer("kv")
+def _key_value(headers, rows):
+    return "\n".join("; ".join(f"{h}: {cell}" for h, cell in zip(headers, row) if cell) for row in rows)
+
+
+def estimate_tokens(text):
+    count = 0
+    for piece in _TOKEN_PIECE.findall(text):
+        word = piece.strip()
+        count += 1 + len(word) // _LONG_WORD if word.isalpha() else 1
+    return count
+
+
+def _cell_text(cell):
+    # None, NaN, NaT and pd.NA are empty cells, not the text "nan"
+    if pd.api.types.is_scalar(cell) and pd.isna(cell):
+        return ""
+    return str(cell)
+
+
+def _prepare(table_df: pd.DataFrame):
+    headers = [str(col) for col in table_df.columns]
+    rows = [[_cell_text(cell) for cell in row] for row in table_df.itertuples(index=False)]
+    return headers, rows
+
+
+def token_report(table_df: pd.DataFrame):
+    """(encoding, estimated tokens, characters) for every encoding, cheapest first."""
+    headers, rows = _prepare(table_df)
+    report = []
+    for name, serializer in _SERIALIZERS.items():
+        text = serializer(headers, rows)
+        report.append((name, estimate_tokens(text), len(text)))
+    return sorted(report, key=lambda entry: (entry[1], entry[2]))
+
+
+def serialize_dataframe(table_df: pd.DataFrame, encoding: str = MARKDOWN) -> str:
+    """Encode a table for the prompt; "auto" picks the cheapest encoding."""
+    if encoding == AUTO:
+        encoding = token_report(table_df)[0][0]
+    serializer = _SERIALIZERS.get(encoding)
+    if serializer is None:
+        logger.warning(f"Unknown table encoding '{encoding}', using '{MARKDOWN}'")
+        serializer = _SERIALIZERS[MARKDOWN]
+    headers, rows = _prepare(table_df)
+    return serializer(headers, rows)
+
+
+def table_encoding_for(llm_config: dict, model_name: str) -> str:
+    """Encoding from config['llm']['table_encoding'] ({default, models}) for a model."""
+    settings = llm_config.get('table_encoding') or {}
+    encoding = (settings.get('models') or {}).get(model_name, settings.get('default', MARKDOWN))
+    if encoding != AUTO and encoding not in _SERIALIZERS:
+        logger.warning(f"Unknown table encoding '{encoding}' for {model_name}, using '{MARKDOWN}'")
+        return MARKDOWN
+    return encoding
@@ -0,0 +1,41 @@
+import pandas as pd
+import pytest
+
+from modules.llm_handler import LLMSummarizer
+from modules.table_serializers import serialize_dataframe
+
+
+@pytest.fixture
+def table_df():
+    return pd.DataFrame({"Segment": ["Retail", "SME|Corporate"], "Loan Default Rate (%)": [2.1, None]})
+
+
+@pytest.mark.parametrize("encoding", ["markdown", "csv", "tsv", "json", "kv", "auto"])
+def test_build_prompt_uses_table_encoding(monkeypatch, table_df, encoding):
+    monkeypatch.setenv("TEST_GROQ_API_KEY", "test-key")
+    summarizer = LLMSummarizer("test-model", "TEST_GROQ_API_KEY", table_encoding=encoding)
+
+    prompt = summarizer._build_prompt("Summarize:\n{table_data}\nEnd", table_df)
+
+    assert prompt == f"Summarize:\n{serialize_dataframe(table_df, encoding)}\nEnd"
+    assert "nan" not in prompt
+
+
+def test_build_prompt_default_is_escaped_markdown(monkeypatch, table_df):
+    monkeypatch.setenv("TEST_GROQ_API_KEY", "test-key")
+    summarizer = LLMSummarizer("test-model", "TEST_GROQ_API_KEY")
+
+    prompt = summarizer._build_prompt("{table_data}", table_df)
+
+    assert prompt.splitlines() == [
+        "| Segment | Loan Default Rate (%) |",
+        "|---|---|",
+        "| Retail | 2.1 |",
+        "| SME\\|Corporate |  |",
+    ]
+
+
+def test_missing_api_key(monkeypatch):
+    monkeypatch.delenv("TEST_GROQ_API_KEY", raising=False)
+    with pytest.raises(ValueError):
+        LLMSummarizer("test-model", "TEST_GROQ_API_KEY")
@@ -0,0 +1,79 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules import table_serializers
+from modules.table_serializers import available_encodings, serialize_dataframe, table_encoding_for, token_report
+
+
+def sample_table():
+    return pd.DataFrame({
+        "Segment": ["Retail", None, "SME"],
+        "Rate (%)": [1.5, np.nan, -2.0],
+    })
+
+
+def test_markdown():
+    assert serialize_dataframe(sample_table(), "markdown") == (
+        "| Segment | Rate (%) |\n"
+        "|---|---|\n"
+        "| Retail | 1.5 |\n"
+        "|  |  |\n"
+        "| SME | -2.0 |"
+    )
+
+
+def test_markdown_escapes_pipes():
+    table_df = pd.DataFrame({"Segment | Region": ["Retail|North"], "Rate (%)": ["1.5"]})
+    text = serialize_dataframe(table_df, "markdown")
+    assert text.splitlines()[0] == "| Segment \\| Region | Rate (%) |"
+    assert text.splitlines()[2] == "| Retail\\|North | 1.5 |"
+
+
+def test_csv():
+    assert serialize_dataframe(sample_table(), "csv") == "Segment,Rate (%)\nRetail,1.5\n,\nSME,-2.0"
+
+
+def test_tsv():
+    assert serialize_dataframe(sample_table(), "tsv") == "Segment\tRate (%)\nRetail\t1.5\n\t\nSME\t-2.0"
+
+
+def test_json_drops_empty_cells():
+    records = json.loads(serialize_dataframe(sample_table(), "json"))
+    assert records == [{"Segment": "Retail", "Rate (%)": "1.5"}, {}, {"Segment": "SME", "Rate (%)": "-2.0"}]
+
+
+def test_json_duplicate_headers():
+    table_df = pd.DataFrame([["1", "2"]], columns=["Q1", "Q1"])
+    assert json.loads(serialize_dataframe(table_df, "json")) == [{"Q1": "1", "Q1 (2)": "2"}]
+
+
+def test_key_value_drops_empty_cells():
+    assert serialize_dataframe(sample_table(), "kv") == "Segment: Retail; Rate (%): 1.5\n\nSegment: SME; Rate (%): -2.0"
+
+
+@pytest.mark.parametrize("encoding", ["markdown", "csv", "tsv", "json", "kv"])
+def test_missing_values_never_render_as_nan(encoding):
+    table_df = pd.DataFrame({"Segment": ["Retail", None, pd.NA], "Date": [pd.Timestamp("2024-03-31"), pd.NaT, pd.NaT]})
+    assert "nan" not in serialize_dataframe(table_df, encoding).lower()
+
+
+def test_auto_picks_cheapest_encoding():
+    report = token_report(sample_table())
+    assert sorted(name for name, _, _ in report) == sorted(available_encodings())
+    assert report == sorted(report, key=lambda entry: (entry[1], entry[2]))
+    assert serialize_dataframe(sample_table(), "auto") == serialize_dataframe(sample_table(), report[0][0])
+
+
+def test_unknown_encoding_falls_back_to_markdown():
+    assert serialize_dataframe(sample_table(), "yaml") == serialize_dataframe(sample_table(), "markdown")
+
+
+def test_table_encoding_for():
+    llm_config = {"table_encoding": {"default": "csv", "models": {"small-model": "auto", "odd-model": "yaml"}}}
+    assert table_encoding_for(llm_config, "big-model") == "csv"
+    assert table_encoding_for(llm_config, "small-model") == "auto"
+    assert table_encoding_for(llm_config, "odd-model") == table_serializers.MARKDOWN
+    assert table_encoding_for({}, "big-model") == table_serializers.MARKDOWN